@@ -124,7 +124,10 @@ def create_llm_backend(
             temperature=config.llm.temperature,
         )
     else:
-        return ClaudeCLIBackend(model=model)
+        return ClaudeCLIBackend(
+            model=model,
+            response_cache_size=config.llm.response_cache_size,
+        )
 
 
 @app.command()
@@ -239,6 +242,12 @@ def play(
 
     # Callbacks for output
     def on_game_output(response: GameResponse) -> None:
+        if response.error is not None:
+            console.print(f"[red]Game error:[/red] {response.error}")
+            if transcript_logger:
+                transcript_logger.log_error("game", response.error)
+            return
+
         if verbose:
             panel = Panel(
                 response.text,
@@ -533,6 +542,12 @@ def test(
 
         def on_game_output_ai(response: GameResponse) -> None:
             nonlocal final_location, final_output
+            if response.error is not None:
+                if transcript_logger:
+                    transcript_logger.log_error("game", response.error)
+                if verbose:
+                    console.print(f"[red]Game error:[/red] {response.error}")
+                return
             final_location = response.location
             final_output = response.text
             if transcript_logger:
@@ -770,6 +785,12 @@ def mud(
 
     # Callbacks for output
     def on_game_output(response: GameResponse) -> None:
+        if response.error is not None:
+            console.print(f"[red]Game error:[/red] {response.error}")
+            if transcript_logger:
+                transcript_logger.log_error("game", response.error)
+            return
+
         if verbose:
             panel = Panel(
                 response.text,
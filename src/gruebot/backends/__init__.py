@@ -1,6 +1,7 @@
 """Game interpreter backends."""
 
 from gruebot.backends.base import (
+    AsyncInterpreterProcess,
     InterpreterCommunicationError,
     InterpreterError,
     InterpreterProcess,
@@ -12,6 +13,7 @@ from gruebot.backends.protocol import GameBackend, GameInfo, GameResponse, GameS
 from gruebot.backends.zmachine import ZMachineBackend
 
 __all__ = [
+    "AsyncInterpreterProcess",
     "GameBackend",
     "GameInfo",
     "GameResponse",
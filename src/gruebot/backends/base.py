@@ -1,9 +1,14 @@
 """Base utilities for subprocess-based game backends."""
 
+import asyncio
+import codecs
+import os
 import select
+import selectors
 import subprocess
+import time
 from collections.abc import Iterator
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import IO
 
 
@@ -19,7 +24,7 @@ class InterpreterCommunicationError(InterpreterError):
     """Failed to communicate with the interpreter."""
 
 
-@dataclass
+@dataclass(slots=True)
 class InterpreterProcess:
     """Wrapper around a subprocess for game interpreters.
 
@@ -27,9 +32,17 @@ class InterpreterProcess:
     an interpreter process.
     """
 
-    process: subprocess.Popen[str]
-    _stdin: IO[str]
-    _stdout: IO[str]
+    process: subprocess.Popen[bytes]
+    _stdin: IO[bytes]
+    _stdout: IO[bytes]
+    # Text encoding used to encode writes and decode line reads
+    encoding: str = "utf-8"
+    # Read buffer reused across read_until() calls; holds bytes not yet returned
+    _rbuf: bytearray = field(default_factory=bytearray, repr=False)
+    # Offset in _rbuf already searched for the delimiter
+    _rbuf_off: int = field(default=0, repr=False)
+    # Readiness selector on stdout, created on the first timed read
+    _selector: selectors.BaseSelector | None = field(default=None, repr=False)
 
     @classmethod
     def start(
@@ -56,10 +69,9 @@ class InterpreterProcess:
                 cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                encoding=encoding,
-                bufsize=1,  # Line buffered
+                # Nothing reads stderr; a pipe would eventually fill and stall the interpreter
+                stderr=subprocess.DEVNULL,
+                bufsize=-1,  # Block buffered binary pipes; text is encoded/decoded here
                 cwd=cwd,
             )
         except FileNotFoundError as e:
@@ -71,7 +83,12 @@ class InterpreterProcess:
             process.kill()
             raise InterpreterStartError("Failed to open stdin/stdout pipes")
 
-        return cls(process=process, _stdin=process.stdin, _stdout=process.stdout)
+        return cls(
+            process=process,
+            _stdin=process.stdin,
+            _stdout=process.stdout,
+            encoding=encoding,
+        )
 
     def write(self, text: str) -> None:
         """Write text to the interpreter's stdin.
@@ -79,11 +96,22 @@ class InterpreterProcess:
         Args:
             text: Text to write.
 
+        Raises:
+            InterpreterCommunicationError: If write fails.
+        """
+        self.write_bytes(text.encode(self.encoding))
+
+    def write_bytes(self, data: bytes) -> None:
+        """Write already-encoded bytes to the interpreter's stdin.
+
+        Args:
+            data: Bytes to write.
+
         Raises:
             InterpreterCommunicationError: If write fails.
         """
         try:
-            self._stdin.write(text)
+            self._stdin.write(data)
             self._stdin.flush()
         except (BrokenPipeError, OSError) as e:
             raise InterpreterCommunicationError(f"Failed to write to interpreter: {e}") from e
@@ -106,21 +134,139 @@ class InterpreterProcess:
             InterpreterCommunicationError: If read fails.
         """
         try:
-            return self._stdout.readline()
+            return self._stdout.readline().decode(self.encoding, errors="replace")
         except OSError as e:
             raise InterpreterCommunicationError(f"Failed to read from interpreter: {e}") from e
 
-    def read_lines(self) -> Iterator[str]:
-        """Read lines from stdout until empty line or EOF.
+    def read_until(
+        self,
+        delim: bytes,
+        chunk_size: int = 65536,
+        timeout: float | None = None,
+    ) -> bytes | None:
+        """Read raw bytes from stdout up to a delimiter.
+
+        Reads the pipe in large chunks rather than line by line, so a
+        multi-kilobyte message costs a handful of read syscalls.
+
+        Args:
+            delim: Delimiter marking the end of a message.
+            chunk_size: Maximum bytes to request per read.
+            timeout: Overall seconds to wait for the delimiter, or None to
+                block until it arrives.
+
+        Returns:
+            Bytes up to (not including) the delimiter. If EOF is reached
+            first, whatever was buffered, or None if nothing was.
+
+        Raises:
+            InterpreterCommunicationError: If read fails or times out.
+        """
+        buf = self._rbuf
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            fd = self._stdout.fileno()
+            while True:
+                idx = buf.find(delim, self._rbuf_off)
+                if idx != -1:
+                    with memoryview(buf) as view:
+                        message = bytes(view[:idx])
+                    # Compact in place so the buffer's storage is reused next turn
+                    del buf[: idx + len(delim)]
+                    self._rbuf_off = 0
+                    return message
+                # Only the tail could still hold the start of a delimiter
+                self._rbuf_off = max(0, len(buf) - len(delim) + 1)
+                if deadline is not None:
+                    self._wait_readable(deadline - time.monotonic())
+                chunk = os.read(fd, chunk_size)
+                if not chunk:
+                    message = bytes(buf)
+                    buf.clear()
+                    self._rbuf_off = 0
+                    return message or None
+                buf += chunk
+        except OSError as e:
+            raise InterpreterCommunicationError(f"Failed to read from interpreter: {e}") from e
+
+    def _wait_readable(self, timeout: float) -> None:
+        """Wait until stdout has data to read.
+
+        Args:
+            timeout: Seconds to wait; non-positive values only poll.
+
+        Raises:
+            InterpreterCommunicationError: If no data arrives in time.
+        """
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._stdout, selectors.EVENT_READ)
+        if not self._selector.select(max(timeout, 0.0)):
+            raise InterpreterCommunicationError("Timed out waiting for interpreter output")
+
+    def _close_selector(self) -> None:
+        """Release the stdout selector, if one was created."""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
+    def iter_chunks(self, size: int = 65536) -> Iterator[str]:
+        """Read stdout in raw chunks until EOF.
+
+        Bytes already buffered by read_until() are yielded first. Decoding
+        is incremental, so multi-byte characters split across reads are
+        kept intact.
+
+        Args:
+            size: Maximum bytes to request per read.
 
         Yields:
-            Lines from the interpreter.
+            Decoded text chunks.
+
+        Raises:
+            InterpreterCommunicationError: If read fails.
         """
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        data = bytes(self._rbuf)
+        self._rbuf.clear()
+        self._rbuf_off = 0
+
+        try:
+            fd = self._stdout.fileno()
+        except OSError as e:
+            raise InterpreterCommunicationError(f"Failed to read from interpreter: {e}") from e
+
         while True:
-            line = self.readline()
-            if not line:
+            if data:
+                text = decoder.decode(data)
+                if text:
+                    yield text
+            try:
+                data = os.read(fd, size)
+            except OSError as e:
+                raise InterpreterCommunicationError(f"Failed to read from interpreter: {e}") from e
+            if not data:
                 break
-            yield line
+
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def read_lines(self) -> Iterator[str]:
+        """Read lines from stdout until EOF.
+
+        Yields:
+            Lines from the interpreter (including newline, except possibly
+            the last).
+        """
+        partial = ""
+        for chunk in self.iter_chunks():
+            lines = (partial + chunk).split("\n")
+            partial = lines.pop()
+            for line in lines:
+                yield line + "\n"
+        if partial:
+            yield partial
 
     def read_until_prompt(
         self,
@@ -142,8 +288,6 @@ class InterpreterProcess:
         Returns:
             All output up to and including the prompt line.
         """
-        import os
-
         # Try to get file descriptor for select-based reading
         try:
             fd = self._stdout.fileno()
@@ -221,6 +365,7 @@ class InterpreterProcess:
         Args:
             timeout: Seconds to wait for graceful termination.
         """
+        self._close_selector()
         if not self.is_alive:
             return
 
@@ -233,6 +378,124 @@ class InterpreterProcess:
 
     def kill(self) -> None:
         """Forcefully kill the interpreter process."""
+        self._close_selector()
         if self.is_alive:
             self.process.kill()
             self.process.wait()
+
+
+@dataclass(slots=True)
+class AsyncInterpreterProcess:
+    """Asyncio counterpart of InterpreterProcess.
+
+    Many interpreters can share one event loop (epoll/kqueue under the
+    hood) instead of each holding a thread blocked on a pipe read.
+    """
+
+    process: asyncio.subprocess.Process
+    _stdin: asyncio.StreamWriter
+    _stdout: asyncio.StreamReader
+
+    @classmethod
+    async def start(
+        cls,
+        cmd: list[str],
+        cwd: str | None = None,
+        limit: int = 2**20,
+    ) -> "AsyncInterpreterProcess":
+        """Start an interpreter subprocess on the running event loop.
+
+        Args:
+            cmd: Command and arguments to run.
+            cwd: Working directory for the process.
+            limit: Largest message read_until() can buffer, in bytes.
+
+        Returns:
+            AsyncInterpreterProcess wrapper.
+
+        Raises:
+            InterpreterStartError: If the process fails to start.
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                cwd=cwd,
+                limit=limit,
+            )
+        except FileNotFoundError as e:
+            raise InterpreterStartError(f"Interpreter not found: {cmd[0]}") from e
+        except OSError as e:
+            raise InterpreterStartError(f"Failed to start interpreter: {e}") from e
+
+        if process.stdin is None or process.stdout is None:
+            process.kill()
+            raise InterpreterStartError("Failed to open stdin/stdout pipes")
+
+        return cls(process=process, _stdin=process.stdin, _stdout=process.stdout)
+
+    async def write_bytes(self, data: bytes) -> None:
+        """Write already-encoded bytes to the interpreter's stdin.
+
+        Args:
+            data: Bytes to write.
+
+        Raises:
+            InterpreterCommunicationError: If write fails.
+        """
+        try:
+            self._stdin.write(data)
+            await self._stdin.drain()
+        except (ConnectionError, OSError) as e:
+            raise InterpreterCommunicationError(f"Failed to write to interpreter: {e}") from e
+
+    async def read_until(self, delim: bytes, timeout: float | None = None) -> bytes | None:
+        """Read raw bytes from stdout up to a delimiter.
+
+        Args:
+            delim: Delimiter marking the end of a message.
+            timeout: Overall seconds to wait for the delimiter, or None to
+                wait until it arrives.
+
+        Returns:
+            Bytes up to (not including) the delimiter. If EOF is reached
+            first, whatever was buffered, or None if nothing was.
+
+        Raises:
+            InterpreterCommunicationError: If read fails or times out.
+        """
+        try:
+            data = await asyncio.wait_for(self._stdout.readuntil(delim), timeout)
+        except asyncio.IncompleteReadError as e:
+            return e.partial or None
+        except asyncio.LimitOverrunError as e:
+            raise InterpreterCommunicationError(f"Interpreter message too large: {e}") from e
+        except TimeoutError as e:
+            # Unconsumed bytes stay in the reader for the next call
+            raise InterpreterCommunicationError("Timed out waiting for interpreter output") from e
+        except OSError as e:
+            raise InterpreterCommunicationError(f"Failed to read from interpreter: {e}") from e
+        return data[: -len(delim)]
+
+    @property
+    def is_alive(self) -> bool:
+        """Check if the process is still running."""
+        return self.process.returncode is None
+
+    async def terminate(self, timeout: float = 5.0) -> None:
+        """Terminate the interpreter process.
+
+        Args:
+            timeout: Seconds to wait for graceful termination.
+        """
+        if not self.is_alive:
+            return
+
+        self.process.terminate()
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout)
+        except TimeoutError:
+            self.process.kill()
+            await self.process.wait()
@@ -1,16 +1,37 @@
 """Glulx backend using glulxe interpreter with remglk JSON I/O."""
 
+import io
 import json
 import re
 from pathlib import Path
 from typing import Any, cast
 
 from gruebot.backends.base import (
+    AsyncInterpreterProcess,
     InterpreterCommunicationError,
     InterpreterProcess,
 )
 from gruebot.backends.protocol import GameInfo, GameResponse, GameState
 
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install gruebot[fast])
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(msg: Any) -> bytes:
+    """Serialize a remglk message, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(msg)
+    return json.dumps(msg).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a remglk message, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class GlulxBackend:
     """Glulx interpreter backend using glulxe with remglk.
@@ -19,11 +40,32 @@ class GlulxBackend:
     making it easier to programmatically control Glulx games.
     """
 
+    # remglk line input message; gen, window and the JSON-encoded value vary per call
+    _LINE_MSG = b'{"type":"line","gen":%d,"window":%d,"value":%s}\n\n'
+
     # Patterns for detecting game state
     _GAME_OVER_PATTERNS = [
         r"\*\*\*\s*(?:You have died|The End|GAME OVER)\s*\*\*\*",
         r"(?:Would you like to|Do you want to)\s+(?:RESTART|RESTORE|QUIT)",
     ]
+    # All game-over patterns as one alternation, so each turn scans the text once
+    _GAME_OVER_RE = re.compile("|".join(f"(?:{p})" for p in _GAME_OVER_PATTERNS), re.IGNORECASE)
+    # Lowercase words that any non-"***" game-over prompt must contain
+    _GAME_OVER_KEYWORDS = ("restart", "restore", "quit")
+    # Two or more consecutive blank lines, which _clean_text squeezes to one
+    _BLANK_RUN_RE = re.compile(r"\n(?:[^\S\n]*\n){2,}")
+    # Separators between the location and score/turn counters in the status line
+    _LOCATION_SPLIT_RE = re.compile(r"\s{2,}|Score:|Turns:|Moves:")
+    # Save confirmations, matched as whole words so "booked" or "unsaved" don't count
+    _SAVE_CONFIRM_RE = re.compile(r"\b(?:saved|ok)\b", re.IGNORECASE)
+    _SAVED_RE = re.compile(r"\bsaved\b", re.IGNORECASE)
+    # Leading characters of the intro searched for the game's credits
+    _HEADER_CHARS = 2048
+    # Author credit patterns, in priority order (an explicit byline beats a copyright holder)
+    _AUTHOR_PATTERNS = (
+        re.compile(r"(?:by|written by|author[:\s]+)\s*([A-Z][a-zA-Z \.]+)", re.IGNORECASE),
+        re.compile(r"(?:Copyright|©|\(c\))\s*\d*\s*(?:by\s+)?([A-Z][a-zA-Z \.]+)", re.IGNORECASE),
+    )
 
     def __init__(
         self,
@@ -31,6 +73,7 @@ class GlulxBackend:
         save_directory: Path | None = None,
         screen_width: int = 80,
         screen_height: int = 50,
+        read_timeout: float | None = 30.0,
     ) -> None:
         """Initialize the Glulx backend.
 
@@ -39,17 +82,21 @@ class GlulxBackend:
             save_directory: Directory for save files.
             screen_width: Virtual screen width for the interpreter.
             screen_height: Virtual screen height for the interpreter.
+            read_timeout: Seconds to wait for each interpreter update before
+                giving up, or None to wait indefinitely.
         """
         self.glulxe_path = glulxe_path
         self.save_directory = save_directory or Path("./saves")
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.read_timeout = read_timeout
         self._process: InterpreterProcess | None = None
+        self._async_process: AsyncInterpreterProcess | None = None
         self._game_info: GameInfo | None = None
         self._current_location: str | None = None
         self._gen: int = 0  # Generation counter for remglk protocol
         self._input_window: int | None = None  # Window ID expecting input
-        self._windows: dict[int, dict[str, Any]] = {}  # Cached window info
+        self._window_types: dict[int, str | None] = {}  # Cached window types by ID
 
     def start(self, game_path: str) -> GameResponse:
         """Start a Glulx game.
@@ -64,57 +111,38 @@ class GlulxBackend:
             InterpreterStartError: If glulxe fails to start.
             FileNotFoundError: If the game file doesn't exist.
         """
-        game_path_obj = Path(game_path)
-        if not game_path_obj.exists():
-            raise FileNotFoundError(f"Game file not found: {game_path}")
-
-        # Convert to absolute path since we run glulxe from save_directory
-        game_path_abs = game_path_obj.resolve()
-
-        # Ensure save directory exists
-        self.save_directory.mkdir(parents=True, exist_ok=True)
-
-        # Start glulxe with fixed metrics (skip init handshake)
-        # -fm: fixed metrics mode
-        # -width: screen width
-        # -height: screen height
-        self._process = InterpreterProcess.start(
-            cmd=[
-                self.glulxe_path,
-                "-fm",
-                "-width",
-                str(self.screen_width),
-                "-height",
-                str(self.screen_height),
-                str(game_path_abs),
-            ],
-            cwd=str(self.save_directory),
-        )
+        cmd, game_path_obj = self._prepare_start(game_path)
+        self._process = InterpreterProcess.start(cmd=cmd, cwd=str(self.save_directory))
 
         # Read initial game output
         update = self._read_update()
+        return self._intro_response(update, game_path_obj)
 
-        # Extract text from the update
-        intro_text = self._extract_text(update)
+    async def start_async(self, game_path: str) -> GameResponse:
+        """Start a Glulx game on the running event loop.
 
-        # Extract game info from intro
-        self._game_info = GameInfo(
-            title=self._extract_title(intro_text),
-            author=self._extract_author(intro_text),
-            format="glulx",
-            file_path=str(game_path_obj.absolute()),
-        )
+        Lets one event loop drive many interpreters (e.g. batch
+        evaluation) without a blocked thread per game.
 
-        # Try to extract initial location from grid window
-        self._current_location = self._extract_location_from_update(update)
+        Args:
+            game_path: Path to the game file (.ulx, .gblorb, .glb).
 
-        return GameResponse(
-            text=intro_text,
-            location=self._current_location,
-            state=self._detect_game_state_from_update(update, intro_text),
-            raw_output=update,
+        Returns:
+            GameResponse with the game's introduction.
+
+        Raises:
+            InterpreterStartError: If glulxe fails to start.
+            FileNotFoundError: If the game file doesn't exist.
+        """
+        cmd, game_path_obj = self._prepare_start(game_path)
+        self._async_process = await AsyncInterpreterProcess.start(
+            cmd=cmd, cwd=str(self.save_directory)
         )
 
+        # Read initial game output
+        update = await self._read_update_async()
+        return self._intro_response(update, game_path_obj)
+
     def send_command(self, command: str) -> GameResponse:
         """Send a command to the game.
 
@@ -134,38 +162,36 @@ class GlulxBackend:
         if self._input_window is None:
             raise RuntimeError("Game is not waiting for input")
 
-        # Send line input as JSON
-        input_msg = {
-            "type": "line",
-            "gen": self._gen,
-            "window": self._input_window,
-            "value": command,
-        }
-        self._send_json(input_msg)
+        self._send_line(command)
 
         # Read the response
         update = self._read_update()
+        return self._command_response(update, command)
 
-        # Extract text from the update
-        response_text = self._extract_text(update)
+    async def send_command_async(self, command: str) -> GameResponse:
+        """Send a command to a game started with start_async().
 
-        # Strip echoed command from beginning of response (common in IF games)
-        response_text = self._strip_command_echo(response_text, command)
+        Args:
+            command: The command to send.
 
-        # Update location from grid window
-        new_location = self._extract_location_from_update(update)
-        if new_location:
-            self._current_location = new_location
+        Returns:
+            GameResponse with the game's output.
 
-        # Determine game state
-        state = self._detect_game_state_from_update(update, response_text)
+        Raises:
+            InterpreterCommunicationError: If communication fails.
+            RuntimeError: If no game is running.
+        """
+        if self._async_process is None or not self._async_process.is_alive:
+            raise RuntimeError("No game is currently running")
 
-        return GameResponse(
-            text=response_text,
-            location=self._current_location,
-            state=state,
-            raw_output=update,
-        )
+        if self._input_window is None:
+            raise RuntimeError("Game is not waiting for input")
+
+        await self._async_process.write_bytes(self._line_message(command))
+
+        # Read the response
+        update = await self._read_update_async()
+        return self._command_response(update, command)
 
     def save(self, slot: str = "default") -> bool:
         """Save the current game state.
@@ -182,14 +208,7 @@ class GlulxBackend:
         if self._input_window is None:
             return False
 
-        # Send save command
-        input_msg = {
-            "type": "line",
-            "gen": self._gen,
-            "window": self._input_window,
-            "value": "save",
-        }
-        self._send_json(input_msg)
+        self._send_line("save")
 
         # Read prompt for filename (will be a fileref_prompt specialinput)
         update = self._read_update()
@@ -212,11 +231,11 @@ class GlulxBackend:
             # Read confirmation
             update = self._read_update()
             response_text = self._extract_text(update)
-            return "saved" in response_text.lower() or "ok" in response_text.lower()
+            return self._SAVE_CONFIRM_RE.search(response_text) is not None
 
         # Some games might handle save differently
         response_text = self._extract_text(update)
-        return "saved" in response_text.lower()
+        return self._SAVED_RE.search(response_text) is not None
 
     def restore(self, slot: str = "default") -> GameResponse:
         """Restore a saved game state.
@@ -241,14 +260,7 @@ class GlulxBackend:
                 state=GameState.ERROR,
             )
 
-        # Send restore command
-        input_msg = {
-            "type": "line",
-            "gen": self._gen,
-            "window": self._input_window,
-            "value": "restore",
-        }
-        self._send_json(input_msg)
+        self._send_line("restore")
 
         # Read prompt for filename
         update = self._read_update()
@@ -270,10 +282,8 @@ class GlulxBackend:
             # Read response after restore
             update = self._read_update()
 
-        response_text = self._extract_text(update)
-
-        # Update location
-        self._current_location = self._extract_location_from_update(update)
+        # Update text and location
+        response_text, self._current_location = self._scan_content(update)
 
         return GameResponse(
             text=response_text,
@@ -287,26 +297,14 @@ class GlulxBackend:
         if self._process is not None:
             if self._process.is_alive and self._input_window is not None:
                 try:
-                    input_msg = {
-                        "type": "line",
-                        "gen": self._gen,
-                        "window": self._input_window,
-                        "value": "quit",
-                    }
-                    self._send_json(input_msg)
+                    self._send_line("quit")
 
                     # Try to read and confirm quit if needed
                     try:
                         update = self._read_update()
                         if "input" in update:
                             # Game might ask for confirmation
-                            confirm_msg = {
-                                "type": "line",
-                                "gen": self._gen,
-                                "window": self._input_window,
-                                "value": "yes",
-                            }
-                            self._send_json(confirm_msg)
+                            self._send_line("yes")
                     except InterpreterCommunicationError:
                         pass  # Game may have already exited
                 except InterpreterCommunicationError:
@@ -315,9 +313,29 @@ class GlulxBackend:
             self._process.terminate()
             self._process = None
 
+    async def quit_async(self) -> None:
+        """Quit a game started with start_async() and clean up."""
+        if self._async_process is not None:
+            if self._async_process.is_alive and self._input_window is not None:
+                try:
+                    await self._async_process.write_bytes(self._line_message("quit"))
+
+                    # Try to read and confirm quit if needed
+                    update = await self._read_update_async()
+                    if "input" in update and self._input_window is not None:
+                        # Game might ask for confirmation
+                        await self._async_process.write_bytes(self._line_message("yes"))
+                except InterpreterCommunicationError:
+                    pass  # Game may have already exited
+
+            await self._async_process.terminate()
+            self._async_process = None
+
     @property
     def is_running(self) -> bool:
         """Check if a game is currently running."""
+        if self._async_process is not None:
+            return self._async_process.is_alive
         return self._process is not None and self._process.is_alive
 
     @property
@@ -334,9 +352,43 @@ class GlulxBackend:
         if self._process is None:
             raise InterpreterCommunicationError("No interpreter process")
 
-        json_str = json.dumps(msg)
         # remglk expects each message followed by a blank line
-        self._process.write(json_str + "\n\n")
+        self._process.write_bytes(_dumps(msg) + b"\n\n")
+
+    def _send_line(self, value: str) -> None:
+        """Send line input to the window currently awaiting it.
+
+        Args:
+            value: Line of input to send.
+
+        Raises:
+            InterpreterCommunicationError: If no window is awaiting line input.
+        """
+        if self._process is None:
+            raise InterpreterCommunicationError("No interpreter process")
+
+        self._process.write_bytes(self._line_message(value))
+
+    def _line_message(self, value: str) -> bytes:
+        """Encode a remglk line input message for the current input window.
+
+        Only the generation, window, and value vary between line messages,
+        so they are formatted into a fixed template rather than serialized
+        from a dict.
+
+        Args:
+            value: Line of input to send.
+
+        Returns:
+            Encoded message, including the terminating blank line.
+
+        Raises:
+            InterpreterCommunicationError: If no window is awaiting line input.
+        """
+        if self._input_window is None:
+            raise InterpreterCommunicationError("No window is awaiting line input")
+
+        return self._LINE_MSG % (self._gen, self._input_window, _dumps(value))
 
     def _read_update(self) -> dict[str, Any]:
         """Read a JSON update from the interpreter.
@@ -350,37 +402,69 @@ class GlulxBackend:
         if self._process is None:
             raise InterpreterCommunicationError("No interpreter process")
 
-        # Read until we get a complete JSON object (ends with blank line)
-        lines: list[str] = []
-        while True:
-            line = self._process.readline()
-            if not line:
-                break
-            if line.strip() == "":
-                if lines:  # Got content, now got blank line = end of message
-                    break
-                continue  # Skip leading blank lines
-            lines.append(line)
+        # remglk terminates each JSON message with a blank line
+        data = self._process.read_until(b"\n\n", timeout=self.read_timeout)
+        while data is not None and not data.strip():
+            # Skip leading blank lines
+            data = self._process.read_until(b"\n\n", timeout=self.read_timeout)
 
-        if not lines:
-            raise InterpreterCommunicationError("No output from interpreter")
+        return self._apply_update(data)
+
+    async def _read_update_async(self) -> dict[str, Any]:
+        """Read a JSON update from an interpreter started with start_async().
+
+        Returns:
+            Parsed JSON update.
+
+        Raises:
+            InterpreterCommunicationError: If reading or parsing fails.
+        """
+        if self._async_process is None:
+            raise InterpreterCommunicationError("No interpreter process")
+
+        # remglk terminates each JSON message with a blank line
+        data = await self._async_process.read_until(b"\n\n", timeout=self.read_timeout)
+        while data is not None and not data.strip():
+            # Skip leading blank lines
+            data = await self._async_process.read_until(b"\n\n", timeout=self.read_timeout)
+
+        return self._apply_update(data)
+
+    def _apply_update(self, data: bytes | None) -> dict[str, Any]:
+        """Parse a raw remglk message and track the protocol state it carries.
+
+        Args:
+            data: Message bytes without the terminating blank line, or None
+                if the interpreter closed its output.
+
+        Returns:
+            Parsed JSON update.
 
-        json_str = "".join(lines)
+        Raises:
+            InterpreterCommunicationError: If there is no message or it fails to parse.
+        """
+        if data is None:
+            raise InterpreterCommunicationError("No output from interpreter")
 
         try:
-            update = json.loads(json_str)
-        except json.JSONDecodeError as e:
+            update = _loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise InterpreterCommunicationError(f"Failed to parse JSON: {e}") from e
 
+        # Error messages carry no state; keep the current generation and input window
+        if update.get("type") == "error":
+            return cast(dict[str, Any], update)
+
         # Update generation counter and input window
         if "gen" in update:
             self._gen = update["gen"]
 
-        # Cache window info (windows array only sent when they change)
+        # Cache window types (windows array only sent when they change)
         for window in update.get("windows", []):
             window_id = window.get("id")
             if window_id is not None:
-                self._windows[window_id] = window
+                self._window_types[window_id] = window.get("type")
 
         # Find window expecting input
         self._input_window = None
@@ -391,6 +475,111 @@ class GlulxBackend:
 
         return cast(dict[str, Any], update)
 
+    def _prepare_start(self, game_path: str) -> tuple[list[str], Path]:
+        """Validate the game file and build the glulxe command line.
+
+        Args:
+            game_path: Path to the game file.
+
+        Returns:
+            Tuple of (command line, game path as given).
+
+        Raises:
+            FileNotFoundError: If the game file doesn't exist.
+        """
+        game_path_obj = Path(game_path)
+        if not game_path_obj.exists():
+            raise FileNotFoundError(f"Game file not found: {game_path}")
+
+        # Convert to absolute path since we run glulxe from save_directory
+        game_path_abs = game_path_obj.resolve()
+
+        # Ensure save directory exists
+        self.save_directory.mkdir(parents=True, exist_ok=True)
+
+        # Start glulxe with fixed metrics (skip init handshake)
+        # -fm: fixed metrics mode
+        # -width: screen width
+        # -height: screen height
+        cmd = [
+            self.glulxe_path,
+            "-fm",
+            "-width",
+            str(self.screen_width),
+            "-height",
+            str(self.screen_height),
+            str(game_path_abs),
+        ]
+        return cmd, game_path_obj
+
+    def _intro_response(self, update: dict[str, Any], game_path: Path) -> GameResponse:
+        """Build the start response and game info from the first update.
+
+        Args:
+            update: First parsed JSON update from the interpreter.
+            game_path: Path to the game file.
+
+        Returns:
+            GameResponse with the game's introduction.
+        """
+        # Extract text and initial location (from grid window) in one pass
+        intro_text, initial_location = self._scan_content(update)
+
+        # Extract game info from intro
+        self._game_info = GameInfo(
+            title=self._extract_title(intro_text),
+            author=self._extract_author(intro_text),
+            format="glulx",
+            file_path=str(game_path.absolute()),
+        )
+
+        self._current_location = initial_location
+
+        return GameResponse(
+            text=intro_text,
+            location=self._current_location,
+            state=self._detect_game_state_from_update(update, intro_text),
+            raw_output=update,
+        )
+
+    def _command_response(self, update: dict[str, Any], command: str) -> GameResponse:
+        """Build the response to a command from the interpreter's update.
+
+        Args:
+            update: Parsed JSON update received after the command.
+            command: The command that was sent.
+
+        Returns:
+            GameResponse with the game's output.
+        """
+        # remglk rejected the input; the game is still waiting for a command
+        if update.get("type") == "error":
+            return GameResponse(
+                text="",
+                location=self._current_location,
+                raw_output=update,
+                error=str(update.get("message") or "Interpreter rejected input"),
+            )
+
+        # Extract text and location (from grid window) in one pass
+        response_text, new_location = self._scan_content(update)
+
+        # Strip echoed command from beginning of response (common in IF games)
+        response_text = self._strip_command_echo(response_text, command)
+
+        if new_location:
+            self._current_location = new_location
+
+        # Determine game state
+        state = self._detect_game_state_from_update(update, response_text)
+
+        return GameResponse(
+            text=response_text,
+            location=self._current_location,
+            state=state,
+            raw_output=update,
+        )
+
     def _extract_text(self, update: dict[str, Any]) -> str:
         """Extract readable text from a remglk update.
 
@@ -400,67 +589,79 @@ class GlulxBackend:
         Returns:
             Extracted text content.
         """
-        text_parts = []
+        return self._scan_content(update)[0]
+
+    def _scan_content(self, update: dict[str, Any]) -> tuple[str, str | None]:
+        """Extract story text and status-line location in one pass.
+
+        Only ``content`` entries for buffer and grid windows are visited;
+        everything else in the update is ignored.
+
+        Args:
+            update: Parsed JSON update.
+
+        Returns:
+            Tuple of (cleaned buffer text, location or None).
+        """
+        buf = io.StringIO()
+        write = buf.write
+        location: str | None = None
+        window_types = self._window_type_map(update)
 
         # Process content for each window
         for content in update.get("content", []):
-            window_id = content.get("id")
-            window_info = self._find_window(update, window_id)
-
-            if window_info and window_info.get("type") == "buffer":
+            window_type = window_types.get(content.get("id"))
+            if window_type == "buffer":
                 # Buffer window - story text
-                for item in content.get("text", []):
-                    if isinstance(item, dict):
+                items = content.get("text")
+                if not items:
+                    continue
+                for item in items:
+                    item_type = type(item)
+                    if item_type is dict:
                         if "content" in item:
                             # Text with styling
                             for segment in item["content"]:
-                                if isinstance(segment, str):
-                                    text_parts.append(segment)
-                                elif isinstance(segment, dict):
-                                    text_parts.append(segment.get("text", ""))
+                                segment_type = type(segment)
+                                if segment_type is str:
+                                    write(segment)
+                                elif segment_type is dict and "text" in segment:
+                                    write(segment["text"])
                         elif "text" in item:
-                            text_parts.append(item["text"])
-                    elif isinstance(item, str):
-                        text_parts.append(item)
+                            write(item["text"])
+                    elif item_type is str:
+                        write(item)
                 # Add newline after each text item
-                if content.get("text"):
-                    text_parts.append("\n")
+                write("\n")
 
-            elif window_info and window_info.get("type") == "grid":
-                # Grid window - status bar (skip for main text)
-                pass
+            elif window_type == "grid" and location is None:
+                # Grid window - status bar with location
+                location = self._parse_status_line(content)
 
         # Clean up the text
-        text = "".join(text_parts)
-        text = self._clean_text(text)
-        return text
+        text = self._clean_text(buf.getvalue())
+        return text, location
 
-    def _find_window(self, update: dict[str, Any], window_id: int | None) -> dict[str, Any] | None:
-        """Find window info by ID.
+    def _window_type_map(self, update: dict[str, Any]) -> dict[int, str | None]:
+        """Build a window ID to window type lookup for an update.
 
-        Uses cached window info since remglk only sends windows array
-        when windows change. Falls back to checking the update directly.
+        Uses cached window types since remglk only sends the windows array
+        when windows change. Windows in the update itself fill any gaps
+        (for the first call or tests).
 
         Args:
             update: Parsed JSON update.
-            window_id: Window ID to find.
 
         Returns:
-            Window info dict or None.
+            Mapping of window ID to window type.
         """
-        if window_id is None:
-            return None
+        windows = update.get("windows")
+        if not windows:
+            return self._window_types
 
-        # Check cache first
-        if window_id in self._windows:
-            return self._windows[window_id]
-
-        # Fallback: check the current update (for first call or tests)
-        for window in update.get("windows", []):
-            if window.get("id") == window_id:
-                return cast(dict[str, Any], window)
-
-        return None
+        window_types = {window.get("id"): window.get("type") for window in windows}
+        window_types.update(self._window_types)
+        return window_types
 
     def _extract_location_from_update(self, update: dict[str, Any]) -> str | None:
         """Extract location from grid window (status bar).
@@ -471,32 +672,45 @@ class GlulxBackend:
         Returns:
             Location name if found.
         """
+        window_types = self._window_type_map(update)
         for content in update.get("content", []):
-            window_id = content.get("id")
-            window_info = self._find_window(update, window_id)
-
-            if window_info and window_info.get("type") == "grid":
-                # Grid windows often contain the status bar with location
-                lines = content.get("lines", [])
-                if lines:
-                    first_line = lines[0]
-                    line_content = first_line.get("content", [])
-                    text_parts = []
-                    for item in line_content:
-                        if isinstance(item, str):
-                            text_parts.append(item)
-                        elif isinstance(item, dict):
-                            text_parts.append(item.get("text", ""))
-                    location_text = "".join(text_parts).strip()
-                    # Often format is "Location Name    Score: 0  Turns: 1"
-                    # Extract just the location part
-                    if location_text:
-                        # Split at multiple spaces or common separators
-                        parts = re.split(r"\s{2,}|Score:|Turns:|Moves:", location_text)
-                        if parts:
-                            return parts[0].strip()
+            if window_types.get(content.get("id")) == "grid":
+                location = self._parse_status_line(content)
+                if location is not None:
+                    return location
         return None
 
+    def _parse_status_line(self, content: dict[str, Any]) -> str | None:
+        """Extract the location from a grid window's first line.
+
+        Args:
+            content: Content entry for a grid window.
+
+        Returns:
+            Location name if found.
+        """
+        # Grid windows often contain the status bar with location
+        lines = content.get("lines", [])
+        if not lines:
+            return None
+
+        first_line = lines[0]
+        line_content = first_line.get("content", [])
+        text_parts = []
+        for item in line_content:
+            if isinstance(item, str):
+                text_parts.append(item)
+            elif isinstance(item, dict):
+                text_parts.append(item.get("text", ""))
+        location_text = "".join(text_parts).strip()
+        # Often format is "Location Name    Score: 0  Turns: 1"
+        # Extract just the location part
+        if not location_text:
+            return None
+
+        # Split at multiple spaces or common separators; only the first part is kept
+        return self._LOCATION_SPLIT_RE.split(location_text, maxsplit=1)[0].strip()
+
     def _detect_game_state_from_update(self, update: dict[str, Any], text: str) -> GameState:
         """Detect game state from update and text.
 
@@ -515,10 +729,16 @@ class GlulxBackend:
         if not update.get("input"):
             return GameState.GAME_OVER
 
+        # Every game-over pattern needs "***" or a RESTART/RESTORE/QUIT keyword,
+        # so most turns skip the regex entirely
+        if "***" not in text:
+            lowered = text.lower()
+            if not any(keyword in lowered for keyword in self._GAME_OVER_KEYWORDS):
+                return GameState.WAITING_INPUT
+
         # Check text for game over patterns
-        for pattern in self._GAME_OVER_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return GameState.GAME_OVER
+        if self._GAME_OVER_RE.search(text):
+            return GameState.GAME_OVER
 
         return GameState.WAITING_INPUT
 
@@ -534,17 +754,8 @@ class GlulxBackend:
         # Normalize line endings
         text = text.replace("\r\n", "\n")
 
-        # Remove excessive blank lines
-        lines = text.split("\n")
-        cleaned_lines = []
-        prev_blank = False
-        for line in lines:
-            is_blank = not line.strip()
-            if not (is_blank and prev_blank):
-                cleaned_lines.append(line)
-            prev_blank = is_blank
-
-        text = "\n".join(cleaned_lines)
+        # Collapse runs of blank (or whitespace-only) lines to a single blank line
+        text = self._BLANK_RUN_RE.sub("\n\n", text)
 
         # Strip leading/trailing whitespace
         return text.strip()
@@ -581,8 +792,8 @@ class GlulxBackend:
         Returns:
             Title if found, None otherwise.
         """
-        lines = intro_text.strip().split("\n")
-        for line in lines[:10]:
+        # Only the first ten lines are candidates; don't split the rest
+        for line in intro_text.lstrip().split("\n", 10)[:10]:
             line = line.strip()
             if line and len(line) > 3:
                 return line
@@ -597,12 +808,10 @@ class GlulxBackend:
         Returns:
             Author if found, None otherwise.
         """
-        patterns = [
-            r"(?:by|written by|author[:\s]+)\s*([A-Z][a-zA-Z \.]+)",
-            r"(?:Copyright|©|\(c\))\s*\d*\s*(?:by\s+)?([A-Z][a-zA-Z \.]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, intro_text, re.IGNORECASE)
+        # Credits appear in the banner, so don't scan the whole opening text
+        header = intro_text[: self._HEADER_CHARS]
+        for pattern in self._AUTHOR_PATTERNS:
+            match = pattern.search(header)
             if match:
                 return match.group(1).strip()
         return None
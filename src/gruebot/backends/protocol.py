@@ -22,6 +22,8 @@ class GameResponse:
     location: str | None = None
     state: GameState = GameState.WAITING_INPUT
     raw_output: dict[str, Any] | None = None
+    # Set by backends for recoverable failures instead of raising
+    error: str | None = None
 
 
 @dataclass
@@ -22,6 +22,13 @@ class ZMachineBackend:
         r"\*\*\*\s*(?:You have died|The End|GAME OVER)\s*\*\*\*",
         r"(?:Would you like to|Do you want to)\s+(?:RESTART|RESTORE|QUIT)",
     ]
+    # All game-over patterns as one alternation, compiled once at import
+    _GAME_OVER_RE = re.compile("|".join(f"(?:{p})" for p in _GAME_OVER_PATTERNS), re.IGNORECASE)
+    # Author credit patterns, tried in order
+    _AUTHOR_PATTERNS = (
+        re.compile(r"(?:by|written by|author[:\s]+)\s*([A-Z][a-zA-Z \.]+)", re.IGNORECASE),
+        re.compile(r"(?:Copyright|©|\(c\))\s*\d*\s*(?:by\s+)?([A-Z][a-zA-Z \.]+)", re.IGNORECASE),
+    )
 
     def __init__(
         self,
@@ -296,9 +303,8 @@ class ZMachineBackend:
         Returns:
             Detected GameState.
         """
-        for pattern in self._GAME_OVER_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return GameState.GAME_OVER
+        if self._GAME_OVER_RE.search(text):
+            return GameState.GAME_OVER
 
         return GameState.WAITING_INPUT
 
@@ -359,13 +365,8 @@ class ZMachineBackend:
             Author if found, None otherwise.
         """
         # Look for common author patterns
-        # Use [^\n] instead of . to avoid matching across lines
-        patterns = [
-            r"(?:by|written by|author[:\s]+)\s*([A-Z][a-zA-Z \.]+)",
-            r"(?:Copyright|©|\(c\))\s*\d*\s*(?:by\s+)?([A-Z][a-zA-Z \.]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, intro_text, re.IGNORECASE)
+        for pattern in self._AUTHOR_PATTERNS:
+            match = pattern.search(intro_text)
             if match:
                 return match.group(1).strip()
         return None
@@ -14,6 +14,9 @@ class LLMConfig(BaseModel):
     model: str = "claude-sonnet-4-20250514"
     max_tokens: int = 1024
     temperature: float = 0.7
+    # Claude CLI only: remember this many responses to repeated recent
+    # history; off by default because hits replay the same command
+    response_cache_size: int = 0
 
 
 class MemoryConfig(BaseModel):
@@ -63,19 +66,24 @@ class Config(BaseSettings):
 def load_config(
     config_path: Path | None = None,
     game_path: Path | None = None,
+    config_dict: dict[str, Any] | None = None,
 ) -> Config:
     """Load configuration from file and environment.
 
     Args:
         config_path: Optional path to YAML config file.
         game_path: Optional game file path to override config.
+        config_dict: Optional already-parsed config data; when given, it is
+            used instead of reading config_path.
 
     Returns:
         Loaded configuration.
     """
     config_data: dict[str, Any] = {}
 
-    if config_path and config_path.exists():
+    if config_dict is not None:
+        config_data = dict(config_dict)
+    elif config_path and config_path.exists():
         import yaml
 
         with open(config_path, encoding="utf-8") as f:
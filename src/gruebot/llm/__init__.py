@@ -3,6 +3,8 @@
 from gruebot.llm.anthropic_api import AnthropicAPIBackend
 from gruebot.llm.claude_cli import ClaudeCLIBackend, ClaudeCLIError
 from gruebot.llm.prompts import (
+    SUMMARIZATION_PROMPT,
+    SYSTEM_PROMPT,
     ParsedResponse,
     format_game_output,
     get_summarization_prompt,
@@ -19,6 +21,8 @@ __all__ = [
     "LLMInterface",
     "LLMResponse",
     "ParsedResponse",
+    "SUMMARIZATION_PROMPT",
+    "SYSTEM_PROMPT",
     "format_game_output",
     "get_summarization_prompt",
     "get_system_prompt",
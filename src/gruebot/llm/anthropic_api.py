@@ -1,16 +1,31 @@
 """Anthropic API backend for LLM interface."""
 
-from collections.abc import AsyncIterator
+from __future__ import annotations
 
-import anthropic
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 from gruebot.llm.prompts import (
+    SYSTEM_PROMPT,
     get_summarization_prompt,
-    get_system_prompt,
     parse_response,
 )
 from gruebot.llm.protocol import ConversationTurn, LLMResponse
 
+if TYPE_CHECKING:
+    # The SDK takes over a second to import, so it is only loaded when a
+    # backend is created; claude_cli users and type-only imports skip it
+    import anthropic
+
+# Prompt cache breakpoint; everything up to a marked block is cached for reuse
+_CACHE_CONTROL: anthropic.types.CacheControlEphemeralParam = {"type": "ephemeral"}
+
+# Keep pooled connections alive between turns. The SDK's default 5s expiry
+# lapses while the game and the model are working, so each turn would pay
+# for a fresh TCP + TLS handshake.
+_KEEPALIVE_CONNECTIONS = 8
+_KEEPALIVE_EXPIRY = 300.0
+
 
 class AnthropicAPIBackend:
     """LLM backend using the Anthropic API directly.
@@ -38,8 +53,20 @@ class AnthropicAPIBackend:
         self.max_tokens = max_tokens
         self.temperature = temperature
 
-        # Initialize the async client
-        self._client = anthropic.AsyncAnthropic(api_key=api_key)
+        import anthropic
+
+        # Initialize the async client with long-lived keep-alive connections.
+        # The limits type comes from the SDK's own HTTP client, so whichever
+        # httpx distribution it depends on is used.
+        limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)(
+            max_connections=anthropic.DEFAULT_CONNECTION_LIMITS.max_connections,
+            max_keepalive_connections=_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=_KEEPALIVE_EXPIRY,
+        )
+        self._client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(limits=limits),
+        )
 
     async def send(
         self,
@@ -57,17 +84,17 @@ class AnthropicAPIBackend:
         """
         # Build the system prompt
         if system_prompt is None:
-            system_prompt = get_system_prompt()
+            system_prompt = SYSTEM_PROMPT
 
-        # Convert messages to Anthropic format
-        api_messages = self._convert_messages(messages)
+        # Convert messages to Anthropic format, caching the history prefix
+        api_messages = self._mark_cache_breakpoint(self._convert_messages(messages))
 
         # Make the API call
         response = await self._client.messages.create(
             model=self.model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
-            system=system_prompt,
+            system=self._system_blocks(system_prompt),
             messages=api_messages,
         )
 
@@ -99,15 +126,15 @@ class AnthropicAPIBackend:
             Text chunks as they arrive.
         """
         if system_prompt is None:
-            system_prompt = get_system_prompt()
+            system_prompt = SYSTEM_PROMPT
 
-        api_messages = self._convert_messages(messages)
+        api_messages = self._mark_cache_breakpoint(self._convert_messages(messages))
 
         async with self._client.messages.stream(
             model=self.model,
             max_tokens=self.max_tokens,
             temperature=self.temperature,
-            system=system_prompt,
+            system=self._system_blocks(system_prompt),
             messages=api_messages,
         ) as stream:
             async for text in stream.text_stream:
@@ -203,6 +230,44 @@ class AnthropicAPIBackend:
 
         return cleaned_messages
 
+    def _system_blocks(self, system_prompt: str) -> list[anthropic.types.TextBlockParam]:
+        """Wrap the system prompt as a single cacheable block.
+
+        The system prompt stays byte-identical across turns (per-turn details
+        travel in the game output), so it can be served from the prompt cache.
+
+        Args:
+            system_prompt: System prompt text.
+
+        Returns:
+            System content blocks with a cache breakpoint.
+        """
+        return [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+
+    def _mark_cache_breakpoint(
+        self, messages: list[anthropic.types.MessageParam]
+    ) -> list[anthropic.types.MessageParam]:
+        """Put a cache breakpoint on the last message.
+
+        Conversation history only grows between summaries, so each request
+        reuses the cached prefix written by the one before it.
+
+        Args:
+            messages: Anthropic-format messages.
+
+        Returns:
+            The same messages, with the last one's content as a cached block.
+        """
+        last = messages[-1]
+        if isinstance(last["content"], str):
+            messages[-1] = {
+                "role": last["role"],
+                "content": [
+                    {"type": "text", "text": last["content"], "cache_control": _CACHE_CONTROL}
+                ],
+            }
+        return messages
+
     def _extract_text(self, response: anthropic.types.Message) -> str:
         """Extract text content from API response.
 
@@ -1,16 +1,38 @@
 """Claude CLI backend for LLM interface."""
 
 import asyncio
+import functools
+import hashlib
 import shutil
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 
 from gruebot.llm.prompts import (
+    SYSTEM_PROMPT,
     get_summarization_prompt,
-    get_system_prompt,
     parse_response,
 )
 from gruebot.llm.protocol import ConversationTurn, LLMResponse
 
+# Prompt templates per conversation role
+_TURN_FORMATS = {
+    "user": "GAME OUTPUT:\n{}",
+    "assistant": "YOUR PREVIOUS RESPONSE:\n{}",
+    "system": "[SYSTEM NOTE: {}]",
+}
+# Turns with any other role contribute only their blank-line separator
+_UNKNOWN_TURN_FORMAT = ""
+
+# Trailing turns that key the response cache; a bounded window lets repeat
+# visits to a room match even deep into a long session
+_CACHE_WINDOW = 4
+
+# Summary history templates per conversation role
+_SUMMARY_FORMATS = {
+    "user": "GAME: {}",
+    "assistant": "PLAYER: {}",
+}
+
 
 class ClaudeCLIError(Exception):
     """Error from Claude CLI."""
@@ -20,11 +42,30 @@ class ClaudeCLIContextLimitError(ClaudeCLIError):
     """Context/token limit exceeded in Claude CLI session."""
 
 
+@functools.cache
+def _find_claude() -> str:
+    """Find the claude CLI executable.
+
+    The $PATH scan runs once per process; failures are not cached, so a
+    later lookup can still find a freshly installed CLI.
+
+    Returns:
+        Path to claude executable.
+
+    Raises:
+        ClaudeCLIError: If claude is not found.
+    """
+    path = shutil.which("claude")
+    if path is None:
+        raise ClaudeCLIError("Claude CLI not found. Install it from https://claude.ai/code")
+    return path
+
+
 class ClaudeCLIBackend:
     """LLM backend using the Claude Code CLI.
 
     This backend shells out to the `claude` CLI tool, providing
-    context via stdin or temp files.
+    the conversation prompt via stdin.
     """
 
     def __init__(
@@ -32,6 +73,7 @@ class ClaudeCLIBackend:
         claude_path: str | None = None,
         model: str | None = None,
         max_tokens: int = 1024,
+        response_cache_size: int = 0,
     ) -> None:
         """Initialize the Claude CLI backend.
 
@@ -39,24 +81,18 @@ class ClaudeCLIBackend:
             claude_path: Path to claude executable (auto-detected if None).
             model: Model to use (uses CLI default if None).
             max_tokens: Maximum tokens in response.
+            response_cache_size: Responses to remember for repeated
+                prompts (0, the default, disables the cache). The key only
+                covers the system prompt and the last few turns, so a hit
+                replays a command even if older state has changed.
         """
-        self.claude_path = claude_path or self._find_claude()
+        self.claude_path = claude_path or _find_claude()
         self.model = model
         self.max_tokens = max_tokens
-
-    def _find_claude(self) -> str:
-        """Find the claude CLI executable.
-
-        Returns:
-            Path to claude executable.
-
-        Raises:
-            ClaudeCLIError: If claude is not found.
-        """
-        path = shutil.which("claude")
-        if path is None:
-            raise ClaudeCLIError("Claude CLI not found. Install it from https://claude.ai/code")
-        return path
+        self.response_cache_size = response_cache_size
+        self._response_cache: OrderedDict[bytes, LLMResponse] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     async def send(
         self,
@@ -73,7 +109,19 @@ class ClaudeCLIBackend:
             LLMResponse with extracted command.
         """
         if system_prompt is None:
-            system_prompt = get_system_prompt()
+            system_prompt = SYSTEM_PROMPT
+
+        # Games repeat themselves (look, revisiting rooms); skip the CLI
+        # entirely when the recent conversation has been seen before
+        key = None
+        if self.response_cache_size > 0:
+            key = self._cache_key(messages, system_prompt)
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached
+            self._cache_misses += 1
 
         # Build the prompt content (without system prompt, passed separately)
         prompt_content = self._build_prompt(messages)
@@ -84,13 +132,32 @@ class ClaudeCLIBackend:
         # Parse the response
         parsed = parse_response(raw_text)
 
-        return LLMResponse(
+        response = LLMResponse(
             raw_text=parsed.raw_text,
             command=parsed.command,
             reasoning=parsed.reasoning,
             is_meta=parsed.is_meta,
         )
 
+        if key is not None:
+            self._response_cache[key] = response
+            if len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
+        return response
+
+    def cache_stats(self) -> dict[str, int]:
+        """Get response cache statistics.
+
+        Returns:
+            Dict with cache hits, misses, and current size.
+        """
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._response_cache),
+        }
+
     async def send_streaming(
         self,
         messages: list[ConversationTurn],
@@ -135,6 +202,22 @@ class ClaudeCLIBackend:
 
         return await self._run_claude(prompt, system_prompt)
 
+    def _cache_key(self, messages: list[ConversationTurn], system_prompt: str) -> bytes:
+        """Hash the system prompt and trailing turns into a response cache key.
+
+        Args:
+            messages: Conversation history.
+            system_prompt: Effective system prompt.
+
+        Returns:
+            16-byte digest.
+        """
+        digest = hashlib.blake2b(system_prompt.encode("utf-8"), digest_size=16)
+        for turn in messages[-_CACHE_WINDOW:]:
+            digest.update(b"\x1e" + turn.role.encode("utf-8") + b"\x1f")
+            digest.update(turn.content.encode("utf-8"))
+        return digest.digest()
+
     def _build_prompt(
         self,
         messages: list[ConversationTurn],
@@ -147,20 +230,12 @@ class ClaudeCLIBackend:
         Returns:
             Combined prompt string.
         """
-        parts = []
-
-        for turn in messages:
-            if turn.role == "user":
-                parts.append(f"GAME OUTPUT:\n{turn.content}")
-            elif turn.role == "assistant":
-                parts.append(f"YOUR PREVIOUS RESPONSE:\n{turn.content}")
-            elif turn.role == "system":
-                parts.append(f"[SYSTEM NOTE: {turn.content}]")
-            parts.append("")
-
-        parts.append("Please provide your next command.")
-
-        return "\n".join(parts)
+        # Each turn is followed by a blank line, then the closing request
+        turns = "".join(
+            _TURN_FORMATS.get(turn.role, _UNKNOWN_TURN_FORMAT).format(turn.content) + "\n\n"
+            for turn in messages
+        )
+        return turns + "Please provide your next command."
 
     async def _run_claude(self, prompt: str, system_prompt: str | None = None) -> str:
         """Run the claude CLI with the given prompt.
@@ -188,17 +263,16 @@ class ClaudeCLIBackend:
         if system_prompt:
             cmd.extend(["--system-prompt", system_prompt])
 
-        # Add the prompt as the final argument
-        cmd.append(prompt)
-
-        # Run the command
+        # Run the command, piping the prompt through stdin rather than argv
+        # (argv is capped at 128 KiB per argument and visible in the process list)
         process = await asyncio.create_subprocess_exec(
             *cmd,
+            stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
 
-        stdout, stderr = await process.communicate()
+        stdout, stderr = await process.communicate(prompt.encode("utf-8"))
 
         if process.returncode != 0:
             error_msg = stderr.decode("utf-8", errors="replace").strip()
@@ -250,12 +324,7 @@ class ClaudeCLIBackend:
         Returns:
             Formatted history text.
         """
-        lines = []
-        for turn in history:
-            if turn.role == "user":
-                lines.append(f"GAME: {turn.content}")
-            elif turn.role == "assistant":
-                lines.append(f"PLAYER: {turn.content}")
-            else:
-                lines.append(f"[{turn.role.upper()}]: {turn.content}")
-        return "\n\n".join(lines)
+        return "\n\n".join(
+            _SUMMARY_FORMATS.get(turn.role, f"[{turn.role.upper()}]: {{}}").format(turn.content)
+            for turn in history
+        )
@@ -1,5 +1,6 @@
 """System prompts and response parsing for LLM interfaces."""
 
+import functools
 import re
 from dataclasses import dataclass
 
@@ -55,6 +56,7 @@ COMMAND: take lantern
 """
 
 
+@functools.lru_cache(maxsize=64)
 def get_system_prompt(
     game_title: str | None = None,
     turn_count: int = 0,
@@ -62,9 +64,13 @@ def get_system_prompt(
 ) -> str:
     """Generate the system prompt for the LLM.
 
+    Results are memoized, so a session asking for the same prompt every
+    turn gets the same string back without rebuilding it.
+
     Args:
         game_title: Title of the game being played.
-        turn_count: Current turn number.
+        turn_count: Current turn number. Leave at 0 during play so the prompt
+            stays identical across turns and can be served from a prompt cache.
         additional_context: Additional context to include.
 
     Returns:
@@ -84,18 +90,8 @@ def get_system_prompt(
     return prompt
 
 
-def get_summarization_prompt(
-    previous_summary: str | None = None,
-) -> str:
-    """Generate the prompt for summarizing game history.
-
-    Args:
-        previous_summary: Previous summary to incorporate.
-
-    Returns:
-        Summarization system prompt.
-    """
-    prompt = """\
+# System prompt for summarizing game history
+SUMMARIZATION_PROMPT = """\
 You are summarizing an interactive fiction game session. Your summary should help \
 the player continue from where they left off.
 
@@ -111,10 +107,25 @@ Keep the summary concise but preserve all critical information needed to continu
 playing effectively.
 """
 
+
+# Summaries change on each successful pass, so only a retry of the same
+# pass can hit; keep the cache small rather than pin old summaries
+@functools.lru_cache(maxsize=8)
+def get_summarization_prompt(
+    previous_summary: str | None = None,
+) -> str:
+    """Generate the prompt for summarizing game history.
+
+    Args:
+        previous_summary: Previous summary to incorporate.
+
+    Returns:
+        Summarization system prompt.
+    """
     if previous_summary:
-        prompt += f"\n\nPrevious summary to incorporate:\n{previous_summary}"
+        return f"{SUMMARIZATION_PROMPT}\n\nPrevious summary to incorporate:\n{previous_summary}"
 
-    return prompt
+    return SUMMARIZATION_PROMPT
 
 
 # Pattern to extract the command from LLM response
@@ -124,10 +135,52 @@ COMMAND_PATTERN = re.compile(
     re.MULTILINE | re.IGNORECASE,
 )
 
+# Common spellings of the prefix, found with str.find before falling back to the regex
+_COMMAND_PREFIXES = ("COMMAND:", "Command:", "command:")
+
 # Patterns for meta commands (save, restore, quit)
 META_COMMANDS = frozenset({"save", "restore", "quit", "restart"})
 
 
+def _find_command(text: str) -> tuple[int, str] | None:
+    """Locate the first line-start COMMAND: directive in text.
+
+    Scans for the usual spellings with ``str.find`` and only runs the
+    case-insensitive ``COMMAND_PATTERN`` when none of them is present, so
+    an oddly cased directive is picked up only if no usual one exists.
+
+    Args:
+        text: Raw LLM response text.
+
+    Returns:
+        Tuple of (directive start index, unstripped command text), or None.
+    """
+    start = -1
+    for prefix in _COMMAND_PREFIXES:
+        idx = text.find(prefix)
+        # Only matches at the start of a line count
+        while idx > 0 and text[idx - 1] != "\n":
+            idx = text.find(prefix, idx + 1)
+        if idx != -1 and (start == -1 or idx < start):
+            start = idx
+
+    if start != -1:
+        # Like the pattern's \s*, skip whitespace (newlines included) after the prefix
+        value_start = start + len("COMMAND:")
+        while value_start < len(text) and text[value_start].isspace():
+            value_start += 1
+        value_end = text.find("\n", value_start)
+        if value_end == -1:
+            value_end = len(text)
+        if value_end > value_start:
+            return start, text[value_start:value_end]
+
+    match = COMMAND_PATTERN.search(text)
+    if match:
+        return match.start(), match.group(1)
+    return None
+
+
 def parse_response(text: str) -> ParsedResponse:
     """Parse an LLM response to extract the command.
 
@@ -138,12 +191,13 @@ def parse_response(text: str) -> ParsedResponse:
         ParsedResponse with extracted command and reasoning.
     """
     # Look for explicit COMMAND: prefix
-    match = COMMAND_PATTERN.search(text)
+    found = _find_command(text)
 
-    if match:
-        command = match.group(1).strip()
+    if found:
+        start, command = found
+        command = command.strip()
         # Everything before the command is reasoning
-        reasoning = text[: match.start()].strip() or None
+        reasoning = text[:start].strip() or None
 
         # Check if it's a meta command
         is_meta = command.lower().split()[0] in META_COMMANDS if command else False
@@ -1,23 +1,57 @@
 """Transcript logging for game sessions."""
 
+import asyncio
 import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+import re
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TextIO
+from typing import Any, TextIO
 
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install gruebot[fast])
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+# Characters replaced when building transcript filenames (\w keeps Unicode
+# letters and digits, matching str.isalnum, plus the underscore)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w-]")
+
+# Flush the markdown transcript after this many entries rather than every write
+_FLUSH_EVERY = 16
+
+
+@dataclass(slots=True)
 class TranscriptEntry:
     """A single entry in the transcript."""
 
-    timestamp: str
+    timestamp: float  # seconds since the session started
     turn: int
     entry_type: str  # "game_output", "llm_response", "command", "error", "summary"
     content: str
     metadata: dict[str, str | int | None] = field(default_factory=dict)
 
 
+def _dumps_transcript(data: dict[str, Any], default: Callable[[Any], Any]) -> bytes:
+    """Serialize a JSON transcript, using orjson when available.
+
+    Args:
+        data: Transcript document.
+        default: Hook converting objects the encoder can't handle, such as
+            TranscriptEntry, into JSON-compatible values.
+
+    Returns:
+        Encoded JSON.
+    """
+    if orjson is not None:
+        # Otherwise orjson encodes dataclasses itself and skips the hook
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(data, indent=2, default=default).encode()
+
+
 class TranscriptLogger:
     """Dual-format transcript logger (JSON + Markdown).
 
@@ -42,15 +76,20 @@ class TranscriptLogger:
         self.markdown_path = markdown_path
         self.game_title = game_title
         self._entries: list[TranscriptEntry] = []
+        # One shared metadata dict per location; entries treat metadata as read-only
+        self._location_meta: dict[str, dict[str, str | int | None]] = {}
         self._turn = 0
         self._md_file: TextIO | None = None
+        self._writes_since_flush = 0
         self._start_time = datetime.now()
+        # Entry timestamps are monotonic offsets from here, formatted at finalize
+        self._perf_base = time.perf_counter()
 
         # Initialize markdown file if path provided
         # Keep file open for streaming writes during session
         if markdown_path:
             markdown_path.parent.mkdir(parents=True, exist_ok=True)
-            self._md_file = open(markdown_path, "w", encoding="utf-8")  # noqa: SIM115
+            self._md_file = open(markdown_path, "w", buffering=8192, encoding="utf-8")  # noqa: SIM115
             self._write_markdown_header()
 
     def _write_markdown_header(self) -> None:
@@ -62,7 +101,6 @@ class TranscriptLogger:
         self._md_file.write(f"# {title}\n\n")
         self._md_file.write(f"Started: {self._start_time.isoformat()}\n\n")
         self._md_file.write("---\n\n")
-        self._md_file.flush()
 
     def log_game_output(
         self,
@@ -76,11 +114,11 @@ class TranscriptLogger:
             location: Current location if known.
         """
         entry = TranscriptEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.perf_counter() - self._perf_base,
             turn=self._turn,
             entry_type="game_output",
             content=text,
-            metadata={"location": location} if location else {},
+            metadata=self._location_metadata(location) if location else {},
         )
         self._add_entry(entry)
 
@@ -91,7 +129,6 @@ class TranscriptLogger:
                 self._md_file.write(f"*Location: {location}*\n\n")
             self._md_file.write("**Game:**\n")
             self._md_file.write(f"```\n{text}\n```\n\n")
-            self._md_file.flush()
 
     def log_llm_response(
         self,
@@ -107,7 +144,7 @@ class TranscriptLogger:
             reasoning: LLM's reasoning/thoughts.
         """
         entry = TranscriptEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.perf_counter() - self._perf_base,
             turn=self._turn,
             entry_type="llm_response",
             content=raw_text,
@@ -124,7 +161,6 @@ class TranscriptLogger:
                 self._md_file.write(f"**Claude's reasoning:**\n{reasoning}\n\n")
             if command:
                 self._md_file.write(f"**Command:** `{command}`\n\n")
-            self._md_file.flush()
 
         self._turn += 1
 
@@ -135,7 +171,7 @@ class TranscriptLogger:
             command: The command sent.
         """
         entry = TranscriptEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.perf_counter() - self._perf_base,
             turn=self._turn,
             entry_type="command",
             content=command,
@@ -149,7 +185,7 @@ class TranscriptLogger:
             summary: The generated summary.
         """
         entry = TranscriptEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.perf_counter() - self._perf_base,
             turn=self._turn,
             entry_type="summary",
             content=summary,
@@ -158,10 +194,10 @@ class TranscriptLogger:
 
         if self._md_file:
             self._md_file.write(f"---\n\n*[Summary generated at turn {self._turn}]*\n\n")
-            quoted_summary = summary.replace("\n", "\n> ")
-            self._md_file.write(f"> {quoted_summary}\n\n")
+            # Quote line by line straight into the write buffer
+            self._md_file.writelines(f"> {line}\n" for line in summary.split("\n"))
+            self._md_file.write("\n")
             self._md_file.write("---\n\n")
-            self._md_file.flush()
 
     def log_error(self, error_type: str, message: str) -> None:
         """Log an error.
@@ -171,7 +207,7 @@ class TranscriptLogger:
             message: Error message.
         """
         entry = TranscriptEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.perf_counter() - self._perf_base,
             turn=self._turn,
             entry_type="error",
             content=message,
@@ -181,7 +217,9 @@ class TranscriptLogger:
 
         if self._md_file:
             self._md_file.write(f"> **Error ({error_type}):** {message}\n\n")
+            # Flush immediately so the error survives a crash
             self._md_file.flush()
+            self._writes_since_flush = 0
 
     def log_system_note(self, note: str) -> None:
         """Log a system note.
@@ -190,7 +228,7 @@ class TranscriptLogger:
             note: System note content.
         """
         entry = TranscriptEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.perf_counter() - self._perf_base,
             turn=self._turn,
             entry_type="system",
             content=note,
@@ -199,7 +237,20 @@ class TranscriptLogger:
 
         if self._md_file:
             self._md_file.write(f"*[System: {note}]*\n\n")
-            self._md_file.flush()
+
+    def _location_metadata(self, location: str) -> dict[str, str | int | None]:
+        """Get the shared metadata dict for a location.
+
+        Args:
+            location: Location name.
+
+        Returns:
+            Metadata dict, reused by every entry logged at that location.
+        """
+        metadata = self._location_meta.get(location)
+        if metadata is None:
+            metadata = self._location_meta[location] = {"location": location}
+        return metadata
 
     def _add_entry(self, entry: TranscriptEntry) -> None:
         """Add an entry to the transcript.
@@ -209,6 +260,12 @@ class TranscriptLogger:
         """
         self._entries.append(entry)
 
+        # Amortize flushes across entries; markdown writes are buffered
+        self._writes_since_flush += 1
+        if self._md_file and self._writes_since_flush >= _FLUSH_EVERY:
+            self._md_file.flush()
+            self._writes_since_flush = 0
+
     def get_entries(self) -> list[TranscriptEntry]:
         """Get all transcript entries.
 
@@ -223,27 +280,70 @@ class TranscriptLogger:
 
         # Write JSON transcript
         if self.json_path:
-            self.json_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.json_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {
-                        "game_title": self.game_title,
-                        "start_time": self._start_time.isoformat(),
-                        "end_time": end_time.isoformat(),
-                        "total_turns": self._turn,
-                        "entries": [asdict(e) for e in self._entries],
-                    },
-                    f,
-                    indent=2,
-                )
+            self._write_json(self.json_path, end_time)
 
         # Close markdown file
         if self._md_file:
-            self._md_file.write("\n---\n\n")
-            self._md_file.write(f"Completed: {end_time.isoformat()}\n")
-            self._md_file.write(f"Total turns: {self._turn}\n")
-            self._md_file.close()
-            self._md_file = None
+            self._close_markdown(self._md_file, end_time)
+
+    async def finalize_async(self) -> None:
+        """Finalize and close transcript files without blocking the event loop.
+
+        The file writes run in worker threads, so tools finalizing many
+        sessions can overlap them with asyncio.gather().
+        """
+        end_time = datetime.now()
+
+        if self.json_path:
+            await asyncio.to_thread(self._write_json, self.json_path, end_time)
+
+        if self._md_file:
+            await asyncio.to_thread(self._close_markdown, self._md_file, end_time)
+
+    def _write_json(self, json_path: Path, end_time: datetime) -> None:
+        """Write the JSON transcript.
+
+        Args:
+            json_path: Destination path.
+            end_time: Session end time.
+        """
+        start_time = self._start_time
+
+        def encode_entry(entry: Any) -> dict[str, Any]:
+            if not isinstance(entry, TranscriptEntry):
+                raise TypeError(f"Cannot serialize {type(entry).__name__}")
+            return {
+                "timestamp": (start_time + timedelta(seconds=entry.timestamp)).isoformat(),
+                "turn": entry.turn,
+                "entry_type": entry.entry_type,
+                "content": entry.content,
+                "metadata": entry.metadata,
+            }
+
+        # Entries are converted as the encoder reaches them, so the whole
+        # transcript is never held as a second list of dicts
+        data = {
+            "game_title": self.game_title,
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "total_turns": self._turn,
+            "entries": self._entries,
+        }
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_bytes(_dumps_transcript(data, encode_entry))
+
+    def _close_markdown(self, md_file: TextIO, end_time: datetime) -> None:
+        """Write the markdown footer and close the file.
+
+        Args:
+            md_file: Open markdown transcript.
+            end_time: Session end time.
+        """
+        md_file.write("\n---\n\n")
+        md_file.write(f"Completed: {end_time.isoformat()}\n")
+        md_file.write(f"Total turns: {self._turn}\n")
+        md_file.close()
+        self._md_file = None
 
     def __enter__(self) -> "TranscriptLogger":
         """Context manager entry."""
@@ -278,7 +378,7 @@ def create_transcript_paths(
         session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Sanitize game name for filename
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in game_name)
+    safe_name = _UNSAFE_FILENAME_RE.sub("_", game_name)
 
     json_path = base_dir / f"{safe_name}_{session_id}.json"
     markdown_path = base_dir / f"{safe_name}_{session_id}.md"
@@ -1,7 +1,7 @@
 """Main game session orchestration."""
 
-from collections import deque
-from collections.abc import Callable
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -26,13 +26,44 @@ class GameResult:
     error: str | None = None
 
 
+# Number of recent outputs and commands the stuck detector compares
+_STUCK_WINDOW = 5
+
+
+def _push_distinct(window: deque[int], counts: Counter[int], key: int) -> int:
+    """Slide a fingerprint into a window and count distinct fingerprints.
+
+    Args:
+        window: Bounded window of recent fingerprints.
+        counts: Occurrences of each fingerprint currently in the window.
+        key: Fingerprint to add.
+
+    Returns:
+        Number of distinct fingerprints in the window.
+    """
+    if len(window) == window.maxlen:
+        old = window[0]
+        counts[old] -= 1
+        if not counts[old]:
+            del counts[old]
+    window.append(key)
+    counts[key] += 1
+    return len(counts)
+
+
 @dataclass
 class StuckDetector:
-    """Detects when the LLM is stuck repeating actions."""
+    """Detects when the LLM is stuck repeating actions.
+
+    Outputs and commands are kept as hash fingerprints alongside running
+    counts, so each check is constant time rather than rebuilding a set.
+    """
 
     threshold: int = 5
-    _recent_outputs: deque[str] = field(default_factory=lambda: deque(maxlen=5))
-    _recent_commands: deque[str] = field(default_factory=lambda: deque(maxlen=5))
+    _recent_outputs: deque[int] = field(default_factory=lambda: deque(maxlen=_STUCK_WINDOW))
+    _output_counts: Counter[int] = field(default_factory=Counter)
+    _recent_commands: deque[int] = field(default_factory=lambda: deque(maxlen=_STUCK_WINDOW))
+    _command_counts: Counter[int] = field(default_factory=Counter)
 
     def check(self, response: GameResponse, command: str | None = None) -> bool:
         """Check if we're in a stuck state.
@@ -41,34 +72,64 @@ class StuckDetector:
             response: Game response.
             command: Command that was sent.
 
+        Returns:
+            True if stuck state detected.
+        """
+        return self._check_text(response.text, command)
+
+    def check_batch(self, turns: Iterable[tuple[str, str | None]]) -> int:
+        """Run a sequence of turns through the detector, e.g. when replaying.
+
+        Works on raw output text, so callers need not build a GameResponse
+        per turn. Stops at the first stuck turn; the turns up to it stay
+        in the detector's history.
+
+        Args:
+            turns: (game output text, command) pairs in play order.
+
+        Returns:
+            Index of the first turn that was detected as stuck, or -1.
+        """
+        check = self._check_text
+        for i, (text, command) in enumerate(turns):
+            if check(text, command):
+                return i
+        return -1
+
+    def _check_text(self, text: str, command: str | None) -> bool:
+        """Record one turn and check for a stuck state.
+
+        Args:
+            text: Game output text.
+            command: Command that was sent.
+
         Returns:
             True if stuck state detected.
         """
         # Track recent outputs (first 200 chars for comparison)
-        self._recent_outputs.append(response.text[:200])
+        unique_outputs = _push_distinct(self._recent_outputs, self._output_counts, hash(text[:200]))
 
         # Track recent commands
         if command:
-            self._recent_commands.append(command.lower())
+            unique_commands = _push_distinct(
+                self._recent_commands, self._command_counts, hash(command.lower())
+            )
+        else:
+            unique_commands = len(self._command_counts)
 
         # Check for repeated outputs
-        if len(self._recent_outputs) >= self.threshold:
-            unique_outputs = len(set(self._recent_outputs))
-            if unique_outputs <= 2:
-                return True
+        if len(self._recent_outputs) >= self.threshold and unique_outputs <= 2:
+            return True
 
         # Check for repeated commands
-        if len(self._recent_commands) >= self.threshold:
-            unique_commands = len(set(self._recent_commands))
-            if unique_commands <= 2:
-                return True
-
-        return False
+        return len(self._recent_commands) >= self.threshold and unique_commands <= 2
 
     def reset(self) -> None:
         """Reset stuck detection after intervention."""
         self._recent_outputs.clear()
+        self._output_counts.clear()
         self._recent_commands.clear()
+        self._command_counts.clear()
 
 
 class GameSessionError(Exception):
@@ -154,11 +215,16 @@ class GameSession:
                     # Send command to game
                     if response.command:
                         game_response = self.backend.send_command(response.command)
-                        self._handle_game_output(game_response, on_game_output)
+                        if game_response.error is not None:
+                            # The game rejected the command; tell the LLM why
+                            # instead of showing it an empty turn
+                            self._handle_game_error(response.command, game_response, on_game_output)
+                        else:
+                            self._handle_game_output(game_response, on_game_output)
 
-                        # Check for stuck state
-                        if self._stuck_detector.check(game_response, response.command):
-                            await self._handle_stuck_state()
+                            # Check for stuck state
+                            if self._stuck_detector.check(game_response, response.command):
+                                await self._handle_stuck_state()
 
                         # Check for game over
                         if game_response.state == GameState.GAME_OVER:
@@ -217,9 +283,10 @@ class GameSession:
             LLM response with command.
         """
         messages = self.context.build_messages()
+        # The turn number already travels in the game output; keeping it out of
+        # the system prompt leaves that prefix identical (and cacheable) every turn
         system_prompt = get_system_prompt(
             game_title=self.backend.game_info.title if self.backend.game_info else None,
-            turn_count=self._turn_count,
         )
 
         return await self.llm.send(messages, system_prompt=system_prompt)
@@ -245,6 +312,26 @@ class GameSession:
         if callback:
             callback(response)
 
+    def _handle_game_error(
+        self,
+        command: str,
+        response: GameResponse,
+        callback: OutputCallback | None = None,
+    ) -> None:
+        """Handle a command the game failed to process.
+
+        Args:
+            command: Command that was sent.
+            response: Game response with its error set.
+            callback: Optional output callback.
+        """
+        self.context.add_system_note(
+            f"The game could not process the command '{command}': {response.error}"
+        )
+
+        if callback:
+            callback(response)
+
     def _handle_llm_response(
         self,
         response: LLMResponse,
@@ -2,12 +2,14 @@
 
 from gruebot.memory.context import ContextManager, GameContext
 from gruebot.memory.summarizer import (
+    BatchSummarizer,
     SummarizationConfig,
     Summarizer,
     create_summary_message,
 )
 
 __all__ = [
+    "BatchSummarizer",
     "ContextManager",
     "GameContext",
     "SummarizationConfig",
@@ -1,9 +1,12 @@
 """Context management for game sessions."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 from gruebot.llm.protocol import ConversationTurn, LLMInterface
 
+_VALID_ROLES = frozenset(("user", "assistant", "system"))
+
 
 @dataclass
 class GameContext:
@@ -55,7 +58,7 @@ class ContextManager:
             content: The turn content.
         """
         # Validate role
-        if role not in ("user", "assistant", "system"):
+        if role not in _VALID_ROLES:
             raise ValueError(f"Invalid role: {role}")
 
         turn = ConversationTurn(role=role, content=content)  # type: ignore[arg-type]
@@ -63,6 +66,27 @@ class ContextManager:
         self.context.recent_turns.append(turn)
         self.context.turn_count += 1
 
+    def extend_turns(self, turns: Iterable[tuple[str, str]]) -> None:
+        """Add several conversation turns at once.
+
+        The roles are validated before any turn is added, so an invalid
+        role leaves the context unchanged.
+
+        Args:
+            turns: (role, content) pairs in conversation order.
+        """
+        new_turns = [
+            ConversationTurn(role=role, content=content)  # type: ignore[arg-type]
+            for role, content in turns
+        ]
+        invalid = {turn.role for turn in new_turns} - _VALID_ROLES
+        if invalid:
+            raise ValueError(f"Invalid role: {min(invalid)}")
+
+        self._full_history.extend(new_turns)
+        self.context.recent_turns.extend(new_turns)
+        self.context.turn_count += len(new_turns)
+
     def add_game_output(self, text: str, location: str | None = None) -> None:
         """Add game output as a user turn.
 
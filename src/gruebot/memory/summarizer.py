@@ -1,9 +1,18 @@
 """Summarization utilities for game history."""
 
+from __future__ import annotations
+
+import asyncio
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from gruebot.llm.protocol import ConversationTurn, LLMInterface
 
+if TYPE_CHECKING:
+    import anthropic
+    from anthropic.types import Message
+    from anthropic.types.messages.batch_create_params import Request
+
 
 @dataclass
 class SummarizationConfig:
@@ -105,16 +114,7 @@ Provide a concise summary that preserves critical information for continuing the
         Returns:
             Summary text.
         """
-        history_text = self._format_history(history)
-
-        previous_section = ""
-        if previous_summary:
-            previous_section = f"Previous summary (incorporate this):\n{previous_summary}\n"
-
-        prompt = self.SUMMARIZE_PROMPT.format(
-            previous_section=previous_section,
-            history=history_text,
-        )
+        prompt = self._build_prompt(history, previous_summary)
 
         # Create a single user message with the summarization request
         messages = [ConversationTurn(role="user", content=prompt)]
@@ -147,6 +147,29 @@ Provide a concise summary that preserves critical information for continuing the
 
         return to_summarize, to_keep
 
+    def _build_prompt(
+        self,
+        history: list[ConversationTurn],
+        previous_summary: str | None = None,
+    ) -> str:
+        """Build the summarization request for a slice of history.
+
+        Args:
+            history: Conversation turns to summarize.
+            previous_summary: Previous summary to incorporate.
+
+        Returns:
+            Prompt text.
+        """
+        previous_section = ""
+        if previous_summary:
+            previous_section = f"Previous summary (incorporate this):\n{previous_summary}\n"
+
+        return self.SUMMARIZE_PROMPT.format(
+            previous_section=previous_section,
+            history=self._format_history(history),
+        )
+
     def _format_history(self, history: list[ConversationTurn]) -> str:
         """Format history for summarization prompt.
 
@@ -167,6 +190,140 @@ Provide a concise summary that preserves critical information for continuing the
         return "\n\n".join(lines)
 
 
+class BatchSummarizer(Summarizer):
+    """Summarizes many histories at once via the Anthropic Message Batches API.
+
+    Batched requests are billed at a discount but can take minutes to
+    complete, so this is meant for offline work such as summarizing a
+    directory of saved sessions, not for the live game loop.
+    """
+
+    def __init__(
+        self,
+        client: anthropic.AsyncAnthropic,
+        model: str = "claude-sonnet-4-20250514",
+        config: SummarizationConfig | None = None,
+        batch_mode: bool = True,
+        max_concurrency: int = 4,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+    ) -> None:
+        """Initialize the batch summarizer.
+
+        Args:
+            client: Async Anthropic client used to submit requests.
+            model: Model name to use.
+            config: Summarization configuration.
+            batch_mode: Submit through the Message Batches API. When False,
+                each request is sent as an ordinary message instead.
+            max_concurrency: Maximum messages in flight when batch_mode is off.
+            poll_interval: Initial delay between batch status checks.
+            max_poll_interval: Upper bound for the backoff delay.
+        """
+        super().__init__(config)
+        self.client = client
+        self.model = model
+        self.batch_mode = batch_mode
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self._pending: list[Request] = []
+
+    def add(
+        self,
+        history: list[ConversationTurn],
+        previous_summary: str | None = None,
+    ) -> str:
+        """Queue a history for summarization on the next flush.
+
+        Args:
+            history: Conversation turns to summarize.
+            previous_summary: Previous summary to incorporate.
+
+        Returns:
+            Custom ID under which the summary will be returned.
+        """
+        custom_id = f"session-{len(self._pending)}"
+        self._pending.append(
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": self.model,
+                    "max_tokens": self.config.max_summary_tokens,
+                    "messages": [
+                        {"role": "user", "content": self._build_prompt(history, previous_summary)}
+                    ],
+                },
+            }
+        )
+        return custom_id
+
+    async def flush(self) -> dict[str, str]:
+        """Submit all queued requests and wait for their summaries.
+
+        Without ``batch_mode`` the requests are sent as ordinary messages
+        instead, at most ``max_concurrency`` at a time, trading the discount
+        for latency.
+
+        Returns:
+            Summary text keyed on the custom IDs returned by add().
+            Requests that errored or expired are absent from the result.
+        """
+        requests, self._pending = self._pending, []
+        if not requests:
+            return {}
+
+        if not self.batch_mode:
+            return await self._flush_messages(requests)
+
+        batch = await self.client.messages.batches.create(requests=requests)
+
+        delay = self.poll_interval
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        summaries: dict[str, str] = {}
+        async for response in await self.client.messages.batches.results(batch.id):
+            if response.result.type == "succeeded":
+                summaries[response.custom_id] = self._message_text(response.result.message)
+        return summaries
+
+    async def _flush_messages(self, requests: list[Request]) -> dict[str, str]:
+        """Send queued requests as individual messages.
+
+        Args:
+            requests: Requests taken from the queue.
+
+        Returns:
+            Summary text keyed on custom ID, without the failed requests.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def create(request: Request) -> Message:
+            async with semaphore:
+                return await self.client.messages.create(**request["params"])
+
+        # One failed request (e.g. rate limited) must not lose the others
+        messages = await asyncio.gather(
+            *(create(request) for request in requests), return_exceptions=True
+        )
+        summaries: dict[str, str] = {}
+        for request, message in zip(requests, messages, strict=True):
+            if isinstance(message, Exception):
+                continue
+            if isinstance(message, BaseException):
+                raise message
+            summaries[request["custom_id"]] = self._message_text(message)
+        return summaries
+
+    @staticmethod
+    def _message_text(message: Message) -> str:
+        """Concatenate the text blocks of a response message."""
+        return "".join(block.text for block in message.content if block.type == "text")
+
+
 def create_summary_message(summary: str) -> ConversationTurn:
     """Create a system message containing a summary.
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -254,9 +255,13 @@ class TurnsAssertion(Assertion):
         return f"turns {symbols.get(self.comparison, '<=')} {self.expected}"
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_assertion(line: str) -> Assertion | None:
     """Parse an assertion directive from a walkthrough file.
 
+    Results are memoized per line, so repeated directives share a single
+    Assertion instance. Assertions must be treated as read-only.
+
     Supported formats:
         @expect-location "Kitchen"
         @expect-location-exact "The Kitchen"
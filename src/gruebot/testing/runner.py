@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import contextlib
 import re
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import IntEnum
 from pathlib import Path
@@ -13,6 +14,12 @@ from gruebot.backends.protocol import GameBackend, GameResponse, GameState
 from gruebot.testing.assertions import Assertion, AssertionResult, parse_assertion
 from gruebot.testing.types import TestState
 
+# Score as reported in game output ("Score: 10", "you scored 10")
+_SCORE_RE = re.compile(r"(?:score[:\s]+|scored?\s+)(\d+)", re.IGNORECASE)
+
+# Commands whose output is parsed for inventory items
+_INVENTORY_COMMANDS = frozenset({"i", "inv", "inventory", "take inventory"})
+
 
 class ExitCode(IntEnum):
     """Exit codes for test command."""
@@ -31,10 +38,18 @@ class TestConfig:
 
     game_path: Path
     walkthrough_path: Path | None = None
+    # Already-parsed walkthrough; takes precedence over walkthrough_path
+    walkthrough: WalkthroughTest | None = None
     smoke_test: bool = False
     verbose: bool = False
     timeout_per_command: float = 30.0
     final_assertions: list[Assertion] = field(default_factory=list)
+    # Keep every game output in TestState.full_transcript; disable for
+    # assertion-only runs that only need the latest output
+    transcript_enabled: bool = True
+    # Number of on_output messages to coalesce into a single callback;
+    # with values above 1 output is delivered in newline-joined bursts
+    output_batch_size: int = 1
 
 
 @dataclass
@@ -110,66 +125,106 @@ class WalkthroughTest:
             FileNotFoundError: If file doesn't exist.
             ValueError: If file is invalid.
         """
+        if not path.exists():
+            raise FileNotFoundError(f"Walkthrough file not found: {path}")
+
+        with open(path, encoding="utf-8") as f:
+            self._load(path, f)
+
+    @classmethod
+    def from_text(cls, text: str, path: Path | None = None) -> WalkthroughTest:
+        """Parse a walkthrough held in memory.
+
+        Args:
+            text: Walkthrough file contents.
+            path: Path to report for the walkthrough, if it has one.
+
+        Returns:
+            Parsed walkthrough.
+
+        Raises:
+            ValueError: If the text is invalid.
+        """
+        walkthrough = cls.__new__(cls)
+        walkthrough._load(path or Path("<string>"), text.splitlines())
+        return walkthrough
+
+    def _load(self, path: Path, lines: Iterable[str]) -> None:
+        """Parse walkthrough lines into steps.
+
+        Args:
+            path: Path the lines came from.
+            lines: Walkthrough lines, with or without line endings.
+
+        Raises:
+            ValueError: If an assertion is not recognized.
+        """
         self.path = path
         self.steps: list[WalkthroughStep] = []
-        self._parse()
+        self._parse(lines)
+        # Steps are fixed after parsing, so the filtered views are built once
+        self._commands = tuple(s.command for s in self.steps if s.command)
+        self._assertions = tuple(s.assertion for s in self.steps if s.assertion)
+
+    def _parse(self, lines: Iterable[str]) -> None:
+        """Parse walkthrough lines."""
+        for line_num, line in enumerate(lines, start=1):
+            stripped = line.strip()
+
+            # Skip empty lines
+            if not stripped:
+                continue
+
+            step: WalkthroughStep | None
+            kind = stripped[:1]
+            if kind == "#":
+                step = self._parse_comment(stripped, line_num)
+            elif kind == "@":
+                step = self._parse_assertion(stripped, line_num)
+            else:
+                step = self._parse_command(stripped, line_num)
 
-    def _parse(self) -> None:
-        """Parse the walkthrough file."""
-        if not self.path.exists():
-            raise FileNotFoundError(f"Walkthrough file not found: {self.path}")
+            if step is not None:
+                self.steps.append(step)
 
-        with open(self.path, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.rstrip("\n\r")
+    @staticmethod
+    def _parse_comment(stripped: str, line_num: int) -> WalkthroughStep:
+        """Parse a `#` comment line."""
+        return WalkthroughStep(line_number=line_num, comment=stripped[1:].strip())
 
-                # Skip empty lines
-                if not line.strip():
-                    continue
+    @staticmethod
+    def _parse_assertion(stripped: str, line_num: int) -> WalkthroughStep:
+        """Parse an `@` assertion line.
 
-                # Comments
-                if line.strip().startswith("#"):
-                    self.steps.append(
-                        WalkthroughStep(
-                            line_number=line_num,
-                            comment=line.strip()[1:].strip(),
-                        )
-                    )
-                    continue
+        Raises:
+            ValueError: If the assertion is not recognized.
+        """
+        assertion = parse_assertion(stripped)
+        if assertion is None:
+            raise ValueError(f"Invalid assertion at line {line_num}: {stripped}")
+        return WalkthroughStep(line_number=line_num, assertion=assertion)
 
-                # Assertions
-                if line.strip().startswith("@"):
-                    assertion = parse_assertion(line)
-                    if assertion:
-                        self.steps.append(
-                            WalkthroughStep(
-                                line_number=line_num,
-                                assertion=assertion,
-                            )
-                        )
-                    else:
-                        raise ValueError(f"Invalid assertion at line {line_num}: {line}")
-                    continue
+    @staticmethod
+    def _parse_command(stripped: str, line_num: int) -> WalkthroughStep | None:
+        """Parse a command line, stripping inline comments.
 
-                # Commands - strip inline comments
-                command = line.split("#")[0].strip()
-                if command:
-                    self.steps.append(
-                        WalkthroughStep(
-                            line_number=line_num,
-                            command=command,
-                        )
-                    )
+        Commands are interned since walkthroughs repeat a small vocabulary
+        (``look``, ``north``, ``i``) many times.
+        """
+        command = stripped.split("#")[0].strip()
+        if not command:
+            return None
+        return WalkthroughStep(line_number=line_num, command=sys.intern(command))
 
     @property
-    def commands(self) -> list[str]:
+    def commands(self) -> tuple[str, ...]:
         """Get just the commands from the walkthrough."""
-        return [s.command for s in self.steps if s.command]
+        return self._commands
 
     @property
-    def assertions(self) -> list[Assertion]:
+    def assertions(self) -> tuple[Assertion, ...]:
         """Get just the assertions from the walkthrough."""
-        return [s.assertion for s in self.steps if s.assertion]
+        return self._assertions
 
 
 class TestRunner:
@@ -195,6 +250,7 @@ class TestRunner:
         self.on_step = on_step
         self.on_output = on_output
         self.state = TestState()
+        self._output_buffer: list[str] = []
 
     def run(self) -> TestResult:
         """Run the test.
@@ -202,6 +258,33 @@ class TestRunner:
         Returns:
             TestResult with pass/fail status and details.
         """
+        try:
+            return self._run()
+        finally:
+            self._flush_output()
+
+    def _emit_output(self, text: str) -> None:
+        """Queue game output for the on_output callback.
+
+        Args:
+            text: Output text to deliver.
+        """
+        if self.on_output is None:
+            return
+        self._output_buffer.append(text)
+        if len(self._output_buffer) >= self.config.output_batch_size:
+            self._flush_output()
+
+    def _flush_output(self) -> None:
+        """Deliver any buffered output to the on_output callback."""
+        if self.on_output is None or not self._output_buffer:
+            return
+        text = "\n".join(self._output_buffer)
+        self._output_buffer.clear()
+        self.on_output(text)
+
+    def _run(self) -> TestResult:
+        """Execute the configured test and build its result."""
         step_results: list[StepResult] = []
         assertions_checked = 0
         assertions_passed = 0
@@ -211,8 +294,7 @@ class TestRunner:
         try:
             response = self.backend.start(str(self.config.game_path))
             self._update_state(response)
-            if self.on_output:
-                self.on_output(response.text)
+            self._emit_output(response.text)
         except Exception as e:
             return TestResult(
                 exit_code=ExitCode.GAME_START_FAILED,
@@ -232,12 +314,12 @@ class TestRunner:
             # Send a basic command to verify game responds
             try:
                 response = self.backend.send_command("look")
-                self._update_state(response)
-                if self.on_output:
-                    self.on_output(response.text)
+                if response.error is None:
+                    self._update_state(response, "look")
+                    self._emit_output(response.text)
 
-                # Check game is still running
-                if response.state == GameState.ERROR:
+                # Check game accepted the command and is still running
+                if response.error is not None or response.state == GameState.ERROR:
                     return TestResult(
                         exit_code=ExitCode.GAME_ERROR,
                         passed=False,
@@ -248,7 +330,11 @@ class TestRunner:
                         assertions_passed=0,
                         assertions_failed=0,
                         final_state=self.state,
-                        error="Game returned error state",
+                        error=(
+                            f"Smoke test command failed: {response.error}"
+                            if response.error is not None
+                            else "Game returned error state"
+                        ),
                     )
 
                 return TestResult(
@@ -277,23 +363,23 @@ class TestRunner:
                 )
 
         # Walkthrough test
-        if self.config.walkthrough_path:
-            try:
-                walkthrough = WalkthroughTest(self.config.walkthrough_path)
-            except (FileNotFoundError, ValueError) as e:
-                return TestResult(
-                    exit_code=ExitCode.INVALID_INPUT,
-                    passed=False,
-                    steps_executed=0,
-                    steps_passed=0,
-                    steps_failed=0,
-                    assertions_checked=0,
-                    assertions_passed=0,
-                    assertions_failed=0,
-                    final_state=self.state,
-                    error=str(e),
-                )
+        try:
+            walkthrough = self._load_walkthrough()
+        except (FileNotFoundError, ValueError) as e:
+            return TestResult(
+                exit_code=ExitCode.INVALID_INPUT,
+                passed=False,
+                steps_executed=0,
+                steps_passed=0,
+                steps_failed=0,
+                assertions_checked=0,
+                assertions_passed=0,
+                assertions_failed=0,
+                final_state=self.state,
+                error=str(e),
+            )
 
+        if walkthrough is not None:
             for step in walkthrough.steps:
                 # Skip comments
                 if step.comment is not None:
@@ -301,41 +387,48 @@ class TestRunner:
 
                 # Execute command
                 if step.command:
+                    # Backends report recoverable failures via response.error;
+                    # exceptions are reserved for unexpected failures
+                    step_error: str | None = None
                     try:
                         response = self.backend.send_command(step.command)
-                        self._update_state(response)
-                        if self.on_output:
-                            self.on_output(f"> {step.command}")
-                            self.on_output(response.text)
-
-                        result = StepResult(step=step, output=response.text)
-                        step_results.append(result)
-                        if self.on_step:
-                            self.on_step(result)
-
-                        # Check for game error/crash
-                        if response.state == GameState.ERROR:
-                            return TestResult(
-                                exit_code=ExitCode.GAME_ERROR,
-                                passed=False,
-                                steps_executed=len(step_results),
-                                steps_passed=len([r for r in step_results if r.passed]),
-                                steps_failed=len([r for r in step_results if not r.passed]),
-                                assertions_checked=assertions_checked,
-                                assertions_passed=assertions_passed,
-                                assertions_failed=len(failed_assertions),
-                                failed_assertions=failed_assertions,
-                                step_results=step_results,
-                                final_state=self.state,
-                                error=f"Game error at step {step.line_number}",
-                            )
-
-                        # Check for game over
-                        if response.state == GameState.GAME_OVER:
-                            self.state.game_over = True
+                        step_error = response.error
+                        if step_error is None:
+                            self._update_state(response, step.command)
+                            self._emit_output(f"> {step.command}")
+                            self._emit_output(response.text)
+
+                            result = StepResult(step=step, output=response.text)
+                            step_results.append(result)
+                            if self.on_step:
+                                self.on_step(result)
+
+                            # Check for game error/crash
+                            if response.state == GameState.ERROR:
+                                return TestResult(
+                                    exit_code=ExitCode.GAME_ERROR,
+                                    passed=False,
+                                    steps_executed=len(step_results),
+                                    steps_passed=len([r for r in step_results if r.passed]),
+                                    steps_failed=len([r for r in step_results if not r.passed]),
+                                    assertions_checked=assertions_checked,
+                                    assertions_passed=assertions_passed,
+                                    assertions_failed=len(failed_assertions),
+                                    failed_assertions=failed_assertions,
+                                    step_results=step_results,
+                                    final_state=self.state,
+                                    error=f"Game error at step {step.line_number}",
+                                )
+
+                            # Check for game over
+                            if response.state == GameState.GAME_OVER:
+                                self.state.game_over = True
 
                     except Exception as e:
-                        result = StepResult(step=step, error=str(e))
+                        step_error = str(e)
+
+                    if step_error is not None:
+                        result = StepResult(step=step, error=step_error)
                         step_results.append(result)
                         if self.on_step:
                             self.on_step(result)
@@ -351,7 +444,7 @@ class TestRunner:
                             failed_assertions=failed_assertions,
                             step_results=step_results,
                             final_state=self.state,
-                            error=f"Error at line {step.line_number}: {e}",
+                            error=f"Error at line {step.line_number}: {step_error}",
                         )
 
                 # Check assertion
@@ -407,38 +500,71 @@ class TestRunner:
             final_state=self.state,
         )
 
-    def _update_state(self, response: GameResponse) -> None:
-        """Update test state from game response."""
-        self.state.last_output = response.text
-        self.state.full_transcript.append(response.text)
+    def _load_walkthrough(self) -> WalkthroughTest | None:
+        """Get the configured walkthrough, parsing it from file if needed.
 
-        if response.location:
-            self.state.current_location = response.location
+        Returns:
+            The walkthrough, or None if none is configured.
+
+        Raises:
+            FileNotFoundError: If the walkthrough file doesn't exist.
+            ValueError: If the walkthrough file is invalid.
+        """
+        if self.config.walkthrough is not None:
+            return self.config.walkthrough
+        if self.config.walkthrough_path:
+            return WalkthroughTest(self.config.walkthrough_path)
+        return None
+
+    def _update_state(self, response: GameResponse, command: str | None = None) -> None:
+        """Update test state from game response.
+
+        Args:
+            response: Game response to record.
+            command: Command that produced the response, if any.
+        """
+        state = self.state
+        text = response.text
 
-        if response.state == GameState.GAME_OVER:
-            self.state.game_over = True
+        # Compute new values locally, then assign once
+        location = response.location or state.current_location
+        game_over = state.game_over or response.state == GameState.GAME_OVER
 
         # Try to extract score from output
-        score_match = re.search(r"(?:score[:\s]+|scored?\s+)(\d+)", response.text, re.IGNORECASE)
+        score = state.score
+        score_match = _SCORE_RE.search(text)
         if score_match:
-            self.state.score = int(score_match.group(1))
-
-        self.state.turns += 1
-
-        # Update inventory if this looks like inventory output
-        if "carrying" in response.text.lower() or "inventory" in response.text.lower():
-            # Simple extraction - lines that start with spaces or bullets
-            lines = response.text.split("\n")
-            items = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.lower().startswith(("you", "carrying", "inventory")):
-                    # Clean up common prefixes
-                    line = re.sub(r"^[-*•]\s*", "", line)
-                    line = re.sub(r"^a\s+", "", line, flags=re.IGNORECASE)
-                    line = re.sub(r"^an\s+", "", line, flags=re.IGNORECASE)
-                    line = re.sub(r"^the\s+", "", line, flags=re.IGNORECASE)
-                    if line:
-                        items.append(line)
-            if items:
-                self.state.inventory = items
+            score = int(score_match.group(1))
+
+        state.last_output = text
+        state.current_location = location
+        state.game_over = game_over
+        state.score = score
+        state.turns += 1
+        if self.config.transcript_enabled:
+            state.full_transcript.append(text)
+
+        # Only parse inventory after an inventory command, or when the game
+        # volunteers a listing; most turns skip the parser entirely
+        if (
+            command is not None and command.strip().lower() in _INVENTORY_COMMANDS
+        ) or "You are carrying" in text:
+            self._update_inventory(text)
+
+    def _update_inventory(self, text: str) -> None:
+        """Update inventory from inventory-listing output."""
+        # Simple extraction - lines that start with spaces or bullets
+        lines = text.split("\n")
+        items = []
+        for line in lines:
+            line = line.strip()
+            if line and not line.lower().startswith(("you", "carrying", "inventory")):
+                # Clean up common prefixes
+                line = re.sub(r"^[-*•]\s*", "", line)
+                line = re.sub(r"^a\s+", "", line, flags=re.IGNORECASE)
+                line = re.sub(r"^an\s+", "", line, flags=re.IGNORECASE)
+                line = re.sub(r"^the\s+", "", line, flags=re.IGNORECASE)
+                if line:
+                    items.append(line)
+        if items:
+            self.state.inventory = items
@@ -1,12 +1,20 @@
 """Tests for game backends."""
 
-import tempfile
+import itertools
+import json
+import os
+import subprocess
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
+from gruebot.backends import glulx
 from gruebot.backends.base import (
+    AsyncInterpreterProcess,
+    InterpreterCommunicationError,
     InterpreterProcess,
     InterpreterStartError,
 )
@@ -15,6 +23,59 @@ from gruebot.backends.protocol import GameState
 from gruebot.backends.zmachine import ZMachineBackend
 
 
+class _FakeStdin:
+    """Minimal binary stdin that records writes and flushes."""
+
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+        self.flushes = 0
+
+    def write(self, data: bytes) -> int:
+        self.writes.append(data)
+        return len(data)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+
+class _FakeStdout:
+    """Minimal binary stdout that replays scripted lines, then EOF."""
+
+    def __init__(self, lines: list[bytes] | None = None) -> None:
+        self._lines = iter(lines or [])
+
+    def readline(self) -> bytes:
+        return next(self._lines, b"")
+
+
+@pytest.fixture(scope="session")
+def z5_game(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Empty .z5 file; the mocked backends only check that it exists."""
+    path = tmp_path_factory.mktemp("games") / "fake.z5"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def ulx_game(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Empty .ulx file; the mocked backends only check that it exists."""
+    path = tmp_path_factory.mktemp("games") / "fake.ulx"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def zbackend() -> ZMachineBackend:
+    """Shared Z-machine backend for tests of its pure text helpers."""
+    return ZMachineBackend()
+
+
+@pytest.fixture(scope="module")
+def gbackend() -> GlulxBackend:
+    """Shared Glulx backend for tests of its pure text helpers."""
+    return GlulxBackend()
+
+
 class TestInterpreterProcess:
     """Tests for InterpreterProcess."""
 
@@ -26,41 +87,33 @@ class TestInterpreterProcess:
     @patch("subprocess.Popen")
     def test_start_success(self, mock_popen: MagicMock) -> None:
         """Test successful interpreter start."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.stderr = MagicMock()
+        mock_process = SimpleNamespace(stdin=_FakeStdin(), stdout=_FakeStdout())
         mock_popen.return_value = mock_process
 
         proc = InterpreterProcess.start(["echo", "hello"])
 
         assert proc.process is mock_process
         mock_popen.assert_called_once()
+        assert mock_popen.call_args.kwargs["stderr"] is subprocess.DEVNULL
 
     @patch("subprocess.Popen")
     def test_write_line(self, mock_popen: MagicMock) -> None:
         """Test writing a line to interpreter."""
-        mock_stdin = MagicMock()
-        mock_process = MagicMock()
-        mock_process.stdin = mock_stdin
-        mock_process.stdout = MagicMock()
-        mock_popen.return_value = mock_process
+        fake_stdin = _FakeStdin()
+        mock_popen.return_value = SimpleNamespace(stdin=fake_stdin, stdout=_FakeStdout())
 
         proc = InterpreterProcess.start(["test"])
         proc.write_line("hello world")
 
-        mock_stdin.write.assert_called_with("hello world\n")
-        mock_stdin.flush.assert_called()
+        assert fake_stdin.writes == [b"hello world\n"]
+        assert fake_stdin.flushes == 1
 
     @patch("subprocess.Popen")
     def test_readline(self, mock_popen: MagicMock) -> None:
         """Test reading a line from interpreter."""
-        mock_stdout = MagicMock()
-        mock_stdout.readline.return_value = "response line\n"
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = mock_stdout
-        mock_popen.return_value = mock_process
+        mock_popen.return_value = SimpleNamespace(
+            stdin=_FakeStdin(), stdout=_FakeStdout([b"response line\n"])
+        )
 
         proc = InterpreterProcess.start(["test"])
         line = proc.readline()
@@ -70,32 +123,23 @@ class TestInterpreterProcess:
     @patch("subprocess.Popen")
     def test_is_alive(self, mock_popen: MagicMock) -> None:
         """Test checking if process is alive."""
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = MagicMock()
-        mock_process.poll.return_value = None  # Still running
+        # Still running
+        mock_process = SimpleNamespace(stdin=_FakeStdin(), stdout=_FakeStdout(), returncode=None)
+        mock_process.poll = lambda: mock_process.returncode
         mock_popen.return_value = mock_process
 
         proc = InterpreterProcess.start(["test"])
         assert proc.is_alive is True
 
-        mock_process.poll.return_value = 0  # Exited
+        mock_process.returncode = 0  # Exited
         assert proc.is_alive is False
 
     @patch("subprocess.Popen")
     def test_read_until_prompt(self, mock_popen: MagicMock) -> None:
         """Test reading until prompt character."""
-        mock_stdout = MagicMock()
         # Simulate multi-line output ending with prompt
-        mock_stdout.readline.side_effect = [
-            "Welcome to the game!\n",
-            "You are in a room.\n",
-            ">",
-        ]
-        mock_process = MagicMock()
-        mock_process.stdin = MagicMock()
-        mock_process.stdout = mock_stdout
-        mock_popen.return_value = mock_process
+        fake_stdout = _FakeStdout([b"Welcome to the game!\n", b"You are in a room.\n", b">"])
+        mock_popen.return_value = SimpleNamespace(stdin=_FakeStdin(), stdout=fake_stdout)
 
         proc = InterpreterProcess.start(["test"])
         output = proc.read_until_prompt(">")
@@ -103,6 +147,70 @@ class TestInterpreterProcess:
         assert "Welcome to the game!" in output
         assert "You are in a room." in output
 
+    def test_read_until(self) -> None:
+        """Test reading delimited messages from a real pipe."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as stdout:
+            os.write(write_fd, b'{"a":1}\n\n{"b":2}\n\npartial')
+            os.close(write_fd)
+            proc = InterpreterProcess(
+                process=Mock(spec_set=subprocess.Popen), _stdin=_FakeStdin(), _stdout=stdout
+            )
+
+            assert proc.read_until(b"\n\n") == b'{"a":1}'
+            assert proc.read_until(b"\n\n") == b'{"b":2}'
+            assert proc.read_until(b"\n\n") == b"partial"
+            assert proc.read_until(b"\n\n") is None
+
+    def test_read_until_timeout(self) -> None:
+        """Test read_until gives up when the delimiter never arrives."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as stdout:
+            os.write(write_fd, b'{"a":1}\n\n{"b":')
+            proc = InterpreterProcess(
+                process=Mock(spec_set=subprocess.Popen), _stdin=_FakeStdin(), _stdout=stdout
+            )
+
+            assert proc.read_until(b"\n\n", timeout=0.05) == b'{"a":1}'
+            with pytest.raises(InterpreterCommunicationError, match="Timed out"):
+                proc.read_until(b"\n\n", timeout=0.05)
+
+            # The partial message is kept and completed by later output
+            os.write(write_fd, b"2}\n\n")
+            assert proc.read_until(b"\n\n", timeout=0.05) == b'{"b":2}'
+            os.close(write_fd)
+
+    def test_read_lines(self) -> None:
+        """Test draining a real pipe line by line, including buffered bytes."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(read_fd, "rb") as stdout:
+            os.write(write_fd, b"msg\n\nfirst\nsec")
+            os.write(write_fd, "ond caf\u00e9\nlast".encode())
+            os.close(write_fd)
+            proc = InterpreterProcess(
+                process=Mock(spec_set=subprocess.Popen), _stdin=_FakeStdin(), _stdout=stdout
+            )
+
+            assert proc.read_until(b"\n\n") == b"msg"
+            assert list(proc.read_lines()) == ["first\n", "second caf\u00e9\n", "last"]
+
+    async def test_async_process_round_trip(self) -> None:
+        """Test AsyncInterpreterProcess against a real subprocess."""
+        script = (
+            "import sys\n"
+            "sys.stdout.write('hello\\n\\n')\n"
+            "sys.stdout.flush()\n"
+            "sys.stdout.write(sys.stdin.readline().upper() + '\\n')\n"
+        )
+        proc = await AsyncInterpreterProcess.start([sys.executable, "-c", script])
+        try:
+            assert await proc.read_until(b"\n\n", timeout=5) == b"hello"
+            await proc.write_bytes(b"ping\n")
+            assert await proc.read_until(b"\n\n", timeout=5) == b"PING"
+            assert await proc.read_until(b"\n\n", timeout=5) is None
+        finally:
+            await proc.terminate()
+
 
 class TestZMachineBackend:
     """Tests for ZMachineBackend."""
@@ -134,61 +242,72 @@ class TestZMachineBackend:
             backend.start("/nonexistent/game.z5")
 
     @patch.object(InterpreterProcess, "start")
-    def test_start_success(self, mock_start: MagicMock) -> None:
+    def test_start_success(self, mock_start: MagicMock, z5_game: str) -> None:
         """Test successful game start."""
-        # Create a fake game file
-        with tempfile.NamedTemporaryFile(suffix=".z5", delete=False) as f:
-            game_path = f.name
-
-        try:
-            # Mock the interpreter process
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
-            mock_proc.read_until_prompt.return_value = (
-                "ZORK I: The Great Underground Empire\n"
-                "Copyright (c) 1981, 1982, 1983 Infocom, Inc.\n"
-                "\n"
-                "West of House\n"
-                "You are standing in an open field west of a white house.\n"
-                ">"
-            )
-            mock_start.return_value = mock_proc
-
-            backend = ZMachineBackend()
-            response = backend.start(game_path)
-
-            assert backend.is_running is True
-            assert backend.game_info is not None
-            assert backend.game_info.format == "zmachine"
-            assert "ZORK" in response.text or "West of House" in response.text
-            assert response.state == GameState.WAITING_INPUT
-        finally:
-            Path(game_path).unlink()
+        # Mock the interpreter process
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
+        mock_proc.read_until_prompt.return_value = (
+            "ZORK I: The Great Underground Empire\n"
+            "Copyright (c) 1981, 1982, 1983 Infocom, Inc.\n"
+            "\n"
+            "West of House\n"
+            "You are standing in an open field west of a white house.\n"
+            ">"
+        )
+        mock_start.return_value = mock_proc
 
+        backend = ZMachineBackend()
+        response = backend.start(z5_game)
+
+        assert backend.is_running is True
+        assert backend.game_info is not None
+        assert backend.game_info.format == "zmachine"
+        assert "ZORK" in response.text or "West of House" in response.text
+        assert response.state == GameState.WAITING_INPUT
+
+    @pytest.mark.parametrize(
+        ("output", "command", "expected_text", "expected_state"),
+        [
+            (
+                "You go north.\n\nNorth Room\nYou are in a northern room.\n>",
+                "go north",
+                "north room",
+                GameState.WAITING_INPUT,
+            ),
+            (
+                "*** You have died ***\n\nDo you want to RESTART, RESTORE, or QUIT?\n>",
+                "jump off cliff",
+                "you have died",
+                GameState.GAME_OVER,
+            ),
+        ],
+        ids=["move", "game_over"],
+    )
     @patch.object(InterpreterProcess, "start")
-    def test_send_command(self, mock_start: MagicMock) -> None:
-        """Test sending a command."""
-        with tempfile.NamedTemporaryFile(suffix=".z5", delete=False) as f:
-            game_path = f.name
-
-        try:
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
-            mock_proc.read_until_prompt.side_effect = [
-                "Welcome!\n>",  # Intro
-                "You go north.\n\nNorth Room\nYou are in a northern room.\n>",  # After command
-            ]
-            mock_start.return_value = mock_proc
+    def test_send_command(
+        self,
+        mock_start: MagicMock,
+        z5_game: str,
+        output: str,
+        command: str,
+        expected_text: str,
+        expected_state: GameState,
+    ) -> None:
+        """Test sending a command and detecting the resulting state."""
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
+        mock_proc.read_until_prompt.side_effect = ["Welcome!\n>", output]
+        mock_start.return_value = mock_proc
 
-            backend = ZMachineBackend()
-            backend.start(game_path)
+        backend = ZMachineBackend()
+        backend.start(z5_game)
 
-            response = backend.send_command("go north")
+        response = backend.send_command(command)
 
-            assert "north" in response.text.lower()
-            mock_proc.write_line.assert_called_with("go north")
-        finally:
-            Path(game_path).unlink()
+        assert expected_text in response.text.lower()
+        assert response.state == expected_state
+        mock_proc.write_line.assert_called_with(command)
 
     def test_send_command_not_running(self) -> None:
         """Test sending command when no game running."""
@@ -198,123 +317,106 @@ class TestZMachineBackend:
             backend.send_command("look")
 
     @patch.object(InterpreterProcess, "start")
-    def test_detect_game_over(self, mock_start: MagicMock) -> None:
-        """Test detection of game over state."""
-        with tempfile.NamedTemporaryFile(suffix=".z5", delete=False) as f:
-            game_path = f.name
-
-        try:
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
-            mock_proc.read_until_prompt.side_effect = [
-                "Welcome!\n>",  # Intro
-                "*** You have died ***\n\nDo you want to RESTART, RESTORE, or QUIT?\n>",
-            ]
-            mock_start.return_value = mock_proc
-
-            backend = ZMachineBackend()
-            backend.start(game_path)
-
-            response = backend.send_command("jump off cliff")
-
-            assert response.state == GameState.GAME_OVER
-        finally:
-            Path(game_path).unlink()
-
-    @patch.object(InterpreterProcess, "start")
-    def test_quit(self, mock_start: MagicMock) -> None:
+    def test_quit(self, mock_start: MagicMock, z5_game: str) -> None:
         """Test quitting the game."""
-        with tempfile.NamedTemporaryFile(suffix=".z5", delete=False) as f:
-            game_path = f.name
-
-        try:
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
-            mock_proc.read_until_prompt.return_value = "Welcome!\n>"
-            mock_start.return_value = mock_proc
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
+        mock_proc.read_until_prompt.return_value = "Welcome!\n>"
+        mock_start.return_value = mock_proc
 
-            backend = ZMachineBackend()
-            backend.start(game_path)
+        backend = ZMachineBackend()
+        backend.start(z5_game)
 
-            assert backend.is_running is True
+        assert backend.is_running is True
 
-            # Make is_alive return False after quit
-            mock_proc.is_alive = False
-            backend.quit()
+        # Make is_alive return False after quit
+        mock_proc.is_alive = False
+        backend.quit()
 
-            mock_proc.terminate.assert_called_once()
-        finally:
-            Path(game_path).unlink()
+        mock_proc.terminate.assert_called_once()
 
 
 class TestZMachineBackendTextExtraction:
     """Tests for text extraction methods."""
 
-    def test_extract_location_simple(self) -> None:
-        """Test extracting simple location."""
-        backend = ZMachineBackend()
-
-        text = "West of House\nYou are standing in an open field."
-        location = backend._extract_location(text)
-
-        assert location == "West of House"
-
-    def test_extract_location_skip_description(self) -> None:
-        """Test that descriptions are not extracted as locations."""
-        backend = ZMachineBackend()
-
-        text = "This is a very long line that describes something, with commas.\nActual Location\nMore text."
-        location = backend._extract_location(text)
-
-        assert location == "Actual Location"
-
-    def test_extract_title(self) -> None:
-        """Test extracting game title."""
-        backend = ZMachineBackend()
-
-        intro = "ZORK I: The Great Underground Empire\nCopyright (c) 1981 Infocom"
-        title = backend._extract_title(intro)
-
-        assert title == "ZORK I: The Great Underground Empire"
-
-    def test_extract_author(self) -> None:
-        """Test extracting author."""
-        backend = ZMachineBackend()
-
-        intro = "Adventure Game\nby John Smith\nRelease 1"
-        author = backend._extract_author(intro)
-
-        assert author == "John Smith"
-
-    def test_extract_author_copyright(self) -> None:
-        """Test extracting author from copyright notice."""
-        backend = ZMachineBackend()
-
-        intro = "Game Title\nCopyright 1984 by Jane Doe"
-        author = backend._extract_author(intro)
-
-        assert "Jane Doe" in author
-
-    def test_clean_output(self) -> None:
-        """Test output cleaning."""
-        backend = ZMachineBackend()
-
-        raw = "Line 1\n\n\nLine 2\n\nLine 3\n  >"
-        cleaned = backend._clean_output(raw)
-
-        assert cleaned == "Line 1\n\nLine 2\n\nLine 3"
-        assert ">" not in cleaned
-
+    @pytest.mark.parametrize(
+        ("method_name", "text", "expected"),
+        [
+            pytest.param(
+                "_extract_location",
+                "West of House\nYou are standing in an open field.",
+                "West of House",
+                id="location_simple",
+            ),
+            pytest.param(
+                "_extract_location",
+                "This is a very long line that describes something, with commas."
+                "\nActual Location\nMore text.",
+                "Actual Location",
+                id="location_skip_description",
+            ),
+            pytest.param(
+                "_extract_title",
+                "ZORK I: The Great Underground Empire\nCopyright (c) 1981 Infocom",
+                "ZORK I: The Great Underground Empire",
+                id="title",
+            ),
+            pytest.param(
+                "_extract_author",
+                "Adventure Game\nby John Smith\nRelease 1",
+                "John Smith",
+                id="author",
+            ),
+            pytest.param(
+                "_extract_author",
+                "Game Title\nCopyright 1984 by Jane Doe",
+                "Jane Doe",
+                id="author_copyright",
+            ),
+            pytest.param(
+                "_clean_output",
+                "Line 1\n\n\nLine 2\n\nLine 3\n  >",
+                "Line 1\n\nLine 2\n\nLine 3",
+                id="clean_output",
+            ),
+        ],
+    )
+    def test_extract(
+        self, zbackend: ZMachineBackend, method_name: str, text: str, expected: str
+    ) -> None:
+        """Test each text helper against a sample of game output."""
+        assert getattr(zbackend, method_name)(text) == expected
+
+
+def _json_to_messages(json_str: str) -> list[bytes]:
+    """Convert remglk output to the messages returned by read_until.
+
+    remglk outputs each JSON message followed by a blank line.
+    """
+    return [message.encode() for message in json_str.split("\n\n") if message]
 
-def _json_to_lines(json_str: str) -> list[str]:
-    """Convert JSON string to list of lines for readline mock.
 
-    remglk outputs each JSON message as a single line followed by blank line.
-    """
-    lines = []
-    for line in json_str.split("\n"):
-        lines.append(line + "\n" if line else "\n")
-    return lines
+# Shared remglk updates: the intro, a move response, and a game over.
+# Mock iterates a list side_effect without consuming it, so these are reusable.
+_INTRO_MESSAGES = _json_to_messages(
+    '{"type":"update","gen":1,"windows":['
+    '{"id":22,"type":"buffer"}],'
+    '"content":[{"id":22,"text":[{"content":["Welcome!"]}]}],'
+    '"input":[{"id":22,"gen":1,"type":"line","maxlen":256}]}\n\n'
+)
+_RESPONSE_MESSAGES = _json_to_messages(
+    '{"type":"update","gen":2,"windows":['
+    '{"id":22,"type":"buffer"}],'
+    '"content":[{"id":22,"text":[{"content":["You go north.\\n"]},'
+    '{"content":["North Room\\nYou are in a northern room."]}]}],'
+    '"input":[{"id":22,"gen":2,"type":"line","maxlen":256}]}\n\n'
+)
+_GAME_OVER_MESSAGES = _json_to_messages(
+    '{"type":"update","gen":2,"windows":['
+    '{"id":22,"type":"buffer"}],'
+    '"content":[{"id":22,"text":[{"content":["*** You have died ***"]}]}],'
+    '"exit":true}\n\n'
+)
 
 
 class TestGlulxBackend:
@@ -353,82 +455,138 @@ class TestGlulxBackend:
             backend.start("/nonexistent/game.ulx")
 
     @patch.object(InterpreterProcess, "start")
-    def test_start_success(self, mock_start: MagicMock) -> None:
+    def test_start_success(self, mock_start: MagicMock, ulx_game: str) -> None:
         """Test successful game start."""
-        with tempfile.NamedTemporaryFile(suffix=".ulx", delete=False) as f:
-            game_path = f.name
-
-        try:
-            # Mock the interpreter process with JSON output
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
-
-            # Simulate remglk JSON output (single line followed by blank line)
-            json_output = (
-                '{"type":"update","gen":1,"windows":['
-                '{"id":25,"type":"grid","rock":202,"gridwidth":80,"gridheight":1},'
-                '{"id":22,"type":"buffer","rock":201}'
-                '],"content":['
-                '{"id":25,"lines":[{"content":["West of House"]}]},'
-                '{"id":22,"text":[{"content":["Welcome to Adventure!\\n"]},'
-                '{"content":["You are standing in an open field west of a white house."]}]}'
-                '],"input":[{"id":22,"gen":1,"type":"line","maxlen":256}]}\n\n'
-            )
-
-            mock_proc.readline.side_effect = _json_to_lines(json_output)
-            mock_start.return_value = mock_proc
-
-            backend = GlulxBackend()
-            response = backend.start(game_path)
+        # Mock the interpreter process with JSON output
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
+
+        # Simulate remglk JSON output (single line followed by blank line)
+        json_output = (
+            '{"type":"update","gen":1,"windows":['
+            '{"id":25,"type":"grid","rock":202,"gridwidth":80,"gridheight":1},'
+            '{"id":22,"type":"buffer","rock":201}'
+            '],"content":['
+            '{"id":25,"lines":[{"content":["West of House"]}]},'
+            '{"id":22,"text":[{"content":["Welcome to Adventure!\\n"]},'
+            '{"content":["You are standing in an open field west of a white house."]}]}'
+            '],"input":[{"id":22,"gen":1,"type":"line","maxlen":256}]}\n\n'
+        )
 
-            assert backend.is_running is True
-            assert backend.game_info is not None
-            assert backend.game_info.format == "glulx"
-            assert response.state == GameState.WAITING_INPUT
-        finally:
-            Path(game_path).unlink()
+        mock_proc.read_until.side_effect = _json_to_messages(json_output)
+        mock_start.return_value = mock_proc
 
+        backend = GlulxBackend()
+        response = backend.start(ulx_game)
+
+        assert backend.is_running is True
+        assert backend.game_info is not None
+        assert backend.game_info.format == "glulx"
+        assert response.state == GameState.WAITING_INPUT
+
+    @pytest.mark.parametrize(
+        ("messages", "command", "expected_text", "expected_state"),
+        [
+            (_RESPONSE_MESSAGES, "go north", "north room", GameState.WAITING_INPUT),
+            (_GAME_OVER_MESSAGES, "jump off cliff", "you have died", GameState.GAME_OVER),
+        ],
+        ids=["move", "game_over"],
+    )
     @patch.object(InterpreterProcess, "start")
-    def test_send_command(self, mock_start: MagicMock) -> None:
-        """Test sending a command."""
-        with tempfile.NamedTemporaryFile(suffix=".ulx", delete=False) as f:
-            game_path = f.name
+    def test_send_command(
+        self,
+        mock_start: MagicMock,
+        ulx_game: str,
+        messages: list[bytes],
+        command: str,
+        expected_text: str,
+        expected_state: GameState,
+    ) -> None:
+        """Test sending a command and detecting the resulting state."""
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
+        mock_proc.read_until.side_effect = itertools.chain(_INTRO_MESSAGES, messages)
+        mock_start.return_value = mock_proc
 
-        try:
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
+        backend = GlulxBackend()
+        backend.start(ulx_game)
+
+        response = backend.send_command(command)
+
+        assert expected_text in response.text.lower()
+        assert response.state == expected_state
+        # Check that the line input was sent as JSON
+        sent = mock_proc.write_bytes.call_args.args[0]
+        assert json.loads(sent) == {
+            "type": "line",
+            "gen": 1,
+            "window": 22,
+            "value": command,
+        }
 
-            # Initial output
-            intro_json = (
-                '{"type":"update","gen":1,"windows":['
-                '{"id":22,"type":"buffer"}],'
+    @patch.object(AsyncInterpreterProcess, "start")
+    async def test_send_command_async(self, mock_start: MagicMock, ulx_game: str) -> None:
+        """Test starting a game and sending a command on the event loop."""
+        mock_proc = Mock(spec_set=AsyncInterpreterProcess)
+        mock_proc.is_alive = True
+        mock_proc.write_bytes = AsyncMock()
+        mock_proc.terminate = AsyncMock()
+        mock_proc.read_until = AsyncMock(
+            side_effect=_json_to_messages(
+                '{"type":"update","gen":1,"windows":[{"id":22,"type":"buffer"}],'
                 '"content":[{"id":22,"text":[{"content":["Welcome!"]}]}],'
-                '"input":[{"id":22,"gen":1,"type":"line","maxlen":256}]}\n\n'
+                '"input":[{"id":22,"gen":1,"type":"line"}]}\n\n'
+                '{"type":"update","gen":2,'
+                '"content":[{"id":22,"text":[{"content":["You go north."]}]}],'
+                '"input":[{"id":22,"gen":2,"type":"line"}]}\n\n'
             )
+        )
+        mock_start.return_value = mock_proc
 
-            # Response after command
-            response_json = (
-                '{"type":"update","gen":2,"windows":['
-                '{"id":22,"type":"buffer"}],'
-                '"content":[{"id":22,"text":[{"content":["You go north.\\n"]},'
-                '{"content":["North Room\\nYou are in a northern room."]}]}],'
-                '"input":[{"id":22,"gen":2,"type":"line","maxlen":256}]}\n\n'
-            )
+        backend = GlulxBackend()
+        intro = await backend.start_async(ulx_game)
+        response = await backend.send_command_async("go north")
+
+        assert intro.text == "Welcome!"
+        assert response.text == "You go north."
+        assert backend.is_running is True
+        sent = mock_proc.write_bytes.call_args.args[0]
+        assert json.loads(sent)["value"] == "go north"
+
+        mock_proc.read_until.side_effect = [None]
+        await backend.quit_async()
+        mock_proc.terminate.assert_awaited_once()
+        assert backend.is_running is False
 
-            # Set up readline to return lines
-            all_output = intro_json + response_json
-            mock_proc.readline.side_effect = _json_to_lines(all_output)
-            mock_start.return_value = mock_proc
+    @patch.object(InterpreterProcess, "start")
+    def test_save(self, mock_start: MagicMock, ulx_game: str, tmp_path: Path) -> None:
+        """Test saving answers the file prompt and checks the confirmation."""
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
+        intro = (
+            '{"type":"update","gen":1,"windows":[{"id":22,"type":"buffer"}],'
+            '"content":[{"id":22,"text":[{"content":["Welcome!"]}]}],'
+            '"input":[{"id":22,"gen":1,"type":"line"}]}\n\n'
+        )
+        prompt = '{"type":"update","gen":2,"specialinput":{"type":"fileref_prompt"}}\n\n'
 
-            backend = GlulxBackend()
-            backend.start(game_path)
+        def confirm(text: str) -> str:
+            return (
+                '{"type":"update","gen":3,'
+                f'"content":[{{"id":22,"text":[{{"content":["{text}"]}}]}}],'
+                '"input":[{"id":22,"gen":3,"type":"line"}]}\n\n'
+            )
 
-            response = backend.send_command("go north")
+        mock_proc.read_until.side_effect = _json_to_messages(
+            intro + prompt + confirm("Ok.") + prompt + confirm("You look booked.")
+        )
+        mock_start.return_value = mock_proc
 
-            assert "north" in response.text.lower()
-            mock_proc.write.assert_called()  # Check that JSON was sent
-        finally:
-            Path(game_path).unlink()
+        backend = GlulxBackend(save_directory=tmp_path)
+        backend.start(ulx_game)
+
+        assert backend.save("slot1") is True
+        assert backend.save("slot1") is False
 
     def test_send_command_not_running(self) -> None:
         """Test sending command when no game running."""
@@ -438,84 +596,53 @@ class TestGlulxBackend:
             backend.send_command("look")
 
     @patch.object(InterpreterProcess, "start")
-    def test_detect_game_over(self, mock_start: MagicMock) -> None:
-        """Test detection of game over state."""
-        with tempfile.NamedTemporaryFile(suffix=".ulx", delete=False) as f:
-            game_path = f.name
+    def test_send_command_rejected(self, mock_start: MagicMock, ulx_game: str) -> None:
+        """Test that a remglk error message is reported on the response."""
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
 
-        try:
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
+        error_json = '{"type":"error","message":"Wrong generation number"}\n\n'
 
-            # Initial output
-            intro_json = (
-                '{"type":"update","gen":1,"windows":['
-                '{"id":22,"type":"buffer"}],'
-                '"content":[{"id":22,"text":[{"content":["Welcome!"]}]}],'
-                '"input":[{"id":22,"gen":1,"type":"line","maxlen":256}]}\n\n'
-            )
-
-            # Game over response (with exit flag)
-            game_over_json = (
-                '{"type":"update","gen":2,"windows":['
-                '{"id":22,"type":"buffer"}],'
-                '"content":[{"id":22,"text":[{"content":["*** You have died ***"]}]}],'
-                '"exit":true}\n\n'
-            )
-
-            all_output = intro_json + game_over_json
-            mock_proc.readline.side_effect = _json_to_lines(all_output)
-            mock_start.return_value = mock_proc
+        mock_proc.read_until.side_effect = itertools.chain(
+            _INTRO_MESSAGES, _json_to_messages(error_json)
+        )
+        mock_start.return_value = mock_proc
 
-            backend = GlulxBackend()
-            backend.start(game_path)
+        backend = GlulxBackend()
+        backend.start(ulx_game)
 
-            response = backend.send_command("jump off cliff")
+        response = backend.send_command("look")
 
-            assert response.state == GameState.GAME_OVER
-        finally:
-            Path(game_path).unlink()
+        assert response.error == "Wrong generation number"
+        assert response.state == GameState.WAITING_INPUT
+        # Input window is still valid after an error message
+        assert backend._input_window == 22
 
     @patch.object(InterpreterProcess, "start")
-    def test_quit(self, mock_start: MagicMock) -> None:
+    def test_quit(self, mock_start: MagicMock, ulx_game: str) -> None:
         """Test quitting the game."""
-        with tempfile.NamedTemporaryFile(suffix=".ulx", delete=False) as f:
-            game_path = f.name
-
-        try:
-            mock_proc = MagicMock()
-            mock_proc.is_alive = True
-
-            intro_json = (
-                '{"type":"update","gen":1,"windows":['
-                '{"id":22,"type":"buffer"}],'
-                '"content":[{"id":22,"text":[{"content":["Welcome!"]}]}],'
-                '"input":[{"id":22,"gen":1,"type":"line","maxlen":256}]}\n\n'
-            )
+        mock_proc = Mock(spec_set=InterpreterProcess)
+        mock_proc.is_alive = True
 
-            mock_proc.readline.side_effect = _json_to_lines(intro_json)
-            mock_start.return_value = mock_proc
+        mock_proc.read_until.side_effect = _INTRO_MESSAGES
+        mock_start.return_value = mock_proc
 
-            backend = GlulxBackend()
-            backend.start(game_path)
+        backend = GlulxBackend()
+        backend.start(ulx_game)
 
-            assert backend.is_running is True
+        assert backend.is_running is True
 
-            mock_proc.is_alive = False
-            backend.quit()
+        mock_proc.is_alive = False
+        backend.quit()
 
-            mock_proc.terminate.assert_called_once()
-        finally:
-            Path(game_path).unlink()
+        mock_proc.terminate.assert_called_once()
 
 
 class TestGlulxBackendTextExtraction:
     """Tests for Glulx text extraction methods."""
 
-    def test_extract_text_from_buffer(self) -> None:
+    def test_extract_text_from_buffer(self, gbackend: GlulxBackend) -> None:
         """Test extracting text from buffer window."""
-        backend = GlulxBackend()
-
         update = {
             "windows": [{"id": 22, "type": "buffer"}],
             "content": [
@@ -529,15 +656,13 @@ class TestGlulxBackendTextExtraction:
             ],
         }
 
-        text = backend._extract_text(update)
+        text = gbackend._extract_text(update)
 
         assert "Line 1" in text
         assert "Line 2" in text
 
-    def test_extract_location_from_grid(self) -> None:
+    def test_extract_location_from_grid(self, gbackend: GlulxBackend) -> None:
         """Test extracting location from grid window."""
-        backend = GlulxBackend()
-
         update = {
             "windows": [
                 {"id": 25, "type": "grid"},
@@ -551,60 +676,102 @@ class TestGlulxBackendTextExtraction:
             ],
         }
 
-        location = backend._extract_location_from_update(update)
+        location = gbackend._extract_location_from_update(update)
 
         assert location == "West of House"
 
-    def test_detect_game_state_exit_flag(self) -> None:
-        """Test game over detection via exit flag."""
-        backend = GlulxBackend()
+    def test_scan_content_text_and_location(self, gbackend: GlulxBackend) -> None:
+        """Test extracting text and location in a single pass."""
+        update = {
+            "windows": [
+                {"id": 25, "type": "grid"},
+                {"id": 22, "type": "buffer"},
+            ],
+            "content": [
+                {"id": 25, "lines": [{"content": ["Kitchen    Score: 10"]}]},
+                {"id": 22, "text": [{"content": ["You are in the kitchen."]}]},
+            ],
+        }
+
+        text, location = gbackend._scan_content(update)
 
+        assert text == "You are in the kitchen."
+        assert location == "Kitchen"
+
+    def test_detect_game_state_exit_flag(self, gbackend: GlulxBackend) -> None:
+        """Test game over detection via exit flag."""
         update = {"exit": True}
-        state = backend._detect_game_state_from_update(update, "")
+        state = gbackend._detect_game_state_from_update(update, "")
 
         assert state == GameState.GAME_OVER
 
-    def test_detect_game_state_no_input(self) -> None:
+    def test_detect_game_state_no_input(self, gbackend: GlulxBackend) -> None:
         """Test game over detection when no input requested."""
-        backend = GlulxBackend()
-
         update = {"input": []}
-        state = backend._detect_game_state_from_update(update, "")
+        state = gbackend._detect_game_state_from_update(update, "")
 
         assert state == GameState.GAME_OVER
 
-    def test_detect_game_state_pattern(self) -> None:
+    def test_detect_game_state_pattern(self, gbackend: GlulxBackend) -> None:
         """Test game over detection via text pattern."""
-        backend = GlulxBackend()
-
         update = {"input": [{"id": 22, "type": "line"}]}
-        state = backend._detect_game_state_from_update(update, "*** You have died ***")
+        state = gbackend._detect_game_state_from_update(update, "*** You have died ***")
 
         assert state == GameState.GAME_OVER
 
-    def test_clean_text(self) -> None:
-        """Test text cleaning."""
-        backend = GlulxBackend()
+    def test_detect_game_state_prompt_pattern(self, gbackend: GlulxBackend) -> None:
+        """Test game over detection via a restart prompt without asterisks."""
+        update = {"input": [{"id": 22, "type": "line"}]}
+        prompt = "Would you like to RESTART, RESTORE a saved game or QUIT?"
+
+        assert gbackend._detect_game_state_from_update(update, prompt) == GameState.GAME_OVER
+        assert (
+            gbackend._detect_game_state_from_update(update, "You can quit anytime.")
+            == GameState.WAITING_INPUT
+        )
+
+    def test_json_helpers_without_orjson(self) -> None:
+        """Test JSON helpers fall back to the stdlib json module."""
+        msg = {"type": "line", "gen": 3, "value": "look"}
+
+        with patch.object(glulx, "orjson", None):
+            encoded = glulx._dumps(msg)
+            decoded = glulx._loads(encoded)
 
+        assert decoded == msg
+        assert glulx._loads(glulx._dumps(msg)) == msg
+
+    def test_clean_text(self, gbackend: GlulxBackend) -> None:
+        """Test text cleaning."""
         raw = "Line 1\n\n\nLine 2\n\nLine 3"
-        cleaned = backend._clean_text(raw)
+        cleaned = gbackend._clean_text(raw)
 
         assert cleaned == "Line 1\n\nLine 2\n\nLine 3"
 
-    def test_extract_title(self) -> None:
-        """Test extracting game title."""
-        backend = GlulxBackend()
+    def test_clean_text_whitespace_blank_lines(self, gbackend: GlulxBackend) -> None:
+        """Test CRLF and whitespace-only lines count as blank lines."""
+        raw = "Line 1\r\n  \r\n\t\n\nLine 2\r\n  indented"
+        cleaned = gbackend._clean_text(raw)
+
+        assert cleaned == "Line 1\n\nLine 2\n  indented"
 
+    def test_extract_title(self, gbackend: GlulxBackend) -> None:
+        """Test extracting game title."""
         intro = "Anchorhead\nby Michael Gentry\nRelease 5"
-        title = backend._extract_title(intro)
+        title = gbackend._extract_title(intro)
 
         assert title == "Anchorhead"
 
-    def test_extract_author(self) -> None:
+    def test_extract_author(self, gbackend: GlulxBackend) -> None:
         """Test extracting author."""
-        backend = GlulxBackend()
-
         intro = "Adventure Game\nby John Smith\nRelease 1"
-        author = backend._extract_author(intro)
+        author = gbackend._extract_author(intro)
 
         assert author == "John Smith"
+
+    def test_extract_author_ignores_text_after_header(self, gbackend: GlulxBackend) -> None:
+        """Test author search is limited to the intro banner."""
+        intro = "Adventure Game\n" + "It is dark.\n" * 300 + "Painted by Rembrandt"
+        author = gbackend._extract_author(intro)
+
+        assert author is None
@@ -1,7 +1,7 @@
 """Tests for configuration loading."""
 
-import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -28,6 +28,7 @@ class TestConfig:
         assert config.llm.model == "claude-sonnet-4-20250514"
         assert config.llm.max_tokens == 1024
         assert config.llm.temperature == 0.7
+        assert config.llm.response_cache_size == 0
 
     def test_memory_config_defaults(self) -> None:
         """Test memory config defaults."""
@@ -58,9 +59,12 @@ class TestLoadConfig:
 
     def test_load_config_no_file(self) -> None:
         """Test loading config without a file."""
-        config = load_config()
+        with patch.object(Path, "exists") as mock_exists:
+            config = load_config()
 
         assert config.game_path is None
+        # No default config locations are probed
+        mock_exists.assert_not_called()
 
     def test_load_config_with_game_path(self) -> None:
         """Test loading config with game path override."""
@@ -69,7 +73,7 @@ class TestLoadConfig:
 
         assert config.game_path == game_path
 
-    def test_load_config_from_yaml(self) -> None:
+    def test_load_config_from_yaml(self, tmp_path: Path) -> None:
         """Test loading config from YAML file."""
         config_data = {
             "game_path": "/path/to/game.z8",
@@ -83,52 +87,54 @@ class TestLoadConfig:
             },
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump(config_data), encoding="utf-8")
 
-        try:
-            config = load_config(config_path=config_path)
+        config = load_config(config_path=config_path)
 
-            assert config.game_path == Path("/path/to/game.z8")
-            assert config.llm.backend == "claude_cli"
-            assert config.llm.model == "claude-3-opus"
-            assert config.llm.temperature == 0.5
-            assert config.memory.max_recent_turns == 30
-            # Other values should be defaults
-            assert config.memory.summarize_threshold == 15
-        finally:
-            config_path.unlink()
+        assert config.game_path == Path("/path/to/game.z8")
+        assert config.llm.backend == "claude_cli"
+        assert config.llm.model == "claude-3-opus"
+        assert config.llm.temperature == 0.5
+        assert config.memory.max_recent_turns == 30
+        # Other values should be defaults
+        assert config.memory.summarize_threshold == 15
 
     def test_load_config_game_path_override(self) -> None:
-        """Test that game_path argument overrides config file."""
+        """Test that game_path argument overrides config data."""
         config_data = {
             "game_path": "/config/game.z5",
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            config_path = Path(f.name)
+        override_path = Path("/override/game.z8")
+        config = load_config(config_dict=config_data, game_path=override_path)
+
+        assert config.game_path == override_path
+        # The caller's dict is left untouched
+        assert config_data == {"game_path": "/config/game.z5"}
 
-        try:
-            override_path = Path("/override/game.z8")
-            config = load_config(config_path=config_path, game_path=override_path)
+    def test_load_config_from_dict(self) -> None:
+        """Test loading config from an in-memory dict."""
+        config = load_config(
+            config_dict={
+                "llm": {"backend": "claude_cli"},
+                "memory": {"max_recent_turns": 30},
+            }
+        )
 
-            assert config.game_path == override_path
-        finally:
-            config_path.unlink()
+        assert config.llm.backend == "claude_cli"
+        assert config.memory.max_recent_turns == 30
+        assert config.memory.summarize_threshold == 15
 
 
 class TestLLMConfig:
     """Tests for LLMConfig model."""
 
-    def test_valid_backends(self) -> None:
+    @pytest.mark.parametrize("backend", ["anthropic_api", "claude_cli"])
+    def test_valid_backends(self, backend: str) -> None:
         """Test valid LLM backend values."""
-        config1 = LLMConfig(backend="anthropic_api")
-        assert config1.backend == "anthropic_api"
-
-        config2 = LLMConfig(backend="claude_cli")
-        assert config2.backend == "claude_cli"
+        config = LLMConfig(backend=backend)  # type: ignore[arg-type]
+        assert config.backend == backend
 
     def test_invalid_backend(self) -> None:
         """Test invalid LLM backend raises error."""
@@ -139,11 +145,11 @@ class TestLLMConfig:
 class TestGameConfig:
     """Tests for GameConfig model."""
 
-    def test_valid_backends(self) -> None:
+    @pytest.mark.parametrize("backend", ["auto", "zmachine", "glulx"])
+    def test_valid_backends(self, backend: str) -> None:
         """Test valid game backend values."""
-        for backend in ["auto", "zmachine", "glulx"]:
-            config = GameConfig(backend=backend)  # type: ignore[arg-type]
-            assert config.backend == backend
+        config = GameConfig(backend=backend)  # type: ignore[arg-type]
+        assert config.backend == backend
 
     def test_invalid_backend(self) -> None:
         """Test invalid game backend raises error."""
@@ -1,9 +1,12 @@
 """Tests for LLM interfaces."""
 
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from gruebot.llm import anthropic_api, claude_cli
 from gruebot.llm.anthropic_api import AnthropicAPIBackend
 from gruebot.llm.claude_cli import (
     ClaudeCLIBackend,
@@ -11,6 +14,7 @@ from gruebot.llm.claude_cli import (
     ClaudeCLIError,
 )
 from gruebot.llm.prompts import (
+    SYSTEM_PROMPT,
     format_game_output,
     get_summarization_prompt,
     get_system_prompt,
@@ -42,6 +46,11 @@ class TestPrompts:
 
         assert "brass lantern" in prompt
 
+    def test_get_system_prompt_memoized(self) -> None:
+        """Test repeated calls reuse the same prompt string."""
+        assert get_system_prompt() is SYSTEM_PROMPT
+        assert get_system_prompt(game_title="Zork I") is get_system_prompt(game_title="Zork I")
+
     def test_get_summarization_prompt(self) -> None:
         """Test summarization prompt generation."""
         prompt = get_summarization_prompt()
@@ -54,76 +63,88 @@ class TestPrompts:
         prompt = get_summarization_prompt(previous_summary="Player is in the kitchen.")
 
         assert "kitchen" in prompt
+        assert get_summarization_prompt(previous_summary="Player is in the kitchen.") is prompt
 
 
-class TestParseResponse:
-    """Tests for response parsing."""
-
-    def test_parse_with_command_prefix(self) -> None:
-        """Test parsing response with COMMAND: prefix."""
-        text = """I see a door to the north. Let me try going that way.
-
-COMMAND: go north"""
-
-        result = parse_response(text)
-
-        assert result.command == "go north"
-        assert result.reasoning == "I see a door to the north. Let me try going that way."
-        assert result.is_meta is False
-
-    def test_parse_command_case_insensitive(self) -> None:
-        """Test that COMMAND prefix is case insensitive."""
-        text = "command: look around"
-        result = parse_response(text)
-
-        assert result.command == "look around"
-
-    def test_parse_meta_command(self) -> None:
-        """Test parsing meta commands (save/restore/quit)."""
-        text = "I should save my progress.\n\nCOMMAND: save"
-        result = parse_response(text)
-
-        assert result.command == "save"
-        assert result.is_meta is True
-
-    def test_parse_fallback_last_line(self) -> None:
-        """Test fallback parsing from last line."""
-        text = "I should examine the table.\nexamine table"
-        result = parse_response(text)
-
-        assert result.command == "examine table"
-
-    def test_parse_no_command(self) -> None:
-        """Test parsing when no command found."""
-        text = "I'm not sure what to do next. The room is confusing."
-        result = parse_response(text)
-
-        assert result.command is None
-        assert result.reasoning == text
-
-    def test_parse_empty_response(self) -> None:
-        """Test parsing empty response."""
-        result = parse_response("")
-
-        assert result.command is None
-        assert result.reasoning is None
-
-    def test_parse_multiline_reasoning(self) -> None:
-        """Test parsing with multiline reasoning."""
-        text = """Looking around the room, I notice several things:
+_MULTILINE_REASONING = """Looking around the room, I notice several things:
 1. A brass lantern on the table
 2. A small key in the corner
 3. A door leading north
 
-I should take the lantern first.
+I should take the lantern first."""
 
-COMMAND: take lantern"""
 
+class TestParseResponse:
+    """Tests for response parsing."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected_command", "expected_is_meta", "expected_reasoning"),
+        [
+            pytest.param(
+                "I see a door to the north. Let me try going that way.\n\nCOMMAND: go north",
+                "go north",
+                False,
+                "I see a door to the north. Let me try going that way.",
+                id="command_prefix",
+            ),
+            pytest.param(
+                "command: look around",
+                "look around",
+                False,
+                None,
+                id="case_insensitive",
+            ),
+            pytest.param(
+                "Maybe use COMMAND: wait\nCoMmAnD: open door",
+                "open door",
+                False,
+                "Maybe use COMMAND: wait",
+                id="line_start_only",
+            ),
+            pytest.param(
+                "I should save my progress.\n\nCOMMAND: save",
+                "save",
+                True,
+                "I should save my progress.",
+                id="meta_command",
+            ),
+            pytest.param(
+                "I should examine the table.\nexamine table",
+                "examine table",
+                False,
+                "I should examine the table.",
+                id="fallback_last_line",
+            ),
+            pytest.param(
+                "I'm not sure what to do next. The room is confusing.",
+                None,
+                False,
+                "I'm not sure what to do next. The room is confusing.",
+                id="no_command",
+            ),
+            pytest.param("", None, False, None, id="empty"),
+            pytest.param(
+                _MULTILINE_REASONING + "\n\nCOMMAND: take lantern",
+                "take lantern",
+                False,
+                _MULTILINE_REASONING,
+                id="multiline_reasoning",
+            ),
+        ],
+    )
+    def test_parse_response(
+        self,
+        text: str,
+        expected_command: str | None,
+        expected_is_meta: bool,
+        expected_reasoning: str | None,
+    ) -> None:
+        """Test command, meta flag and reasoning extraction."""
         result = parse_response(text)
 
-        assert result.command == "take lantern"
-        assert "brass lantern" in result.reasoning
-        assert "small key" in result.reasoning
+        assert result.command == expected_command
+        assert result.is_meta is expected_is_meta
+        assert result.reasoning == expected_reasoning
 
 
 class TestFormatGameOutput:
@@ -164,13 +185,33 @@ class TestFormatGameOutput:
 class TestAnthropicAPIBackend:
     """Tests for Anthropic API backend."""
 
-    def test_init_default(self) -> None:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def api_backend(cls) -> AnthropicAPIBackend:
+        """Default backend shared by the class; tests replace its create mock."""
+        return AnthropicAPIBackend()
+
+    def test_init_default(self, api_backend: AnthropicAPIBackend) -> None:
         """Test default initialization."""
-        backend = AnthropicAPIBackend()
+        assert api_backend.model == "claude-sonnet-4-20250514"
+        assert api_backend.max_tokens == 1024
+        assert api_backend.temperature == 0.7
+
+    def test_init_keeps_connections_alive(self, api_backend: AnthropicAPIBackend) -> None:
+        """Test the HTTP pool keeps idle connections open between turns."""
+        pool = api_backend._client._client._transport._pool
+
+        assert pool._max_keepalive_connections == anthropic_api._KEEPALIVE_CONNECTIONS
+        assert pool._keepalive_expiry == anthropic_api._KEEPALIVE_EXPIRY
+
+    def test_import_defers_sdk(self) -> None:
+        """Test importing the package does not load the anthropic SDK."""
+        code = "import sys, gruebot.llm; print('anthropic' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
 
-        assert backend.model == "claude-sonnet-4-20250514"
-        assert backend.max_tokens == 1024
-        assert backend.temperature == 0.7
+        assert result.stdout.strip() == "False"
 
     def test_init_custom(self) -> None:
         """Test custom initialization."""
@@ -185,43 +226,61 @@ class TestAnthropicAPIBackend:
         assert backend.temperature == 0.5
 
     @pytest.mark.asyncio
-    async def test_send_success(self) -> None:
+    async def test_send_success(self, api_backend: AnthropicAPIBackend) -> None:
         """Test successful send."""
-        backend = AnthropicAPIBackend()
-
         # Mock the API client
         mock_response = MagicMock()
         mock_response.content = [MagicMock(type="text", text="I'll go north.\n\nCOMMAND: north")]
 
-        backend._client.messages.create = AsyncMock(return_value=mock_response)
+        api_backend._client.messages.create = AsyncMock(return_value=mock_response)
 
         messages = [ConversationTurn(role="user", content="You are in a room.")]
-        response = await backend.send(messages)
+        response = await api_backend.send(messages)
 
         assert response.command == "north"
-        assert backend._client.messages.create.called
+        assert api_backend._client.messages.create.called
+
+    @pytest.mark.asyncio
+    async def test_send_marks_cache_breakpoints(self, api_backend: AnthropicAPIBackend) -> None:
+        """Test the system prompt and history prefix are marked for caching."""
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(type="text", text="COMMAND: look")]
+        api_backend._client.messages.create = AsyncMock(return_value=mock_response)
+
+        messages = [
+            ConversationTurn(role="user", content="You are in a room."),
+            ConversationTurn(role="assistant", content="COMMAND: north"),
+            ConversationTurn(role="user", content="You are in a hall."),
+        ]
+        await api_backend.send(messages, system_prompt="Play the game.")
+
+        kwargs = api_backend._client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": "Play the game.", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert kwargs["messages"][0]["content"] == "You are in a room."
+        assert kwargs["messages"][-1]["content"] == [
+            {"type": "text", "text": "You are in a hall.", "cache_control": {"type": "ephemeral"}}
+        ]
 
     @pytest.mark.asyncio
-    async def test_convert_messages_empty(self) -> None:
+    async def test_convert_messages_empty(self, api_backend: AnthropicAPIBackend) -> None:
         """Test message conversion with empty list."""
-        backend = AnthropicAPIBackend()
-        result = backend._convert_messages([])
+        result = api_backend._convert_messages([])
 
         assert len(result) == 1
         assert result[0]["role"] == "user"
 
     @pytest.mark.asyncio
-    async def test_convert_messages_alternating(self) -> None:
+    async def test_convert_messages_alternating(self, api_backend: AnthropicAPIBackend) -> None:
         """Test message conversion ensures alternating roles."""
-        backend = AnthropicAPIBackend()
-
         messages = [
             ConversationTurn(role="user", content="First"),
             ConversationTurn(role="user", content="Second"),
             ConversationTurn(role="assistant", content="Response"),
         ]
 
-        result = backend._convert_messages(messages)
+        result = api_backend._convert_messages(messages)
 
         # Check that consecutive user messages are combined
         assert result[0]["role"] == "user"
@@ -229,29 +288,57 @@ class TestAnthropicAPIBackend:
         assert "Second" in str(result[0]["content"])
 
     @pytest.mark.asyncio
-    async def test_summarize(self) -> None:
+    async def test_summarize(self, api_backend: AnthropicAPIBackend) -> None:
         """Test summarization."""
-        backend = AnthropicAPIBackend()
-
         mock_response = MagicMock()
         mock_response.content = [MagicMock(type="text", text="Summary: Player explored the house.")]
 
-        backend._client.messages.create = AsyncMock(return_value=mock_response)
+        api_backend._client.messages.create = AsyncMock(return_value=mock_response)
 
         history = [
             ConversationTurn(role="user", content="You enter the house."),
             ConversationTurn(role="assistant", content="COMMAND: look"),
         ]
 
-        summary = await backend.summarize(history)
+        summary = await api_backend.summarize(history)
 
         assert "Summary" in summary
-        backend._client.messages.create.assert_called_once()
+        api_backend._client.messages.create.assert_called_once()
+
+
+class _FakeCLIProcess:
+    """Finished claude process that records what was written to its stdin."""
+
+    def __init__(self, returncode: int, stdout: bytes = b"", stderr: bytes = b"") -> None:
+        self.returncode = returncode
+        self.inputs: list[bytes] = []
+        self._output = (stdout, stderr)
+
+    async def communicate(self, data: bytes) -> tuple[bytes, bytes]:
+        self.inputs.append(data)
+        return self._output
 
 
 class TestClaudeCLIBackend:
     """Tests for Claude CLI backend."""
 
+    def setup_method(self) -> None:
+        """Forget any claude path resolved by an earlier test."""
+        claude_cli._find_claude.cache_clear()
+
+    @pytest.fixture
+    def cli_backend(self) -> ClaudeCLIBackend:
+        """Backend with an explicit claude path, so no PATH lookup is patched."""
+        return ClaudeCLIBackend(claude_path="/usr/bin/claude")
+
+    def test_find_claude_cached(self) -> None:
+        """Test the PATH lookup runs once for many backends."""
+        with patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            ClaudeCLIBackend()
+            ClaudeCLIBackend()
+
+        mock_which.assert_called_once_with("claude")
+
     def test_init_finds_claude(self) -> None:
         """Test that init finds claude or raises."""
         with patch("shutil.which", return_value="/usr/local/bin/claude"):
@@ -272,83 +359,105 @@ class TestClaudeCLIBackend:
         assert backend.claude_path == "/custom/claude"
 
     @pytest.mark.asyncio
-    async def test_send_success(self) -> None:
+    async def test_send_success(self, cli_backend: ClaudeCLIBackend) -> None:
         """Test successful send via CLI."""
-        with patch("shutil.which", return_value="/usr/bin/claude"):
-            backend = ClaudeCLIBackend()
-
-        mock_process = AsyncMock()
-        mock_process.returncode = 0
-        mock_process.communicate = AsyncMock(
-            return_value=(b"Looking around.\n\nCOMMAND: look", b"")
-        )
+        mock_process = _FakeCLIProcess(0, b"Looking around.\n\nCOMMAND: look")
 
-        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
             messages = [ConversationTurn(role="user", content="Game text")]
-            response = await backend.send(messages)
+            response = await cli_backend.send(messages)
 
         assert response.command == "look"
+        # The prompt goes through stdin, not the command line
+        prompt = mock_process.inputs[0].decode()
+        assert "Game text" in prompt
+        assert not any("Game text" in arg for arg in mock_exec.call_args.args)
 
     @pytest.mark.asyncio
-    async def test_send_cli_error(self) -> None:
-        """Test CLI error handling."""
-        with patch("shutil.which", return_value="/usr/bin/claude"):
-            backend = ClaudeCLIBackend()
+    async def test_send_caches_repeated_prompts(self) -> None:
+        """Test repeated recent history is answered from the cache."""
+        backend = ClaudeCLIBackend(claude_path="/custom/claude", response_cache_size=256)
+        mock_process = _FakeCLIProcess(0, b"COMMAND: north")
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            room = ConversationTurn(role="user", content="West of House")
+            first = await backend.send([room])
+            second = await backend.send([room])
+            await backend.send([room], system_prompt="Different rules")
 
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(b"", b"Error message"))
+        assert second is first
+        assert mock_exec.call_count == 2
+        assert backend.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+    @pytest.mark.asyncio
+    async def test_send_cache_disabled_by_default(self, cli_backend: ClaudeCLIBackend) -> None:
+        """Test the default backend always runs the CLI."""
+        mock_process = _FakeCLIProcess(0, b"COMMAND: north")
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as mock_exec:
+            room = ConversationTurn(role="user", content="West of House")
+            await cli_backend.send([room])
+            await cli_backend.send([room])
+
+        assert mock_exec.call_count == 2
+        assert cli_backend.cache_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_send_cli_error(self, cli_backend: ClaudeCLIBackend) -> None:
+        """Test CLI error handling."""
+        mock_process = _FakeCLIProcess(1, stderr=b"Error message")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             messages = [ConversationTurn(role="user", content="Text")]
             with pytest.raises(ClaudeCLIError):
-                await backend.send(messages)
+                await cli_backend.send(messages)
 
     @pytest.mark.asyncio
-    async def test_send_context_limit_error(self) -> None:
+    async def test_send_context_limit_error(self, cli_backend: ClaudeCLIBackend) -> None:
         """Test context limit error detection."""
-        with patch("shutil.which", return_value="/usr/bin/claude"):
-            backend = ClaudeCLIBackend()
-
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(b"", b"Error: context limit exceeded"))
+        mock_process = _FakeCLIProcess(1, stderr=b"Error: context limit exceeded")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             messages = [ConversationTurn(role="user", content="Text")]
             with pytest.raises(ClaudeCLIContextLimitError) as exc_info:
-                await backend.send(messages)
+                await cli_backend.send(messages)
             assert "context limit" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_send_rate_limit_error(self) -> None:
+    async def test_send_rate_limit_error(self, cli_backend: ClaudeCLIBackend) -> None:
         """Test rate limit error detection."""
-        with patch("shutil.which", return_value="/usr/bin/claude"):
-            backend = ClaudeCLIBackend()
-
-        mock_process = AsyncMock()
-        mock_process.returncode = 1
-        mock_process.communicate = AsyncMock(return_value=(b"", b"Error: rate limit exceeded"))
+        mock_process = _FakeCLIProcess(1, stderr=b"Error: rate limit exceeded")
 
         with patch("asyncio.create_subprocess_exec", return_value=mock_process):
             messages = [ConversationTurn(role="user", content="Text")]
             with pytest.raises(ClaudeCLIError) as exc_info:
-                await backend.send(messages)
+                await cli_backend.send(messages)
             assert "rate limit" in str(exc_info.value).lower()
 
-    def test_build_prompt(self) -> None:
+    def test_build_prompt(self, cli_backend: ClaudeCLIBackend) -> None:
         """Test prompt building."""
-        with patch("shutil.which", return_value="/usr/bin/claude"):
-            backend = ClaudeCLIBackend()
-
         messages = [
             ConversationTurn(role="user", content="Game output here"),
             ConversationTurn(role="assistant", content="COMMAND: north"),
         ]
 
-        prompt = backend._build_prompt(messages)
+        prompt = cli_backend._build_prompt(messages)
 
         # System prompt is now passed separately to --system-prompt flag
         assert "Game output here" in prompt
         assert "COMMAND: north" in prompt
         assert "Please provide your next command" in prompt
+
+    def test_format_history_for_summary(self, cli_backend: ClaudeCLIBackend) -> None:
+        """Test summary history formatting by role."""
+        history = [
+            ConversationTurn(role="user", content="You see a {door}."),
+            ConversationTurn(role="assistant", content="COMMAND: open door"),
+            ConversationTurn(role="system", content="Summary follows"),
+        ]
+
+        text = cli_backend._format_history_for_summary(history)
+
+        assert text == (
+            "GAME: You see a {door}.\n\nPLAYER: COMMAND: open door\n\n[SYSTEM]: Summary follows"
+        )
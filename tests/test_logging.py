@@ -1,9 +1,12 @@
 """Tests for transcript logging."""
 
+import asyncio
 import json
-import tempfile
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
+from gruebot.logging import transcript
 from gruebot.logging.transcript import (
     TranscriptEntry,
     TranscriptLogger,
@@ -17,22 +20,23 @@ class TestTranscriptEntry:
     def test_entry_creation(self) -> None:
         """Test creating a transcript entry."""
         entry = TranscriptEntry(
-            timestamp="2024-01-01T12:00:00",
+            timestamp=1.5,
             turn=5,
             entry_type="game_output",
             content="You are in a room.",
         )
 
-        assert entry.timestamp == "2024-01-01T12:00:00"
+        assert entry.timestamp == 1.5
         assert entry.turn == 5
         assert entry.entry_type == "game_output"
         assert entry.content == "You are in a room."
         assert entry.metadata == {}
+        assert not hasattr(entry, "__dict__")
 
     def test_entry_with_metadata(self) -> None:
         """Test entry with metadata."""
         entry = TranscriptEntry(
-            timestamp="2024-01-01T12:00:00",
+            timestamp=1.5,
             turn=5,
             entry_type="llm_response",
             content="COMMAND: look",
@@ -55,22 +59,21 @@ class TestTranscriptLogger:
         assert logger._entries == []
         assert logger._turn == 0
 
-    def test_init_with_files(self) -> None:
+    def test_init_with_files(self, tmp_path: Path) -> None:
         """Test initialization with file output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_path = Path(tmpdir) / "test.json"
-            md_path = Path(tmpdir) / "test.md"
-
-            logger = TranscriptLogger(
-                json_path=json_path,
-                markdown_path=md_path,
-                game_title="Test Game",
-            )
+        json_path = tmp_path / "test.json"
+        md_path = tmp_path / "test.md"
 
-            # Markdown file should be created
-            assert md_path.exists()
+        logger = TranscriptLogger(
+            json_path=json_path,
+            markdown_path=md_path,
+            game_title="Test Game",
+        )
 
-            logger.finalize()
+        # Markdown file should be created
+        assert md_path.exists()
+
+        logger.finalize()
 
     def test_log_game_output(self) -> None:
         """Test logging game output."""
@@ -143,60 +146,125 @@ class TestTranscriptLogger:
         assert len(entries) == 1
         assert entries[0].entry_type == "system"
 
-    def test_finalize_json(self) -> None:
+    def test_finalize_json(self, tmp_path: Path) -> None:
         """Test finalizing with JSON output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_path = Path(tmpdir) / "test.json"
+        json_path = tmp_path / "test.json"
 
-            logger = TranscriptLogger(
-                json_path=json_path,
-                game_title="Test Game",
-            )
+        logger = TranscriptLogger(
+            json_path=json_path,
+            game_title="Test Game",
+        )
 
-            logger.log_game_output("Welcome!")
-            logger.log_llm_response("COMMAND: look", command="look")
-            logger.finalize()
+        logger.log_game_output("Welcome!")
+        logger.log_llm_response("COMMAND: look", command="look")
+        logger.finalize()
 
-            # Check JSON file
-            assert json_path.exists()
-            with open(json_path) as f:
-                data = json.load(f)
+        # Check JSON file
+        assert json_path.exists()
+        data = json.loads(json_path.read_bytes())
 
-            assert data["game_title"] == "Test Game"
-            assert data["total_turns"] == 1
-            assert len(data["entries"]) == 2
+        assert data["game_title"] == "Test Game"
+        assert data["total_turns"] == 1
+        assert len(data["entries"]) == 2
+        start = datetime.fromisoformat(data["start_time"])
+        assert datetime.fromisoformat(data["entries"][0]["timestamp"]) >= start
 
-    def test_finalize_markdown(self) -> None:
+    def test_finalize_json_without_orjson(self, tmp_path: Path) -> None:
+        """Test the stdlib fallback writes the same JSON transcript."""
+        json_path = tmp_path / "test.json"
+
+        with patch.object(transcript, "orjson", None):
+            logger = TranscriptLogger(json_path=json_path, game_title="Test Game")
+            logger.log_game_output("Welcome!", location="West of House")
+            logger.finalize()
+
+        data = json.loads(json_path.read_text())
+        assert data["game_title"] == "Test Game"
+        assert data["entries"][0]["metadata"] == {"location": "West of House"}
+
+    def test_finalize_markdown(self, tmp_path: Path) -> None:
         """Test finalizing with Markdown output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            md_path = Path(tmpdir) / "test.md"
+        md_path = tmp_path / "test.md"
 
-            logger = TranscriptLogger(
-                markdown_path=md_path,
-                game_title="Test Game",
+        logger = TranscriptLogger(
+            markdown_path=md_path,
+            game_title="Test Game",
+        )
+
+        logger.log_game_output("Welcome!", location="Start")
+        logger.log_llm_response("COMMAND: look", command="look")
+        logger.finalize()
+
+        # Check Markdown file
+        content = md_path.read_text()
+        assert "Test Game" in content
+        assert "Welcome!" in content
+        assert "`look`" in content
+        assert "Completed:" in content
+
+    def test_markdown_summary_quoted(self, tmp_path: Path) -> None:
+        """Test every summary line is block-quoted in Markdown."""
+        md_path = tmp_path / "test.md"
+
+        logger = TranscriptLogger(markdown_path=md_path)
+        logger.log_summary("Found a lamp.\nThe grue lurks.")
+        logger.finalize()
+
+        assert "> Found a lamp.\n> The grue lurks.\n\n---" in md_path.read_text()
+
+    def test_markdown_flushed_on_error(self, tmp_path: Path) -> None:
+        """Test errors reach disk before finalize."""
+        md_path = tmp_path / "test.md"
+
+        logger = TranscriptLogger(markdown_path=md_path)
+        logger.log_game_output("Welcome!")
+        logger.log_error("timeout", "Interpreter stopped responding")
+
+        content = md_path.read_text()
+        assert "Welcome!" in content
+        assert "Interpreter stopped responding" in content
+        logger.finalize()
+
+    async def test_finalize_async_concurrent(self, tmp_path: Path) -> None:
+        """Test several transcripts can be finalized concurrently."""
+        loggers = [
+            TranscriptLogger(
+                json_path=tmp_path / f"game{i}.json",
+                markdown_path=tmp_path / f"game{i}.md",
             )
+            for i in range(3)
+        ]
+        for logger in loggers:
+            logger.log_game_output("Welcome!")
 
-            logger.log_game_output("Welcome!", location="Start")
-            logger.log_llm_response("COMMAND: look", command="look")
-            logger.finalize()
+        await asyncio.gather(*(logger.finalize_async() for logger in loggers))
 
-            # Check Markdown file
-            content = md_path.read_text()
-            assert "Test Game" in content
-            assert "Welcome!" in content
-            assert "`look`" in content
-            assert "Completed:" in content
+        for i, logger in enumerate(loggers):
+            assert logger._md_file is None
+            assert "Completed:" in (tmp_path / f"game{i}.md").read_text()
+            data = json.loads((tmp_path / f"game{i}.json").read_text())
+            assert len(data["entries"]) == 1
 
-    def test_context_manager(self) -> None:
+    def test_context_manager(self, tmp_path: Path) -> None:
         """Test using logger as context manager."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            json_path = Path(tmpdir) / "test.json"
+        json_path = tmp_path / "test.json"
+
+        with TranscriptLogger(json_path=json_path) as logger:
+            logger.log_game_output("Test output")
 
-            with TranscriptLogger(json_path=json_path) as logger:
-                logger.log_game_output("Test output")
+        # File should be finalized
+        assert json_path.exists()
+
+    def test_location_metadata_shared(self) -> None:
+        """Test entries at the same location share one metadata dict."""
+        logger = TranscriptLogger()
+        logger.log_game_output("A white house.", location="West of House")
+        logger.log_game_output("Still here.", location="West of House")
+        logger.log_game_output("Trees.", location="Forest")
 
-            # File should be finalized
-            assert json_path.exists()
+        first, second, third = logger.get_entries()
+        assert first.metadata is second.metadata
+        assert third.metadata == {"location": "Forest"}
 
     def test_get_entries_returns_copy(self) -> None:
         """Test that get_entries returns a copy."""
@@ -206,7 +274,7 @@ class TestTranscriptLogger:
         entries = logger.get_entries()
         entries.append(
             TranscriptEntry(
-                timestamp="now",
+                timestamp=0.0,
                 turn=0,
                 entry_type="test",
                 content="extra",
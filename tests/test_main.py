@@ -1,13 +1,14 @@
 """Tests for main game session."""
 
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from gruebot.backends.protocol import GameInfo, GameResponse, GameState
 from gruebot.config import Config
-from gruebot.llm.protocol import LLMResponse
+from gruebot.llm.protocol import ConversationTurn, LLMResponse
 from gruebot.main import GameResult, GameSession, StuckDetector
 
 
@@ -62,6 +63,26 @@ class TestStuckDetector:
 
         assert result is False
 
+    def test_old_outputs_leave_window(self) -> None:
+        """Test repeats drop out of the window as new outputs arrive."""
+        detector = StuckDetector(threshold=3)
+
+        results = [
+            detector.check(GameResponse(text=text))
+            for text in ["Same", "Same", "Same", "A", "B", "C", "D"]
+        ]
+
+        assert results == [False, False, True, True, False, False, False]
+
+    def test_check_batch(self) -> None:
+        """Test batch checking reports the first stuck turn."""
+        varied = [("Output 0", "north"), ("Output 1", "look"), ("Output 2", "east")]
+        pacing = [("Output 0", "west"), ("Output 1", "east"), ("Output 2", "west")]
+
+        assert StuckDetector(threshold=3).check_batch(varied) == -1
+        # Third turn leaves only two distinct commands in the window
+        assert StuckDetector(threshold=3).check_batch(pacing) == 2
+
     def test_reset(self) -> None:
         """Test reset clears history."""
         detector = StuckDetector(threshold=3)
@@ -80,49 +101,104 @@ class TestStuckDetector:
         assert result is False
 
 
+_NORTH = LLMResponse(
+    raw_text="Let me go north.\n\nCOMMAND: north",
+    command="north",
+    reasoning="Let me go north.",
+    is_meta=False,
+)
+_QUIT = LLMResponse(raw_text="COMMAND: quit", command="quit", is_meta=True)
+
+# Game responses the fake backend hands out; sessions only read them
+_INTRO_RESPONSE = GameResponse(
+    text="Welcome to Test Game!",
+    location="Start Room",
+    state=GameState.WAITING_INPUT,
+)
+_NORTH_RESPONSE = GameResponse(
+    text="You go north.",
+    location="North Room",
+    state=GameState.WAITING_INPUT,
+)
+_GAME_INFO = GameInfo(
+    title="Test Game",
+    author="Test Author",
+    format="zmachine",
+    file_path="/path/to/game.z5",
+)
+
+
+@dataclass(slots=True)
+class _FakeBackend:
+    """Scripted game backend that counts the calls a session makes."""
+
+    # Factories hand out the shared constants; dataclasses reject them as defaults
+    command_response: GameResponse = field(default_factory=lambda: _NORTH_RESPONSE)
+    is_running: bool = True
+    game_info: GameInfo | None = field(default_factory=lambda: _GAME_INFO)
+    start_calls: int = 0
+    save_calls: int = 0
+    quit_calls: int = 0
+
+    def start(self, game_path: str) -> GameResponse:  # noqa: ARG002
+        self.start_calls += 1
+        return _INTRO_RESPONSE
+
+    def send_command(self, command: str) -> GameResponse:  # noqa: ARG002
+        return self.command_response
+
+    def save(self, slot: str = "default") -> bool:  # noqa: ARG002
+        self.save_calls += 1
+        return True
+
+    def restore(self, slot: str = "default") -> GameResponse:  # noqa: ARG002
+        return GameResponse(text="Restored.")
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+
+
+class _FakeLLM:
+    """LLM that replays scripted responses, repeating the last one."""
+
+    __slots__ = ("_responses", "send_calls")
+
+    def __init__(self, *responses: LLMResponse) -> None:
+        self._responses = responses or (_NORTH,)
+        self.send_calls = 0
+
+    async def send(
+        self,
+        messages: list[ConversationTurn],  # noqa: ARG002
+        system_prompt: str | None = None,  # noqa: ARG002
+    ) -> LLMResponse:
+        response = self._responses[min(self.send_calls, len(self._responses) - 1)]
+        self.send_calls += 1
+        return response
+
+    async def send_streaming(
+        self,
+        messages: list[ConversationTurn],  # noqa: ARG002
+        system_prompt: str | None = None,  # noqa: ARG002
+    ) -> AsyncIterator[str]:
+        yield (await self.send(messages)).raw_text
+
+    async def summarize(
+        self,
+        history: list[ConversationTurn],  # noqa: ARG002
+        previous_summary: str | None = None,  # noqa: ARG002
+        max_tokens: int = 500,  # noqa: ARG002
+    ) -> str:
+        return "Game summary"
+
+
 class TestGameSession:
     """Tests for GameSession."""
 
-    def create_mock_backend(self) -> MagicMock:
-        """Create a mock game backend."""
-        backend = MagicMock()
-        backend.is_running = True
-        backend.game_info = GameInfo(
-            title="Test Game",
-            author="Test Author",
-            format="zmachine",
-            file_path="/path/to/game.z5",
-        )
-        backend.start.return_value = GameResponse(
-            text="Welcome to Test Game!",
-            location="Start Room",
-            state=GameState.WAITING_INPUT,
-        )
-        backend.send_command.return_value = GameResponse(
-            text="You go north.",
-            location="North Room",
-            state=GameState.WAITING_INPUT,
-        )
-        return backend
-
-    def create_mock_llm(self) -> MagicMock:
-        """Create a mock LLM interface."""
-        llm = MagicMock()
-        llm.send = AsyncMock(
-            return_value=LLMResponse(
-                raw_text="Let me go north.\n\nCOMMAND: north",
-                command="north",
-                reasoning="Let me go north.",
-                is_meta=False,
-            )
-        )
-        llm.summarize = AsyncMock(return_value="Game summary")
-        return llm
-
     def test_init(self) -> None:
         """Test session initialization."""
-        backend = self.create_mock_backend()
-        llm = self.create_mock_llm()
+        backend = _FakeBackend()
+        llm = _FakeLLM()
         config = Config()
 
         session = GameSession(backend, llm, config)
@@ -135,8 +211,8 @@ class TestGameSession:
     @pytest.mark.asyncio
     async def test_run_max_turns(self) -> None:
         """Test running with max turns limit."""
-        backend = self.create_mock_backend()
-        llm = self.create_mock_llm()
+        backend = _FakeBackend()
+        llm = _FakeLLM()
         config = Config()
 
         session = GameSession(backend, llm, config)
@@ -145,20 +221,21 @@ class TestGameSession:
 
         assert result.outcome == "max_turns"
         assert result.turns == 3
-        backend.start.assert_called_once()
-        assert llm.send.call_count == 3
-        backend.quit.assert_called_once()
+        assert backend.start_calls == 1
+        assert llm.send_calls == 3
+        assert backend.quit_calls == 1
 
     @pytest.mark.asyncio
     async def test_run_game_over(self) -> None:
         """Test game over detection."""
-        backend = self.create_mock_backend()
-        backend.send_command.return_value = GameResponse(
-            text="*** You have died ***",
-            state=GameState.GAME_OVER,
+        backend = _FakeBackend(
+            command_response=GameResponse(
+                text="*** You have died ***",
+                state=GameState.GAME_OVER,
+            )
         )
 
-        llm = self.create_mock_llm()
+        llm = _FakeLLM()
         config = Config()
 
         session = GameSession(backend, llm, config)
@@ -169,13 +246,34 @@ class TestGameSession:
         # Turn count is 0 because game over happens before turn increment
         assert result.turns == 0
 
+    @pytest.mark.asyncio
+    async def test_run_command_error(self) -> None:
+        """Test a rejected command is reported to the LLM as a system note."""
+        backend = _FakeBackend(command_response=GameResponse(text="", error="Input rejected"))
+        llm = _FakeLLM()
+        config = Config()
+        outputs: list[GameResponse] = []
+
+        session = GameSession(backend, llm, config)
+
+        result = await session.run(
+            Path("/fake/game.z5"), max_turns=1, on_game_output=outputs.append
+        )
+
+        assert result.outcome == "max_turns"
+        assert [response.error for response in outputs] == [None, "Input rejected"]
+        last_turn = session.context.context.recent_turns[-1]
+        assert last_turn.role == "system"
+        assert last_turn.content == (
+            "The game could not process the command 'north': Input rejected"
+        )
+
     @pytest.mark.asyncio
     async def test_run_meta_quit(self) -> None:
         """Test quit meta command."""
-        backend = self.create_mock_backend()
-        llm = self.create_mock_llm()
-        llm.send = AsyncMock(
-            return_value=LLMResponse(
+        backend = _FakeBackend()
+        llm = _FakeLLM(
+            LLMResponse(
                 raw_text="I should quit now.\n\nCOMMAND: quit",
                 command="quit",
                 is_meta=True,
@@ -192,70 +290,28 @@ class TestGameSession:
     @pytest.mark.asyncio
     async def test_run_meta_save(self) -> None:
         """Test save meta command."""
-        backend = self.create_mock_backend()
-        backend.save.return_value = True
-
-        call_count = 0
-
-        async def mock_send(
-            _messages: list,  # noqa: ARG001
-            **_kwargs: object,  # noqa: ARG001
-        ) -> LLMResponse:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return LLMResponse(
-                    raw_text="Save game\n\nCOMMAND: save",
-                    command="save",
-                    is_meta=True,
-                )
-            else:
-                return LLMResponse(
-                    raw_text="Now quit\n\nCOMMAND: quit",
-                    command="quit",
-                    is_meta=True,
-                )
-
-        llm = self.create_mock_llm()
-        llm.send = mock_send
+        backend = _FakeBackend()
+        llm = _FakeLLM(
+            LLMResponse(raw_text="Save game\n\nCOMMAND: save", command="save", is_meta=True),
+            _QUIT,
+        )
         config = Config()
 
         session = GameSession(backend, llm, config)
 
         await session.run(Path("/fake/game.z5"), max_turns=10)
 
-        backend.save.assert_called_once()
+        assert backend.save_calls == 1
 
     @pytest.mark.asyncio
     async def test_run_no_command_extracted(self) -> None:
         """Test handling when no command is extracted."""
-        backend = self.create_mock_backend()
-
-        call_count = 0
-
-        async def mock_send(
-            _messages: list,  # noqa: ARG001
-            **_kwargs: object,  # noqa: ARG001
-        ) -> LLMResponse:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                # First response has no command
-                return LLMResponse(
-                    raw_text="I'm thinking about what to do...",
-                    command=None,
-                    is_meta=False,
-                )
-            else:
-                # Second response quits
-                return LLMResponse(
-                    raw_text="COMMAND: quit",
-                    command="quit",
-                    is_meta=True,
-                )
-
-        llm = self.create_mock_llm()
-        llm.send = mock_send
+        backend = _FakeBackend()
+        llm = _FakeLLM(
+            # First response has no command, the second quits
+            LLMResponse(raw_text="I'm thinking about what to do...", command=None, is_meta=False),
+            _QUIT,
+        )
         config = Config()
 
         session = GameSession(backend, llm, config)
@@ -268,8 +324,8 @@ class TestGameSession:
     @pytest.mark.asyncio
     async def test_run_callback(self) -> None:
         """Test output callbacks."""
-        backend = self.create_mock_backend()
-        llm = self.create_mock_llm()
+        backend = _FakeBackend()
+        llm = _FakeLLM()
         config = Config()
 
         outputs: list[GameResponse] = []
@@ -296,11 +352,7 @@ class TestGameSession:
 
     def test_stop_sets_flag(self) -> None:
         """Test that stop() sets the running flag."""
-        backend = self.create_mock_backend()
-        llm = self.create_mock_llm()
-        config = Config()
-
-        session = GameSession(backend, llm, config)
+        session = GameSession(_FakeBackend(), _FakeLLM(), Config())
         session._running = True
 
         session.stop()
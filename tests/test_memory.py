@@ -1,5 +1,8 @@
 """Tests for memory and context management."""
 
+import asyncio
+import functools
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -7,11 +10,41 @@ import pytest
 from gruebot.llm.protocol import ConversationTurn
 from gruebot.memory.context import ContextManager, GameContext
 from gruebot.memory.summarizer import (
+    BatchSummarizer,
     SummarizationConfig,
     Summarizer,
     create_summary_message,
 )
 
+# Long enough to exceed a 100-token threshold on its own
+_LONG_CONTENT = "x" * 500
+
+
+@functools.cache
+def _user_turns(n: int) -> tuple[ConversationTurn, ...]:
+    """Build n user turns ("Turn 0", "Turn 1", ...), shared between tests.
+
+    The turns are shared, so tests must not mutate them.
+    """
+    return tuple(ConversationTurn(role="user", content=f"Turn {i}") for i in range(n))
+
+
+class _SummaryLLM:
+    """LLM stub whose summarize returns a fixed summary and counts calls."""
+
+    def __init__(self, summary: str) -> None:
+        self.summary = summary
+        self.calls = 0
+
+    async def summarize(
+        self,
+        history: list[ConversationTurn],  # noqa: ARG002
+        previous_summary: str | None = None,  # noqa: ARG002
+        max_tokens: int = 500,  # noqa: ARG002
+    ) -> str:
+        self.calls += 1
+        return self.summary
+
 
 class TestGameContext:
     """Tests for GameContext dataclass."""
@@ -71,6 +104,20 @@ class TestContextManager:
         with pytest.raises(ValueError, match="Invalid role"):
             manager.add_turn("invalid", "Content")
 
+    def test_extend_turns(self) -> None:
+        """Test adding several turns at once."""
+        manager = ContextManager()
+
+        manager.extend_turns([("user", "Look"), ("assistant", "COMMAND: look")])
+
+        assert [turn.role for turn in manager.context.recent_turns] == ["user", "assistant"]
+        assert manager.context.turn_count == 2
+        assert len(manager.get_full_history()) == 2
+
+        with pytest.raises(ValueError, match="Invalid role: invalid"):
+            manager.extend_turns([("user", "More"), ("invalid", "Content")])
+        assert manager.context.turn_count == 2
+
     def test_add_game_output(self) -> None:
         """Test adding game output."""
         manager = ContextManager()
@@ -111,7 +158,6 @@ class TestContextManager:
         manager.add_turn("user", "Turn 2")
         assert manager.should_summarize() is True
 
-    @pytest.mark.asyncio
     async def test_maybe_summarize_no_llm(self) -> None:
         """Test summarization without LLM."""
         manager = ContextManager(
@@ -120,19 +166,17 @@ class TestContextManager:
         )
 
         # Add enough turns to trigger summarization
-        for i in range(5):
-            manager.add_turn("user", f"Turn {i}")
+        manager.extend_turns(("user", f"Turn {i}") for i in range(5))
 
         result = await manager.maybe_summarize()
 
         # Without LLM, just trims history
         assert result is False
 
-    @pytest.mark.asyncio
+    @pytest.mark.llm
     async def test_maybe_summarize_with_llm(self) -> None:
         """Test summarization with LLM."""
-        mock_llm = MagicMock()
-        mock_llm.summarize = AsyncMock(return_value="Game summary here")
+        mock_llm = _SummaryLLM("Game summary here")
 
         manager = ContextManager(
             max_recent_turns=10,
@@ -144,14 +188,13 @@ class TestContextManager:
         # With summarize_threshold=8, max_recent_turns=10:
         # keep_count = max(5, 10 - 8//2) = max(5, 6) = 6
         # So we need more than 6 turns for to_summarize to be non-empty
-        for i in range(10):
-            manager.add_turn("user", f"Turn {i}")
+        manager.extend_turns(("user", f"Turn {i}") for i in range(10))
 
         result = await manager.maybe_summarize()
 
         assert result is True
         assert manager.context.summary == "Game summary here"
-        mock_llm.summarize.assert_called_once()
+        assert mock_llm.calls == 1
 
     def test_build_messages_empty(self) -> None:
         """Test building messages with empty context."""
@@ -308,7 +351,7 @@ class TestSummarizer:
         assert summarizer.should_summarize(short_turns) is False
 
         # Long content - should trigger
-        long_turns = [ConversationTurn(role="user", content="x" * 500)]
+        long_turns = [ConversationTurn(role="user", content=_LONG_CONTENT)]
         assert summarizer.should_summarize(long_turns) is True
 
     def test_estimate_tokens(self) -> None:
@@ -323,7 +366,7 @@ class TestSummarizer:
         """Test splitting turns."""
         summarizer = Summarizer(SummarizationConfig(keep_recent=2))
 
-        turns = [ConversationTurn(role="user", content=f"Turn {i}") for i in range(5)]
+        turns = list(_user_turns(5))
 
         to_summarize, to_keep = summarizer.split_for_summarization(turns)
 
@@ -343,11 +386,10 @@ class TestSummarizer:
         assert len(to_summarize) == 0
         assert len(to_keep) == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.llm
     async def test_summarize(self) -> None:
         """Test generating summary."""
-        mock_llm = MagicMock()
-        mock_llm.summarize = AsyncMock(return_value="Summary of events")
+        mock_llm = _SummaryLLM("Summary of events")
 
         summarizer = Summarizer()
         history = [
@@ -358,7 +400,7 @@ class TestSummarizer:
         summary = await summarizer.summarize(mock_llm, history)
 
         assert summary == "Summary of events"
-        mock_llm.summarize.assert_called_once()
+        assert mock_llm.calls == 1
 
     def test_format_history(self) -> None:
         """Test history formatting."""
@@ -377,6 +419,98 @@ class TestSummarizer:
         assert "[SYSTEM]: Note" in formatted
 
 
+def _text_message(text: str) -> SimpleNamespace:
+    return SimpleNamespace(content=[SimpleNamespace(type="text", text=text)])
+
+
+class TestBatchSummarizer:
+    """Tests for BatchSummarizer."""
+
+    def test_add_builds_requests(self) -> None:
+        """Test queued requests carry the summarization prompt."""
+        summarizer = BatchSummarizer(MagicMock(), model="test-model")
+
+        first = summarizer.add([ConversationTurn(role="user", content="West of House")])
+        second = summarizer.add([ConversationTurn(role="user", content="Attic")], "Earlier")
+
+        assert (first, second) == ("session-0", "session-1")
+        params = summarizer._pending[1]["params"]
+        assert params["model"] == "test-model"
+        assert params["max_tokens"] == 1000
+        content = params["messages"][0]["content"]
+        assert "GAME: Attic" in content
+        assert "Previous summary (incorporate this):\nEarlier" in content
+
+    async def test_flush_polls_batch(self) -> None:
+        """Test batch mode polls until the batch ends and maps results."""
+        client = MagicMock()
+        batches = client.messages.batches
+        batches.create = AsyncMock(
+            return_value=SimpleNamespace(id="batch-1", processing_status="in_progress")
+        )
+        batches.retrieve = AsyncMock(
+            return_value=SimpleNamespace(id="batch-1", processing_status="ended")
+        )
+
+        async def results():
+            yield SimpleNamespace(
+                custom_id="session-0",
+                result=SimpleNamespace(type="succeeded", message=_text_message("Summary A")),
+            )
+            yield SimpleNamespace(custom_id="session-1", result=SimpleNamespace(type="errored"))
+
+        batches.results = AsyncMock(return_value=results())
+
+        summarizer = BatchSummarizer(client, poll_interval=0)
+        summarizer.add([ConversationTurn(role="user", content="One")])
+        summarizer.add([ConversationTurn(role="user", content="Two")])
+
+        summaries = await summarizer.flush()
+
+        assert summaries == {"session-0": "Summary A"}
+        assert len(batches.create.call_args.kwargs["requests"]) == 2
+        batches.retrieve.assert_awaited_once_with("batch-1")
+        assert summarizer._pending == []
+
+    async def test_flush_without_batch_mode(self) -> None:
+        """Test requests are sent individually when batch mode is off."""
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=_text_message("Summary"))
+
+        summarizer = BatchSummarizer(client, batch_mode=False)
+        summarizer.add([ConversationTurn(role="user", content="One")])
+
+        assert await summarizer.flush() == {"session-0": "Summary"}
+        client.messages.batches.create.assert_not_called()
+
+    async def test_flush_without_batch_mode_drops_failures(self) -> None:
+        """Test one failed message does not lose the other summaries."""
+        in_flight = 0
+        peak = 0
+
+        async def create(**params: object) -> SimpleNamespace:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "Two" in str(params["messages"]):
+                raise RuntimeError("rate limited")
+            return _text_message("Summary")
+
+        client = MagicMock()
+        client.messages.create = create
+
+        summarizer = BatchSummarizer(client, batch_mode=False, max_concurrency=2)
+        for content in ("One", "Two", "Three"):
+            summarizer.add([ConversationTurn(role="user", content=content)])
+
+        summaries = await summarizer.flush()
+
+        assert summaries == {"session-0": "Summary", "session-2": "Summary"}
+        assert peak == 2
+
+
 class TestCreateSummaryMessage:
     """Tests for create_summary_message."""
 
@@ -1,8 +1,6 @@
 """Tests for the testing module."""
 
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -18,110 +16,102 @@ from gruebot.testing import (
     WalkthroughTest,
     parse_assertion,
 )
-from gruebot.testing.assertions import TurnsAssertion
+from gruebot.testing.assertions import Assertion, TurnsAssertion
 from gruebot.testing.runner import ExitCode, TestState
 
+# States shared by several assertion checks; assertions only read them
+_IN_THE_KITCHEN = TestState(current_location="The Kitchen")
+_SCORE_50 = TestState(score=50)
+
 
 class TestAssertions:
     """Tests for assertion classes."""
 
-    def test_location_assertion_substring(self) -> None:
-        state = TestState(current_location="The Kitchen")
-        assertion = LocationAssertion("Kitchen")
-        result = assertion.check(state)
-        assert result.passed
+    @pytest.mark.parametrize(
+        ("state", "assertion", "expected_passed"),
+        [
+            pytest.param(
+                _IN_THE_KITCHEN,
+                LocationAssertion("Kitchen"),
+                True,
+                id="location_substring",
+            ),
+            pytest.param(
+                _IN_THE_KITCHEN,
+                LocationAssertion("Bedroom"),
+                False,
+                id="location_substring_fail",
+            ),
+            pytest.param(
+                TestState(current_location="Kitchen"),
+                LocationAssertion("Kitchen", exact=True),
+                True,
+                id="location_exact",
+            ),
+            pytest.param(
+                _IN_THE_KITCHEN,
+                LocationAssertion("Kitchen", exact=True),
+                False,
+                id="location_exact_fail",
+            ),
+            pytest.param(
+                TestState(last_output="You see a brass lantern here."),
+                ContainsTextAssertion("brass lantern"),
+                True,
+                id="contains_text",
+            ),
+            pytest.param(
+                TestState(last_output="You see a BRASS LANTERN here."),
+                ContainsTextAssertion("brass lantern", case_sensitive=False),
+                True,
+                id="contains_text_case_insensitive",
+            ),
+            pytest.param(
+                TestState(last_output="You see nothing special."),
+                ContainsTextAssertion("brass lantern"),
+                False,
+                id="contains_text_fail",
+            ),
+            pytest.param(
+                TestState(last_output="You are in a well-lit room."),
+                NotContainsTextAssertion("grue"),
+                True,
+                id="not_contains_text",
+            ),
+            pytest.param(
+                TestState(last_output="A grue eats you."),
+                NotContainsTextAssertion("grue"),
+                False,
+                id="not_contains_text_fail",
+            ),
+            pytest.param(
+                TestState(inventory=["brass lantern", "sword"]),
+                InventoryAssertion("lantern"),
+                True,
+                id="inventory",
+            ),
+            pytest.param(
+                TestState(inventory=["sword"]),
+                InventoryAssertion("lantern"),
+                False,
+                id="inventory_fail",
+            ),
+            pytest.param(_SCORE_50, ScoreAssertion(50, "eq"), True, id="score_eq"),
+            pytest.param(_SCORE_50, ScoreAssertion(40, "gte"), True, id="score_gte"),
+            pytest.param(
+                TestState(score=None), ScoreAssertion(50, "eq"), False, id="score_no_score"
+            ),
+            pytest.param(TestState(turns=10), TurnsAssertion(15, "lte"), True, id="turns"),
+            pytest.param(TestState(turns=20), TurnsAssertion(15, "lte"), False, id="turns_fail"),
+        ],
+    )
+    def test_check(self, state: TestState, assertion: Assertion, expected_passed: bool) -> None:
+        assert assertion.check(state).passed is expected_passed
+
+    def test_location_assertion_message(self) -> None:
+        result = LocationAssertion("Kitchen").check(_IN_THE_KITCHEN)
         assert "Kitchen" in result.message
 
-    def test_location_assertion_substring_fail(self) -> None:
-        state = TestState(current_location="The Kitchen")
-        assertion = LocationAssertion("Bedroom")
-        result = assertion.check(state)
-        assert not result.passed
-
-    def test_location_assertion_exact(self) -> None:
-        state = TestState(current_location="Kitchen")
-        assertion = LocationAssertion("Kitchen", exact=True)
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_location_assertion_exact_fail(self) -> None:
-        state = TestState(current_location="The Kitchen")
-        assertion = LocationAssertion("Kitchen", exact=True)
-        result = assertion.check(state)
-        assert not result.passed
-
-    def test_contains_text_assertion(self) -> None:
-        state = TestState(last_output="You see a brass lantern here.")
-        assertion = ContainsTextAssertion("brass lantern")
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_contains_text_assertion_case_insensitive(self) -> None:
-        state = TestState(last_output="You see a BRASS LANTERN here.")
-        assertion = ContainsTextAssertion("brass lantern", case_sensitive=False)
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_contains_text_assertion_fail(self) -> None:
-        state = TestState(last_output="You see nothing special.")
-        assertion = ContainsTextAssertion("brass lantern")
-        result = assertion.check(state)
-        assert not result.passed
-
-    def test_not_contains_text_assertion(self) -> None:
-        state = TestState(last_output="You are in a well-lit room.")
-        assertion = NotContainsTextAssertion("grue")
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_not_contains_text_assertion_fail(self) -> None:
-        state = TestState(last_output="A grue eats you.")
-        assertion = NotContainsTextAssertion("grue")
-        result = assertion.check(state)
-        assert not result.passed
-
-    def test_inventory_assertion(self) -> None:
-        state = TestState(inventory=["brass lantern", "sword"])
-        assertion = InventoryAssertion("lantern")
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_inventory_assertion_fail(self) -> None:
-        state = TestState(inventory=["sword"])
-        assertion = InventoryAssertion("lantern")
-        result = assertion.check(state)
-        assert not result.passed
-
-    def test_score_assertion_eq(self) -> None:
-        state = TestState(score=50)
-        assertion = ScoreAssertion(50, "eq")
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_score_assertion_gte(self) -> None:
-        state = TestState(score=50)
-        assertion = ScoreAssertion(40, "gte")
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_score_assertion_no_score(self) -> None:
-        state = TestState(score=None)
-        assertion = ScoreAssertion(50, "eq")
-        result = assertion.check(state)
-        assert not result.passed
-
-    def test_turns_assertion(self) -> None:
-        state = TestState(turns=10)
-        assertion = TurnsAssertion(15, "lte")
-        result = assertion.check(state)
-        assert result.passed
-
-    def test_turns_assertion_fail(self) -> None:
-        state = TestState(turns=20)
-        assertion = TurnsAssertion(15, "lte")
-        result = assertion.check(state)
-        assert not result.passed
-
 
 class TestParseAssertion:
     """Tests for parsing assertions from walkthrough files."""
@@ -176,44 +166,72 @@ class TestParseAssertion:
         assert parse_assertion("# comment") is None
         assert parse_assertion("") is None
 
+    def test_parse_repeated_line_is_cached(self) -> None:
+        first = parse_assertion('@expect-location "Cellar"')
+        second = parse_assertion('@expect-location "Cellar"')
+        assert first is not None
+        assert first is second
+
 
 class TestWalkthroughTest:
     """Tests for walkthrough file parsing."""
 
     def test_parse_simple_walkthrough(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("# Test walkthrough\n")
-            f.write("look\n")
-            f.write("north\n")
-            f.write('@expect-location "Kitchen"\n')
-            f.write("take lamp\n")
-            f.flush()
-
-            walkthrough = WalkthroughTest(Path(f.name))
-            assert len(walkthrough.commands) == 3
-            assert walkthrough.commands == ["look", "north", "take lamp"]
-            assert len(walkthrough.assertions) == 1
+        walkthrough = WalkthroughTest.from_text(
+            '# Test walkthrough\nlook\nnorth\n@expect-location "Kitchen"\ntake lamp\n'
+        )
+        assert len(walkthrough.commands) == 3
+        assert walkthrough.commands == ("look", "north", "take lamp")
+        assert len(walkthrough.assertions) == 1
 
     def test_parse_with_inline_comments(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("look  # look around\n")
-            f.write("north\n")
-            f.flush()
+        walkthrough = WalkthroughTest.from_text("look  # look around\nnorth\n")
+        assert walkthrough.commands == ("look", "north")
 
-            walkthrough = WalkthroughTest(Path(f.name))
-            assert walkthrough.commands == ["look", "north"]
+    def test_parse_from_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "walkthrough.txt"
+        path.write_text("# Start\nlook\n\nnorth\n", encoding="utf-8")
+
+        walkthrough = WalkthroughTest(path)
+        assert walkthrough.path == path
+        assert walkthrough.commands == ("look", "north")
+        assert [step.line_number for step in walkthrough.steps] == [1, 2, 4]
 
     def test_parse_file_not_found(self) -> None:
         with pytest.raises(FileNotFoundError):
             WalkthroughTest(Path("/nonexistent/walkthrough.txt"))
 
     def test_parse_invalid_assertion(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("@invalid-assertion\n")
-            f.flush()
+        with pytest.raises(ValueError, match="Invalid assertion"):
+            WalkthroughTest.from_text("@invalid-assertion\n")
+
+
+# Never opened; the stub backend ignores the game path
+_FAKE_GAME = Path("test.z5")
+
+
+class _StubBackend:
+    """Scripted game backend that records the commands it is sent."""
+
+    def __init__(self, start: GameResponse | Exception, *responses: GameResponse) -> None:
+        self._start = start
+        self._responses = responses
+        self.start_calls = 0
+        self.commands: list[str] = []
 
-            with pytest.raises(ValueError, match="Invalid assertion"):
-                WalkthroughTest(Path(f.name))
+    def start(self, game_path: str) -> GameResponse:  # noqa: ARG002
+        self.start_calls += 1
+        if isinstance(self._start, Exception):
+            raise self._start
+        return self._start
+
+    def send_command(self, command: str) -> GameResponse:
+        self.commands.append(command)
+        # The last scripted response repeats once the script runs out
+        return self._responses[min(len(self.commands), len(self._responses)) - 1]
+
+    def quit(self) -> None:
+        pass
 
 
 class TestTestRunner:
@@ -221,20 +239,21 @@ class TestTestRunner:
 
     def test_smoke_test_success(self) -> None:
         # Create mock backend
-        backend = MagicMock()
-        backend.start.return_value = GameResponse(
-            text="Welcome to the game!",
-            location="Start",
-            state=GameState.WAITING_INPUT,
-        )
-        backend.send_command.return_value = GameResponse(
-            text="You are in a room.",
-            location="Room",
-            state=GameState.WAITING_INPUT,
+        backend = _StubBackend(
+            GameResponse(
+                text="Welcome to the game!",
+                location="Start",
+                state=GameState.WAITING_INPUT,
+            ),
+            GameResponse(
+                text="You are in a room.",
+                location="Room",
+                state=GameState.WAITING_INPUT,
+            ),
         )
 
         config = TestConfig(
-            game_path=Path("test.z5"),
+            game_path=_FAKE_GAME,
             smoke_test=True,
         )
         runner = TestRunner(backend, config)
@@ -242,15 +261,14 @@ class TestTestRunner:
 
         assert result.passed
         assert result.exit_code == ExitCode.SUCCESS
-        backend.start.assert_called_once()
-        backend.send_command.assert_called_once_with("look")
+        assert backend.start_calls == 1
+        assert backend.commands == ["look"]
 
     def test_smoke_test_game_start_fails(self) -> None:
-        backend = MagicMock()
-        backend.start.side_effect = Exception("Game not found")
+        backend = _StubBackend(Exception("Game not found"))
 
         config = TestConfig(
-            game_path=Path("test.z5"),
+            game_path=_FAKE_GAME,
             smoke_test=True,
         )
         runner = TestRunner(backend, config)
@@ -259,122 +277,215 @@ class TestTestRunner:
         assert not result.passed
         assert result.exit_code == ExitCode.GAME_START_FAILED
 
-    def test_walkthrough_success(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("look\n")
-            f.write("north\n")
-            f.write('@expect-location "Kitchen"\n')
-            f.flush()
+    def test_smoke_test_response_error(self) -> None:
+        backend = _StubBackend(
+            GameResponse(text="Welcome!"),
+            GameResponse(text="", error="Input rejected"),
+        )
 
-            backend = MagicMock()
-            backend.start.return_value = GameResponse(
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            smoke_test=True,
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        assert not result.passed
+        assert result.exit_code == ExitCode.GAME_ERROR
+        assert result.error == "Smoke test command failed: Input rejected"
+        assert result.final_state is not None
+        assert result.final_state.last_output == "Welcome!"
+
+    def test_transcript_disabled(self) -> None:
+        backend = _StubBackend(
+            GameResponse(text="Welcome!"),
+            GameResponse(text="You are in a room."),
+        )
+
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            smoke_test=True,
+            transcript_enabled=False,
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        assert result.passed
+        assert result.final_state is not None
+        assert result.final_state.full_transcript == []
+        assert result.final_state.last_output == "You are in a room."
+
+    def test_walkthrough_success(self, tmp_path: Path) -> None:
+        # Loaded from walkthrough_path, unlike the in-memory walkthroughs below
+        walkthrough_path = tmp_path / "walkthrough.txt"
+        walkthrough_path.write_text('look\nnorth\n@expect-location "Kitchen"\n', encoding="utf-8")
+
+        backend = _StubBackend(
+            GameResponse(
                 text="Welcome!",
                 location="Start",
                 state=GameState.WAITING_INPUT,
-            )
-            backend.send_command.side_effect = [
-                GameResponse(text="You see a door.", state=GameState.WAITING_INPUT),
-                GameResponse(
-                    text="You enter the kitchen.",
-                    location="Kitchen",
-                    state=GameState.WAITING_INPUT,
-                ),
-            ]
-
-            config = TestConfig(
-                game_path=Path("test.z5"),
-                walkthrough_path=Path(f.name),
-            )
-            runner = TestRunner(backend, config)
-            result = runner.run()
-
-            assert result.passed
-            assert result.exit_code == ExitCode.SUCCESS
-            assert result.assertions_passed == 1
+            ),
+            GameResponse(text="You see a door.", state=GameState.WAITING_INPUT),
+            GameResponse(
+                text="You enter the kitchen.",
+                location="Kitchen",
+                state=GameState.WAITING_INPUT,
+            ),
+        )
+
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough_path=walkthrough_path,
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        assert result.passed
+        assert result.exit_code == ExitCode.SUCCESS
+        assert result.assertions_passed == 1
 
     def test_walkthrough_assertion_fails(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("look\n")
-            f.write('@expect-location "Kitchen"\n')
-            f.flush()
+        walkthrough = WalkthroughTest.from_text('look\n@expect-location "Kitchen"\n')
 
-            backend = MagicMock()
-            backend.start.return_value = GameResponse(
+        backend = _StubBackend(
+            GameResponse(
                 text="Welcome!",
                 location="Start",
                 state=GameState.WAITING_INPUT,
-            )
-            backend.send_command.return_value = GameResponse(
+            ),
+            GameResponse(
                 text="You are in the bedroom.",
                 location="Bedroom",
                 state=GameState.WAITING_INPUT,
-            )
+            ),
+        )
 
-            config = TestConfig(
-                game_path=Path("test.z5"),
-                walkthrough_path=Path(f.name),
-            )
-            runner = TestRunner(backend, config)
-            result = runner.run()
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough=walkthrough,
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
 
-            assert not result.passed
-            assert result.exit_code == ExitCode.ASSERTION_FAILED
-            assert result.assertions_failed == 1
+        assert not result.passed
+        assert result.exit_code == ExitCode.ASSERTION_FAILED
+        assert result.assertions_failed == 1
 
     def test_final_assertions(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("look\n")
-            f.flush()
+        walkthrough = WalkthroughTest.from_text("look\n")
 
-            backend = MagicMock()
-            backend.start.return_value = GameResponse(
+        backend = _StubBackend(
+            GameResponse(
                 text="Welcome!",
                 location="Start",
                 state=GameState.WAITING_INPUT,
-            )
-            backend.send_command.return_value = GameResponse(
+            ),
+            GameResponse(
                 text="You see gold in the Treasure Room!",
                 location="Treasure Room",
                 state=GameState.WAITING_INPUT,
-            )
-
-            config = TestConfig(
-                game_path=Path("test.z5"),
-                walkthrough_path=Path(f.name),
-                final_assertions=[
-                    LocationAssertion("Treasure"),
-                    ContainsTextAssertion("gold"),
-                ],
-            )
-            runner = TestRunner(backend, config)
-            result = runner.run()
-
-            # Walkthrough runs, then final assertions are checked
-            assert result.assertions_checked == 2
-            assert result.assertions_passed == 2
+            ),
+        )
+
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough=walkthrough,
+            final_assertions=[
+                LocationAssertion("Treasure"),
+                ContainsTextAssertion("gold"),
+            ],
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        # Walkthrough runs, then final assertions are checked
+        assert result.assertions_checked == 2
+        assert result.assertions_passed == 2
 
     def test_game_error_during_walkthrough(self) -> None:
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write("look\n")
-            f.write("crash\n")
-            f.flush()
+        walkthrough = WalkthroughTest.from_text("look\ncrash\n")
 
-            backend = MagicMock()
-            backend.start.return_value = GameResponse(
+        backend = _StubBackend(
+            GameResponse(
                 text="Welcome!",
                 state=GameState.WAITING_INPUT,
-            )
-            backend.send_command.side_effect = [
-                GameResponse(text="You look around.", state=GameState.WAITING_INPUT),
-                GameResponse(text="Error!", state=GameState.ERROR),
-            ]
-
-            config = TestConfig(
-                game_path=Path("test.z5"),
-                walkthrough_path=Path(f.name),
-            )
-            runner = TestRunner(backend, config)
-            result = runner.run()
-
-            assert not result.passed
-            assert result.exit_code == ExitCode.GAME_ERROR
+            ),
+            GameResponse(text="You look around.", state=GameState.WAITING_INPUT),
+            GameResponse(text="Error!", state=GameState.ERROR),
+        )
+
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough=walkthrough,
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        assert not result.passed
+        assert result.exit_code == ExitCode.GAME_ERROR
+
+    def test_inventory_parsed_only_after_inventory_command(self) -> None:
+        walkthrough = WalkthroughTest.from_text("north\ni\n")
+
+        backend = _StubBackend(
+            GameResponse(text="Welcome!"),
+            GameResponse(text="A sign reads:\nInventory clearance sale"),
+            GameResponse(text="You are carrying:\n  a brass lantern\n  a sword"),
+        )
+
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough=walkthrough,
+            final_assertions=[InventoryAssertion("lantern")],
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        assert result.passed
+        assert result.final_state is not None
+        assert result.final_state.inventory == ["brass lantern", "sword"]
+
+    def test_output_batching(self) -> None:
+        walkthrough = WalkthroughTest.from_text("look\nnorth\n")
+
+        backend = _StubBackend(
+            GameResponse(text="Welcome!"),
+            GameResponse(text="You see a door."),
+            GameResponse(text="You enter the kitchen."),
+        )
+
+        outputs: list[str] = []
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough=walkthrough,
+            output_batch_size=3,
+        )
+        runner = TestRunner(backend, config, on_output=outputs.append)
+        result = runner.run()
+
+        assert result.passed
+        assert outputs == [
+            "Welcome!\n> look\nYou see a door.",
+            "> north\nYou enter the kitchen.",
+        ]
+
+    def test_response_error_during_walkthrough(self) -> None:
+        walkthrough = WalkthroughTest.from_text("look\nnorth\n")
+
+        backend = _StubBackend(
+            GameResponse(text="Welcome!"),
+            GameResponse(text="", error="Input rejected"),
+        )
+
+        config = TestConfig(
+            game_path=_FAKE_GAME,
+            walkthrough=walkthrough,
+        )
+        runner = TestRunner(backend, config)
+        result = runner.run()
+
+        assert not result.passed
+        assert result.exit_code == ExitCode.WALKTHROUGH_ERROR
+        assert result.error == "Error at line 1: Input rejected"
+        assert backend.commands == ["look"]